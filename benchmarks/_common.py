@@ -0,0 +1,274 @@
+"""
+    Shared helpers for the benchmark scripts.
+
+    Everything runs offline: Discord API is replaced by a local HTTP server and
+    interactions are signed with a throwaway key.
+"""
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import threading
+import time
+from typing import Any, Dict, Tuple
+
+import nacl.signing  # type: ignore
+
+from discord_app import application
+
+
+class StubAPIServer():
+    """
+        Local stand-in for Discord API. Every request is answered with {} after delay seconds.
+    """
+
+    def __init__(self, delay: float = 0.0) -> None:
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args: Any) -> None:
+                pass
+
+            def _handle(self) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                if length:
+                    self.rfile.read(length)
+                if delay:
+                    time.sleep(delay)
+                body = b"[]" if self.path.endswith("/commands") else b"{}"
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            do_GET = do_POST = do_PATCH = do_PUT = do_DELETE = _handle
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def make_app(api_base: str, **kwargs: Any) -> Tuple[application.Application, Any]:
+    """
+        Create an Application talking to api_base.
+
+        :return: (application, signing key for interactions)
+    """
+    signing_key = nacl.signing.SigningKey.generate()
+    app = application.Application(
+        id="1234567890",
+        name="benchmark",
+        description="",
+        bot_public=False,
+        bot_require_code_grant=False,
+        verify_key=signing_key.verify_key.encode().hex(),
+        _bot_token="bot_token",
+        _endpoint="/interactions",
+        _api_base=api_base,
+        # Benchmarks replay the same payloads
+        _replay_cache_size=0,
+        **kwargs
+    )
+    return app, signing_key
+
+
+def signed_request(signing_key: Any, payload: Dict[str, Any]) -> Tuple[Dict[str, str], bytes]:
+    """
+        :return: (headers, body) of a signed interaction request.
+    """
+    body = json.dumps(payload).encode("utf-8")
+    timestamp = str(int(time.time()))
+    return {
+        "Content-Type": "application/json",
+        "X-Signature-Timestamp": timestamp,
+        "X-Signature-Ed25519": signing_key.sign(timestamp.encode("utf-8") + body).signature.hex()
+    }, body
+
+
+def user_payload(user_id: int) -> Dict[str, Any]:
+    return {
+        "id": str(user_id),
+        "username": f"user{user_id}",
+        "discriminator": "0001",
+        "avatar": "a_0123456789abcdef0123456789abcdef",
+        "public_flags": 64
+    }
+
+
+def message_payload(message_id: int, embeds: int = 5, referenced: bool = True) -> Dict[str, Any]:
+    """
+        A message with author, mentions, embeds, attachments, reactions, stickers and
+        (if referenced is True) the message it replies to.
+    """
+    message: Dict[str, Any] = {
+        "id": str(message_id),
+        "channel_id": "200000000000000000",
+        "guild_id": "300000000000000000",
+        "timestamp": "2022-04-01T00:00:00.000000+00:00",
+        "edited_timestamp": None,
+        "tts": False,
+        "mention_everyone": False,
+        "mentions": [user_payload(100000000000000000 + i) for i in range(3)],
+        "mention_roles": [],
+        "attachments": [
+            {
+                "id": str(400000000000000000 + i),
+                "filename": f"image{i}.png",
+                "size": 123456,
+                "url": f"https://cdn.discordapp.com/attachments/1/2/image{i}.png",
+                "proxy_url": f"https://media.discordapp.net/attachments/1/2/image{i}.png",
+                "content_type": "image/png",
+                "height": 512,
+                "width": 512
+            }
+            for i in range(2)
+        ],
+        "embeds": [
+            {
+                "title": f"Embed {i}",
+                "type": "rich",
+                "description": "Lorem ipsum dolor sit amet " * 10,
+                "color": 0x5865F2,
+                "footer": {"text": "footer"},
+                "author": {"name": "author"},
+                "fields": [{"name": f"Field {j}", "value": f"Value {j}", "inline": True} for j in range(5)]
+            }
+            for i in range(embeds)
+        ],
+        "reactions": [
+            {"count": 3, "me": False, "emoji": {"id": None, "name": "👍"}}
+        ],
+        "sticker_items": [{"id": "500000000000000000", "name": "sticker", "format_type": 1}],
+        "content": "Hello world " * 20,
+        "type": 19 if referenced else 0,
+        "author": user_payload(100000000000000099),
+        "pinned": False,
+        "flags": 0
+    }
+    if referenced:
+        message["message_reference"] = {"message_id": str(message_id - 1), "channel_id": "200000000000000000"}
+        message["referenced_message"] = message_payload(message_id - 1, embeds, referenced=False)
+    return message
+
+
+def message_command_payload(interaction_id: int = 1) -> Dict[str, Any]:
+    """
+        A message context menu command on a large message, as sent by Discord.
+    """
+    target = message_payload(600000000000000000)
+    return {
+        "id": str(interaction_id),
+        "application_id": "1234567890",
+        "type": 2,
+        "token": "token",
+        "version": 1,
+        "guild_id": "300000000000000000",
+        "channel_id": "200000000000000000",
+        "locale": "en-US",
+        "guild_locale": "en-US",
+        "member": {
+            "user": user_payload(100000000000000001),
+            "roles": ["700000000000000000"],
+            "joined_at": "2022-01-01T00:00:00.000000+00:00",
+            "permissions": "2199023255551",
+            "deaf": False,
+            "mute": False
+        },
+        "data": {
+            "id": "800000000000000000",
+            "name": "Quote",
+            "type": 3,
+            "target_id": target["id"],
+            "resolved": {"messages": {target["id"]: target}}
+        }
+    }
+
+
+def guild_payload(roles: int = 50, channels: int = 100, members: int = 200, emojis: int = 50) -> Dict[str, Any]:
+    """
+        A large guild, as returned by GET /guilds/{guild.id} with members included.
+    """
+    return {
+        "id": "300000000000000000",
+        "name": "Benchmark",
+        "icon": "0123456789abcdef0123456789abcdef",
+        "splash": None,
+        "discovery_splash": None,
+        "owner_id": "100000000000000000",
+        "afk_channel_id": None,
+        "afk_timeout": 300,
+        "verification_level": 2,
+        "default_message_notifications": 1,
+        "explicit_content_filter": 2,
+        "roles": [
+            {
+                "id": str(700000000000000000 + i),
+                "name": f"role{i}",
+                "color": 0,
+                "hoist": False,
+                "position": i,
+                "permissions": "2199023255551",
+                "managed": False,
+                "mentionable": True
+            }
+            for i in range(roles)
+        ],
+        "emojis": [
+            {
+                "id": str(900000000000000000 + i),
+                "name": f"emoji{i}",
+                "roles": [],
+                "require_colons": True,
+                "managed": False,
+                "animated": False,
+                "available": True
+            }
+            for i in range(emojis)
+        ],
+        "features": ["COMMUNITY", "NEWS", "ANIMATED_ICON", "INVITE_SPLASH"],
+        "mfa_level": 1,
+        "application_id": None,
+        "system_channel_id": "200000000000000000",
+        "system_channel_flags": 0,
+        "rules_channel_id": "200000000000000001",
+        "vanity_url_code": None,
+        "description": None,
+        "banner": None,
+        "premium_tier": 2,
+        "premium_subscription_count": 14,
+        "preferred_locale": "en-US",
+        "public_updates_channel_id": "200000000000000002",
+        "nsfw_level": 0,
+        "premium_progress_bar_enabled": False,
+        "channels": [
+            {
+                "id": str(200000000000000000 + i),
+                "type": 0,
+                "guild_id": "300000000000000000",
+                "position": i,
+                "name": f"channel{i}",
+                "topic": None,
+                "nsfw": False,
+                "rate_limit_per_user": 0,
+                "permission_overwrites": [
+                    {"id": "300000000000000000", "type": 0, "allow": "0", "deny": "1024"}
+                ]
+            }
+            for i in range(channels)
+        ],
+        "members": [
+            {
+                "user": user_payload(100000000000000000 + i),
+                "roles": ["700000000000000000"],
+                "joined_at": "2022-01-01T00:00:00.000000+00:00",
+                "deaf": False,
+                "mute": False
+            }
+            for i in range(members)
+        ],
+        "stickers": []
+    }
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+    Concurrent interaction throughput of the Flask (WSGI) and ASGI entry points.
+
+    Each interaction runs a command handler which makes one outbound API call to a
+    local stub server answering after --api-delay seconds. The Flask path is served
+    by --workers WSGI worker threads; the ASGI path by a single event loop with an
+    async handler awaiting call_api_async.
+
+    Usage: python benchmarks/bench_asgi.py [--interactions N] [--workers N] [--api-delay S]
+"""
+import argparse
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import time
+from typing import Any, Dict, List
+
+import discord_app
+
+from _common import StubAPIServer, make_app, signed_request
+
+
+def payload(name: str) -> Dict[str, Any]:
+    return {
+        "id": "1",
+        "application_id": "1234567890",
+        "type": 2,
+        "token": "token",
+        "data": {"id": "1", "name": name, "type": 1}
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--interactions", type=int, default=400)
+    parser.add_argument("--workers", type=int, default=8, help="WSGI worker threads")
+    parser.add_argument("--api-delay", type=float, default=0.02, help="Latency of the stub API server in seconds")
+    args = parser.parse_args()
+
+    server = StubAPIServer(delay=args.api_delay)
+    # Measure the servers, not the rate limiter
+    app, signing_key = make_app(server.url, _global_rate_limit=0)
+
+    @app.application_command(discord_app.ApplicationCommand(name="sync_cmd", description="sync"))
+    def sync_cmd(request: discord_app.InteractionRequest) -> discord_app.InteractionResponse:
+        app.call_api("GET", "/channels/1")
+        return discord_app.InteractionResponse(
+            type=discord_app.InteractionResponseType.CHANNEL_MESSAGE_WITH_SOURCE,
+            data=discord_app.InteractionResponseMessage(content="done")
+        )
+
+    @app.application_command(discord_app.ApplicationCommand(name="async_cmd", description="async"))
+    async def async_cmd(request: discord_app.InteractionRequest) -> discord_app.InteractionResponse:
+        await app.call_api_async("GET", "/channels/1")
+        return discord_app.InteractionResponse(
+            type=discord_app.InteractionResponseType.CHANNEL_MESSAGE_WITH_SOURCE,
+            data=discord_app.InteractionResponseMessage(content="done")
+        )
+
+    # Flask: a fixed pool of WSGI worker threads
+    headers, body = signed_request(signing_key, payload("sync_cmd"))
+
+    def flask_request(_: int) -> int:
+        return app._flask.test_client().post("/interactions", data=body, headers=headers).status_code  # type: ignore[no-any-return]
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.workers) as executor:
+        statuses = list(executor.map(flask_request, range(args.interactions)))
+    flask_elapsed = time.perf_counter() - start
+    assert statuses == [200] * args.interactions
+
+    # ASGI: every interaction is a task on one event loop
+    headers, body = signed_request(signing_key, payload("async_cmd"))
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "path": "/interactions",
+        "headers": [(k.lower().encode("latin-1"), v.encode("latin-1")) for (k, v) in headers.items()]
+    }
+
+    async def asgi_request() -> int:
+        sent: List[Dict[str, Any]] = []
+
+        async def receive() -> Dict[str, Any]:
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        async def send(message: Dict[str, Any]) -> None:
+            sent.append(message)
+
+        await app.asgi_app(scope, receive, send)
+        return sent[0]["status"]  # type: ignore[no-any-return]
+
+    async def asgi_run() -> List[int]:
+        return await asyncio.gather(*(asgi_request() for _ in range(args.interactions)))
+
+    start = time.perf_counter()
+    statuses = asyncio.run(asgi_run())
+    asgi_elapsed = time.perf_counter() - start
+    assert statuses == [200] * args.interactions
+
+    print(f"{args.interactions} interactions, API latency {args.api_delay * 1000:.0f} ms, {args.workers} WSGI workers")
+    print(f"{'path':>6} {'seconds':>8} {'interactions/s':>15}")
+    print(f"{'flask':>6} {flask_elapsed:>8.2f} {args.interactions / flask_elapsed:>15.1f}")
+    print(f"{'asgi':>6} {asgi_elapsed:>8.2f} {args.interactions / asgi_elapsed:>15.1f}")
+    app.close()
+    server.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+    Autocomplete over a large candidate set: a linear scan of the candidates versus
+    AutocompleteIndex, without cache (every query is new) and with a warm cache.
+
+    Usage: python benchmarks/bench_autocomplete.py [CANDIDATES]
+"""
+import random
+import string
+import sys
+import timeit
+from typing import Callable, List
+
+from discord_app import autocomplete
+
+
+def linear_scan(candidates: List[str]) -> Callable[[str], List[str]]:
+    def search(query: str) -> List[str]:
+        query = query.casefold()
+        starting = [name for name in candidates if name.casefold().startswith(query)]
+        containing = [name for name in candidates if query in name.casefold() and not name.casefold().startswith(query)]
+        return (sorted(starting) + sorted(containing))[:autocomplete.MAX_CHOICES]
+    return search
+
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    rng = random.Random(0)
+    candidates = list({
+        "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(4, 14))).capitalize()
+        for _ in range(size)
+    })
+    # What users type: growing prefixes of candidates, and pieces of their middle.
+    queries = [name[:length] for name in rng.sample(candidates, 200) for length in (1, 2, 3, 4)]
+    queries += [name[2:5] for name in rng.sample(candidates, 200)]
+
+    print(f"{len(candidates)} candidates, {len(queries)} queries")
+    print(f"{'':>22} {'per query (us)':>15}")
+    scan = linear_scan(candidates)
+    started = timeit.default_timer()
+    for query in queries[::20]:
+        scan(query)
+    print(f"{'linear scan':>22} {(timeit.default_timer() - started) / len(queries[::20]) * 1e6:>15.1f}")
+
+    for fuzzy in (False, True):
+        index = autocomplete.AutocompleteIndex(candidates, fuzzy=fuzzy, cache_size=0)
+        elapsed = min(timeit.repeat(lambda: [index.search(query) for query in queries], number=1, repeat=5))
+        print(f"{'index' + (', fuzzy' if fuzzy else ''):>22} {elapsed / len(queries) * 1e6:>15.1f}")
+        index = autocomplete.AutocompleteIndex(candidates, fuzzy=fuzzy)
+        elapsed = min(timeit.repeat(lambda: [index.search(query) for query in queries], number=1, repeat=5))
+        print(f"{'cached' + (', fuzzy' if fuzzy else ''):>22} {elapsed / len(queries) * 1e6:>15.1f}")
+
+
+if __name__ == "__main__":
+    main()
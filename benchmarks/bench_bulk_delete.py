@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+    Deleting many recent messages of a channel: one DELETE per message, as Message.delete sends,
+    against Channel.bulk_delete. Requests sent and time taken, against a local API stub.
+
+    Usage: python benchmarks/bench_bulk_delete.py [--messages N] [--api-delay S]
+"""
+import argparse
+import datetime
+import time
+
+from discord_app import channel, discord_types
+
+from _common import StubAPIServer, make_app
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--messages", type=int, default=500)
+    parser.add_argument("--api-delay", type=float, default=0.01)
+    args = parser.parse_args()
+
+    server = StubAPIServer(delay=args.api_delay)
+    first = discord_types.Snowflake.from_datetime(datetime.datetime.now(datetime.timezone.utc))
+    ids = [discord_types.Snowflake(first + i) for i in range(args.messages)]
+    print(f"{'method':>12} {'requests':>9} {'time (s)':>9}")
+    try:
+        for method in ("one by one", "bulk"):
+            (app, _) = make_app(server.url, _global_rate_limit=0)
+            text_channel = channel.Channel(id=discord_types.Snowflake(20), type=discord_types.ChannelType.GUILD_TEXT, _app=app)
+            start = time.perf_counter()
+            if method == "bulk":
+                text_channel.bulk_delete(ids)
+            else:
+                for message_id in ids:
+                    app.call_api("DELETE", f"/channels/{text_channel.id}/messages/{message_id}")
+            elapsed = time.perf_counter() - start
+            print(f"{method:>12} {app.connection_stats['requests']:>9} {elapsed:>9.2f}")
+            app.close()
+    finally:
+        server.close()
+
+
+if __name__ == "__main__":
+    main()
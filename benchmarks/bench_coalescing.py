@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+    Many threads getting the same channel at once, as when interactions in one guild all call
+    get_channel(): API requests sent and time taken with and without request coalescing.
+    The entity cache is disabled so that every call reaches call_api.
+
+    Usage: python benchmarks/bench_coalescing.py [--threads N] [--rounds N] [--api-delay S]
+"""
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+import time
+
+from _common import StubAPIServer, make_app
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--threads", type=int, default=32)
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--api-delay", type=float, default=0.05)
+    args = parser.parse_args()
+
+    server = StubAPIServer(delay=args.api_delay)
+    print(f"{'coalescing':>10} {'requests':>9} {'coalesced':>10} {'time (s)':>9}")
+    try:
+        for coalesce in (False, True):
+            (app, _) = make_app(server.url, _entity_cache_size=0, _coalesce_requests=coalesce, _global_rate_limit=0)
+            with ThreadPoolExecutor(args.threads) as pool:
+                start = time.perf_counter()
+                for _ in range(args.rounds):
+                    list(pool.map(lambda _: app.call_api("GET", "/channels/200000000000000000"), range(args.threads)))
+                elapsed = time.perf_counter() - start
+            stats = app.connection_stats
+            print(f"{str(coalesce):>10} {stats['requests']:>9} {app.coalescing_stats['coalesced']:>10} {elapsed:>9.2f}")
+            app.close()
+    finally:
+        server.close()
+
+
+if __name__ == "__main__":
+    main()
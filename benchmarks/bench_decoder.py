@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+    Decoding cost of large Guild and Message payloads: calling the class with the payload
+    as keyword arguments in the baseline release, whose __post_init__ methods convert nested
+    objects by hand, versus the generated decoder of the current tree.
+
+    The baseline package is extracted from git (--baseline, 8554e10 by default) and measured
+    in a subprocess, since both versions can't be imported in one interpreter.
+
+    Usage: python benchmarks/bench_decoder.py [--baseline REV] [N ...]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tarfile
+import tempfile
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+from _common import guild_payload, message_payload
+
+
+BENCHMARKS = os.path.dirname(os.path.abspath(__file__))
+
+
+def fixtures() -> List[Tuple[str, str, Dict[str, Any]]]:
+    """
+        (name, module, payload) of the decoded classes.
+    """
+    return [
+        ("Guild", "guild", guild_payload()),
+        ("Message", "channel", message_payload(600000000000000000)),
+    ]
+
+
+def per_call_us(function: Callable[[], Any], n: int) -> float:
+    """
+        Best of 5 rounds of n calls, in microseconds per call.
+    """
+    best = float("inf")
+    for _ in range(5):
+        start = time.perf_counter()
+        for _ in range(n):
+            function()
+        best = min(best, time.perf_counter() - start)
+    return best / n * 1e6
+
+
+def measure_constructor(counts: List[int]) -> Dict[str, Dict[str, float]]:
+    import importlib
+    results: Dict[str, Dict[str, float]] = {}
+    for (name, module, payload) in fixtures():
+        cls = getattr(importlib.import_module(f"discord_app.{module}"), name)
+        results[name] = {str(n): per_call_us(lambda: cls(**payload), n) for n in counts}
+    return results
+
+
+def measure_baseline(revision: str, counts: List[int]) -> Dict[str, Dict[str, float]]:
+    root = subprocess.run(
+        ["git", "rev-parse", "--show-toplevel"], cwd=BENCHMARKS, check=True, capture_output=True, text=True
+    ).stdout.strip()
+    with tempfile.TemporaryDirectory() as directory:
+        archive = subprocess.run(
+            ["git", "archive", "--format=tar", revision, "src/discord_app"], cwd=root, check=True, capture_output=True
+        ).stdout
+        archive_path = os.path.join(directory, "baseline.tar")
+        with open(archive_path, "wb") as f:
+            f.write(archive)
+        with tarfile.open(archive_path) as tar:
+            # Python 3.12+ warns unless a filter is given, older releases have none.
+            tar.extractall(directory, **({"filter": "data"} if hasattr(tarfile, "data_filter") else {}))  # type: ignore[arg-type]
+        env = {**os.environ, "PYTHONPATH": os.pathsep.join((os.path.join(directory, "src"), BENCHMARKS))}
+        output = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--constructor-only", *map(str, counts)],
+            env=env, check=True, capture_output=True, text=True
+        ).stdout
+    return json.loads(output)  # type: ignore[no-any-return]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--baseline", default="8554e10", help="git revision measured with Cls(**payload)")
+    parser.add_argument("--constructor-only", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("counts", type=int, nargs="*", default=[300])
+    args = parser.parse_args()
+    if args.constructor_only:
+        print(json.dumps(measure_constructor(args.counts)))
+        return
+
+    from discord_app import channel, decoder, guild
+    classes = {"Guild": guild.Guild, "Message": channel.Message}
+    baseline = measure_baseline(args.baseline, args.counts)
+    print(f"{'class':>8} {'payloads':>9} {'baseline Cls(**payload) (us)':>29} {'decode (us)':>12} {'speedup':>8}")
+    for (name, _, payload) in fixtures():
+        cls = classes[name]
+        for n in args.counts:
+            before = baseline[name][str(n)]
+            after = per_call_us(lambda: decoder.decode(cls, payload), n)
+            print(f"{name:>8} {n:>9} {before:>29.1f} {after:>12.1f} {before / after:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+    Conversion of raw values into the enums and flags of discord_types: calling the enum
+    class versus decoder.EnumTable, for a member value, a combination of two flags, and a
+    value unknown to the library.
+
+    Usage: python benchmarks/bench_enum.py [N]
+"""
+import enum
+import sys
+import timeit
+from typing import Any, Callable, Iterator, Tuple
+
+from discord_app import decoder, discord_types
+
+
+def call(enum_cls: Any) -> Callable[[Any], Any]:
+    # Conversion as done before EnumTable: unknown values are kept as they are.
+    def convert(value: Any) -> Any:
+        try:
+            return enum_cls(value)
+        except ValueError:
+            return value
+    return convert
+
+
+def cases(enum_cls: Any) -> Iterator[Tuple[str, Any]]:
+    members = list(enum_cls)
+    yield "member", members[-1].value
+    if issubclass(enum_cls, enum.Flag) and len(members) > 1:
+        yield "combined", members[0].value | members[-1].value
+    elif issubclass(enum_cls, str):
+        yield "unknown", "ADDED_LATER"
+    else:
+        yield "unknown", 1 << 20
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    # Some enums have several names in discord_types.
+    enum_classes = list(dict.fromkeys(
+        value for value in vars(discord_types).values()
+        if isinstance(value, type) and issubclass(value, enum.Enum) and value.__module__ == discord_types.__name__
+    ))
+    print(f"{'enum':>32} {'value':>9} {'call (ns)':>10} {'table (ns)':>11} {'speedup':>8}")
+    totals = [0.0, 0.0]
+    for enum_cls in enum_classes:
+        table = decoder.EnumTable(enum_cls)
+        for (label, value) in cases(enum_cls):
+            results = [
+                min(timeit.repeat(lambda: fn(value), number=n, repeat=5)) / n * 1e9  # type: ignore[misc]
+                for fn in (call(enum_cls), table)
+            ]
+            totals[0] += results[0]
+            totals[1] += results[1]
+            print(f"{enum_cls.__name__:>32} {label:>9} {results[0]:>10.0f} {results[1]:>11.0f} {results[0] / results[1]:>7.1f}x")
+    print(f"{'total':>32} {'':>9} {totals[0]:>10.0f} {totals[1]:>11.0f} {totals[0] / totals[1]:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+    Interaction parsing cost of a message context menu command whose handler only reads
+    data.name and data.target_id: eager decoding (old behaviour) versus lazy decoding.
+
+    Usage: python benchmarks/bench_lazy.py [N ...]
+"""
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable
+
+from discord_app import interaction, json_codec
+
+from _common import message_command_payload
+
+
+def main() -> None:
+    counts = [int(n) for n in sys.argv[1:]] or [1_000, 10_000]
+    body = json_codec.dumps(message_command_payload()).encode("utf-8")
+
+    def handle(lazy: bool) -> Callable[[], Any]:
+        def fn() -> Any:
+            request = interaction.InteractionRequest(_lazy=lazy, **json_codec.loads(body))
+            assert request.data is not None
+            (request.data.name, request.data.target_id)
+            return request
+        return fn
+
+    print(f"payload: {len(body)} bytes")
+    print(f"{'requests':>10} {'eager (us/req)':>15} {'lazy (us/req)':>15} {'speedup':>8}")
+    for n in counts:
+        results = []
+        for fn in (handle(False), handle(True)):
+            start = time.perf_counter()
+            for _ in range(n):
+                fn()
+            results.append((time.perf_counter() - start) / n * 1e6)
+        print(f"{n:>10} {results[0]:>15.2f} {results[1]:>15.2f} {results[0] / results[1]:>7.2f}x")
+
+    print(f"{'':>10} {'eager (KiB)':>15} {'lazy (KiB)':>15}")
+    # Memory held by the request object while the handler runs, and peak while parsing.
+    sizes = []
+    for fn in (handle(False), handle(True)):
+        tracemalloc.start()
+        request = fn()
+        sizes.append(tracemalloc.get_traced_memory())
+        tracemalloc.stop()
+        del request
+    print(f"{'held':>10} {sizes[0][0] / 1024:>15.1f} {sizes[1][0] / 1024:>15.1f}")
+    print(f"{'peak':>10} {sizes[0][1] / 1024:>15.1f} {sizes[1][1] / 1024:>15.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+    Response encoding cost: dataclasses.asdict + json.dumps (old behaviour) versus
+    the compiled per-class serializer, on embeds-heavy interaction responses.
+
+    Usage: python benchmarks/bench_serializer.py [N ...]
+"""
+import dataclasses
+import json
+import sys
+import time
+
+import discord_app
+from discord_app import application, channel, discord_types, serializer
+
+
+def embeds_response(embeds: int) -> discord_app.InteractionResponse:
+    """
+        A message with embeds as large as Discord allows, and a row of buttons.
+    """
+    return discord_app.InteractionResponse(
+        type=discord_types.InteractionResponseType.CHANNEL_MESSAGE_WITH_SOURCE,
+        data=discord_app.InteractionResponseMessage(
+            content="Search results",
+            embeds=[
+                channel.Embed(
+                    title=f"Result {i}",
+                    type=discord_types.EmbedType.RICH,
+                    description="Lorem ipsum dolor sit amet " * 10,
+                    url=f"https://example.com/{i}",
+                    color=0x5865F2,
+                    footer=channel.EmbedFooter(text="footer", icon_url="https://example.com/icon.png"),
+                    thumbnail=channel.EmbedThumbnail(url="https://example.com/thumbnail.png"),
+                    author=channel.EmbedAuthor(name="author", url="https://example.com/author"),
+                    fields=[
+                        channel.EmbedField(name=f"Field {j}", value=f"Value {j}", inline=j % 2 == 0)
+                        for j in range(10)
+                    ]
+                )
+                for i in range(embeds)
+            ],
+            components=[channel.MessageComponentActionRow(
+                type=discord_types.MessageComponentType.ACTION_ROW,
+                components=[
+                    channel.MessageComponentButton(
+                        type=discord_types.MessageComponentType.BUTTON,
+                        style=discord_types.MessageComponentButtonStyle.PRIMARY,
+                        label=f"Page {i}",
+                        custom_id=f"page_{i}"
+                    )
+                    for i in range(5)
+                ]
+            )]
+        )
+    )
+
+
+def main() -> None:
+    counts = [int(n) for n in sys.argv[1:]] or [1_000, 10_000]
+
+    print(f"{'embeds':>6} {'responses':>10} {'asdict (us/resp)':>18} {'compiled (us/resp)':>20} {'speedup':>8}")
+    for embeds in (1, 10):
+        response = embeds_response(embeds)
+
+        def with_asdict() -> None:
+            json.dumps(dataclasses.asdict(response, dict_factory=application._asdict_ignore_none))
+
+        def compiled() -> None:
+            serializer.dumps(response)
+
+        assert json.loads(serializer.dumps(response)) == json.loads(json.dumps(
+            dataclasses.asdict(response, dict_factory=application._asdict_ignore_none)
+        ))
+        for n in counts:
+            results = []
+            for fn in (with_asdict, compiled):
+                start = time.perf_counter()
+                for _ in range(n):
+                    fn()
+                results.append((time.perf_counter() - start) / n * 1e6)
+            print(f"{embeds:>6} {n:>10} {results[0]:>18.2f} {results[1]:>20.2f} {results[0] / results[1]:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+    Per-request signature verification cost: building a VerifyKey for every
+    request (old behaviour) versus reusing a cached SignatureVerifier.
+
+    Usage: python benchmarks/bench_signature.py [N ...]
+"""
+import sys
+import time
+
+import nacl.signing     # type: ignore
+import nacl.encoding    # type: ignore
+
+from discord_app import signature
+
+
+def main() -> None:
+    counts = [int(n) for n in sys.argv[1:]] or [1_000, 10_000, 100_000]
+    signing_key = nacl.signing.SigningKey.generate()
+    public_key = signing_key.verify_key.encode(nacl.encoding.HexEncoder).decode("ascii")
+    timestamp = "1650000000"
+    body = b'{"id":"1","application_id":"1","type":2,"token":"token","data":{"id":"1","name":"test","type":1}}'
+    sig = signing_key.sign(timestamp.encode("utf-8") + body).signature.hex()
+
+    def rebuild_every_time() -> None:
+        verifier = nacl.signing.VerifyKey(public_key.encode("ascii"), nacl.encoding.HexEncoder)
+        verifier.verify(timestamp.encode("utf-8") + body, nacl.encoding.HexEncoder.decode(sig.encode("ascii")))
+
+    cached = signature.SignatureVerifier(public_key)
+
+    def reuse_verifier() -> None:
+        cached.verify(timestamp, body, sig)
+
+    print(f"{'requests':>10} {'rebuild (us/req)':>18} {'cached (us/req)':>18} {'speedup':>8}")
+    for n in counts:
+        results = []
+        for fn in (rebuild_every_time, reuse_verifier):
+            start = time.perf_counter()
+            for _ in range(n):
+                fn()
+            results.append((time.perf_counter() - start) / n * 1e6)
+        print(f"{n:>10} {results[0]:>18.2f} {results[1]:>18.2f} {results[0] / results[1]:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
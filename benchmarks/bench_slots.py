@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+    Memory held by decoded guild members (each with its user object), and decoding time.
+
+    Members are decoded from JSON, and the payloads are dropped before memory is measured,
+    so strings shared between the payloads and the objects are counted once.
+
+    Usage: python benchmarks/bench_slots.py [N ...]
+"""
+import gc
+import sys
+import time
+import tracemalloc
+
+from discord_app import decoder, guild, json_codec
+
+from _common import guild_payload
+
+
+def main() -> None:
+    counts = [int(n) for n in sys.argv[1:]] or [100_000]
+    print(f"{'members':>10} {'held (MiB)':>11} {'bytes/member':>13} {'decode (us)':>12}")
+    for n in counts:
+        body = json_codec.dumps(guild_payload(roles=0, channels=0, members=n, emojis=0)["members"])
+        payloads = json_codec.loads(body)
+        start = time.perf_counter()
+        members = decoder.decode_list(guild.GuildMember, payloads)
+        elapsed = time.perf_counter() - start
+        del members, payloads
+        gc.collect()
+        tracemalloc.start()
+        payloads = json_codec.loads(body)
+        members = decoder.decode_list(guild.GuildMember, payloads)
+        del payloads
+        gc.collect()
+        held = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        print(f"{n:>10} {held / 1024 / 1024:>11.1f} {held / n:>13.0f} {elapsed / n * 1e6:>12.2f}")
+        del members
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+    IDs kept as strings (as sent by the API) versus Snowflake integers: memory held by
+    1M IDs, dict lookups with equal (not identical) keys, and sorting by creation time.
+
+    Usage: python benchmarks/bench_snowflake.py [N]
+"""
+import gc
+import random
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable
+
+from discord_app.discord_types import Snowflake
+
+
+def held_memory(build: Callable[[], Any]) -> int:
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    held = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return held
+
+
+def best_time(fn: Callable[[Any], Any], make_input: Callable[[], Any], repeat: int = 5) -> float:
+    times = []
+    for _ in range(repeat):
+        value = make_input()
+        start = time.perf_counter()
+        fn(value)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    random.seed(0)
+    # IDs created over 2022, 4096 per millisecond at most
+    raw = [str(((1640995200000 - 1420070400000 + random.randrange(31_536_000_000)) << 22) | random.randrange(4096))
+           for _ in range(n)]
+
+    str_bytes = held_memory(lambda: [(s + " ")[:-1] for s in raw])
+    int_bytes = held_memory(lambda: [Snowflake(s) for s in raw])
+    print(f"{'':>22} {'str':>10} {'Snowflake':>10}")
+    print(f"{'held (B/id)':>22} {str_bytes / n:>10.1f} {int_bytes / n:>10.1f}")
+
+    str_map = {s: None for s in raw}
+    int_map = {Snowflake(s): None for s in raw}
+    # Keys equal to, but not the same objects as, the dict keys, as decoded from another payload.
+    sample = raw[:100_000]
+    results = [
+        best_time(lambda keys: [str_map[k] for k in keys], lambda: [(s + " ")[:-1] for s in sample]),
+        best_time(lambda keys: [int_map[k] for k in keys], lambda: [Snowflake(s) for s in sample]),
+        best_time(lambda keys: [int_map[k] for k in keys], lambda: [int(s) for s in sample])
+    ]
+    print(f"{'dict lookup (ns)':>22} {results[0] / len(sample) * 1e9:>10.1f} {results[1] / len(sample) * 1e9:>10.1f}")
+    print(f"{'  ... with int keys':>22} {'':>10} {results[2] / len(sample) * 1e9:>10.1f}")
+
+    snowflakes = [Snowflake(s) for s in sample]
+    results = [
+        best_time(lambda ids: sorted(ids, key=lambda s: Snowflake(s).timestamp), lambda: sample),
+        best_time(sorted, lambda: snowflakes)
+    ]
+    print(f"{'sort by time (ms/100k)':>22} {results[0] * 1e3:>10.1f} {results[1] * 1e3:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
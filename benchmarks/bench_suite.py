@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+    Benchmark suite for the interaction hot path.
+
+    Signed interactions (ping, slash command with a subcommand and options, message context
+    menu on a large message, component click) are posted through Flask's test client, and
+    decoding of Guild and Message payloads and encoding of an InteractionResponse are measured
+    on their own. Everything runs offline with fixed payloads.
+
+    For each scenario, throughput, median and 99th percentile latency, and the peak memory
+    allocated while handling one operation (with tracemalloc, in a separate pass) are reported.
+
+    Usage: python benchmarks/bench_suite.py [--operations N] [--filter TEXT] [--json PATH]
+"""
+import argparse
+import json
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Tuple
+
+import discord_app
+from discord_app import application, channel, decoder, guild
+
+from _common import guild_payload, make_app, message_command_payload, message_payload, signed_request, user_payload
+
+
+Scenario = Tuple[str, Callable[[], Any]]
+
+
+def response(content: str) -> discord_app.InteractionResponse:
+    return discord_app.InteractionResponse(
+        type=discord_app.InteractionResponseType.CHANNEL_MESSAGE_WITH_SOURCE,
+        data=discord_app.InteractionResponseMessage(content=content)
+    )
+
+
+def register_handlers(app: application.Application) -> None:
+    option_type = discord_app.ApplicationCommandOptionType
+
+    @app.application_command(discord_app.ApplicationCommand(name="config", description="config", options=[
+        discord_app.ApplicationCommandOption(name="role", description="role", type=option_type.SUB_COMMAND_GROUP, options=[
+            discord_app.ApplicationCommandOption(name="add", description="add", type=option_type.SUB_COMMAND, options=[
+                discord_app.ApplicationCommandOption(name="user", description="user", type=option_type.USER),
+                discord_app.ApplicationCommandOption(name="role", description="role", type=option_type.ROLE),
+                discord_app.ApplicationCommandOption(name="days", description="days", type=option_type.INTEGER),
+                discord_app.ApplicationCommandOption(name="reason", description="reason", type=option_type.STRING)
+            ])
+        ])
+    ]))
+    def config(request: discord_app.InteractionRequest) -> discord_app.InteractionResponse:
+        return response("config")
+
+    @app.subcommand("config", "role", "add")
+    def add_role(request: discord_app.InteractionRequest) -> discord_app.InteractionResponse:
+        arguments = request.arguments
+        return response(f"{arguments['user'].username} gets {arguments['role'].name} for {arguments['days']} days")
+
+    @app.application_command(discord_app.ApplicationCommand(
+        name="Quote",
+        description="",
+        type=discord_app.ApplicationCommandType.MESSAGE
+    ))
+    def quote(request: discord_app.InteractionRequest) -> discord_app.InteractionResponse:
+        target = request.data.resolved.messages[request.data.target_id]  # type: ignore[union-attr, index]
+        return response(f"> {target.content[:100]}")
+
+    @app.component("vote:", prefix=True)
+    def vote(request: discord_app.InteractionRequest) -> discord_app.InteractionResponse:
+        return discord_app.InteractionResponse(
+            type=discord_app.InteractionResponseType.UPDATE_MESSAGE,
+            data=discord_app.InteractionResponseMessage(content=f"voted {request.data.custom_id}")  # type: ignore[union-attr]
+        )
+
+
+def interaction_payloads() -> Dict[str, Dict[str, Any]]:
+    base = {"id": "1", "application_id": "1234567890", "token": "token", "version": 1}
+    role = {
+        "id": "700000000000000000", "name": "mods", "color": 0, "hoist": False, "position": 1,
+        "permissions": "0", "managed": False, "mentionable": True
+    }
+    return {
+        "ping": {**base, "type": 1},
+        "slash command": {**base, "type": 2, "guild_id": "300000000000000000", "data": {
+            "id": "800000000000000001", "name": "config", "type": 1,
+            "options": [{"name": "role", "type": 2, "options": [{"name": "add", "type": 1, "options": [
+                {"name": "user", "type": 6, "value": "100000000000000002"},
+                {"name": "role", "type": 8, "value": role["id"]},
+                {"name": "days", "type": 4, "value": 7},
+                {"name": "reason", "type": 3, "value": "helping out"}
+            ]}]}],
+            "resolved": {"users": {"100000000000000002": user_payload(100000000000000002)}, "roles": {role["id"]: role}}
+        }},
+        "message command": message_command_payload(),
+        "component click": {**base, "type": 3, "channel_id": "200000000000000000", "data": {
+            "custom_id": "vote:yes", "component_type": 2
+        }, "message": message_payload(600000000000000000, embeds=1, referenced=False)}
+    }
+
+
+def scenarios() -> List[Scenario]:
+    app, signing_key = make_app("http://127.0.0.1:9", _defer_command_sync=True, _timestamp_tolerance=None)
+    register_handlers(app)
+    client = app._flask.test_client()
+    result: List[Scenario] = []
+    for (name, payload) in interaction_payloads().items():
+        (headers, body) = signed_request(signing_key, payload)
+        status = client.post(app._endpoint, data=body, headers=headers).status_code
+        assert status == 200, (name, status)
+        result.append((
+            f"flask {name}",
+            lambda headers=headers, body=body: client.post(app._endpoint, data=body, headers=headers)  # type: ignore[misc]
+        ))
+
+    guild_data = guild_payload()
+    message_data = message_payload(600000000000000000)
+    interaction_response = discord_app.InteractionResponse(
+        type=discord_app.InteractionResponseType.CHANNEL_MESSAGE_WITH_SOURCE,
+        data=discord_app.InteractionResponseMessage(
+            content="Hello world " * 20,
+            embeds=decoder.decode(channel.Message, message_data).embeds
+        )
+    )
+    result += [
+        ("decode Guild", lambda: decoder.decode(guild.Guild, guild_data)),
+        ("decode Guild name, owner_id", lambda: decoder.decode_fields(guild.Guild, guild_data, ("name", "owner_id"))),
+        ("decode Message", lambda: decoder.decode(channel.Message, message_data)),
+        ("encode InteractionResponse", lambda: application._encode_result((interaction_response, 200)))
+    ]
+    return result
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * fraction))]
+
+
+def measure(operation: Callable[[], Any], operations: int) -> Dict[str, float]:
+    for _ in range(min(operations, 200)):
+        operation()
+    durations = []
+    started = time.perf_counter()
+    for _ in range(operations):
+        start = time.perf_counter()
+        operation()
+        durations.append(time.perf_counter() - start)
+    elapsed = time.perf_counter() - started
+    durations.sort()
+
+    peaks = []
+    tracemalloc.start()
+    for _ in range(min(operations, 50)):
+        tracemalloc.reset_peak()
+        (before, _) = tracemalloc.get_traced_memory()
+        operation()
+        peaks.append(tracemalloc.get_traced_memory()[1] - before)
+    tracemalloc.stop()
+    peaks.sort()
+
+    return {
+        "ops_per_second": operations / elapsed,
+        "p50_us": percentile(durations, 0.5) * 1e6,
+        "p99_us": percentile(durations, 0.99) * 1e6,
+        "peak_kib": percentile(peaks, 0.5) / 1024
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--operations", type=int, default=2000, help="operations measured per scenario")
+    parser.add_argument("--filter", default="", help="only run scenarios whose name contains this text")
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args()
+
+    results: Dict[str, Dict[str, float]] = {}
+    print(f"{'scenario':>28} {'ops/s':>9} {'p50 (us)':>9} {'p99 (us)':>9} {'peak (KiB)':>11}")
+    for (name, operation) in scenarios():
+        if args.filter not in name:
+            continue
+        result = results[name] = measure(operation, args.operations)
+        print(
+            f"{name:>28} {result['ops_per_second']:>9.0f} {result['p50_us']:>9.1f}"
+            f" {result['p99_us']:>9.1f} {result['peak_kib']:>11.1f}"
+        )
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
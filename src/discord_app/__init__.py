@@ -2,11 +2,15 @@
 from .application import\
     Application
 
+from .autocomplete import\
+    AutocompleteIndex
+
 from .discord_types import\
     ApplicationCommandType,\
     ApplicationCommandOptionType,\
     InteractionResponseType,\
-    InteractionType
+    InteractionType,\
+    Snowflake
 
 from .interaction import \
     InteractionResponse,\
@@ -18,3 +22,6 @@ from .interaction import \
     ApplicationCommand,\
     ApplicationCommandOption,\
     ApplicationCommandOptionChoice
+
+from .signature import \
+    SignatureVerifier
@@ -2,22 +2,41 @@
     Function wrapper for discord application interaction concept using Flask.
 """
 
-import json
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union
-from dataclasses import asdict, dataclass, field
+import asyncio
+import concurrent.futures
+import functools
+import inspect
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Protocol, Tuple, Type, Union
+from dataclasses import dataclass, field
 import logging
+import threading
+import time
 import requests
 import requests.structures
 import flask
-# Added "type: ignore" so mypy won't complain nacl doesn't have stub or py.typed.
-import nacl.signing     # type: ignore
-import nacl.encoding    # type: ignore
-import nacl.exceptions  # type: ignore
 
-from discord_app import user
+from discord_app import user as user_module
 
+from . import asgi
+from . import cache
+from . import channel
+from . import command_cache
+from . import decoder
+from . import deferred
 from . import discord_types
+from . import guild
+from . import http_client
 from . import interaction
+from . import json_codec
+from . import lazy
+from . import metrics
+from . import ratelimit
+from . import replay
+from . import routing
+from . import serializer
+from . import signature
+from . import singleflight
+from . import webhook
 
 
 def _asdict_ignore_none(x: List[Tuple[str, Any]]) -> Dict[str, Any]:
@@ -31,6 +50,19 @@ def _asdict_ignore_none(x: List[Tuple[str, Any]]) -> Dict[str, Any]:
     return {k: v for (k, v) in x if condition(k, v)}
 
 
+def _command_spec_changed(registered: Dict[str, Any], options: interaction.ApplicationCommand) -> bool:
+    """
+        Test if command spec is different from the registered one.
+
+        Attributes not defined in the spec (id, version...) are taken from the registered command.
+    """
+    prev_option = decoder.decode(interaction.ApplicationCommand, registered)
+    new_options = decoder.decode(interaction.ApplicationCommand, (
+        serializer.to_dict(prev_option) |
+        serializer.to_dict(options)))
+    return new_options != prev_option
+
+
 def _flask_response_from_interaction(
     response: interaction.InteractionResponse,
     headers: Dict[str, str] = {},
@@ -40,13 +72,120 @@ def _flask_response_from_interaction(
         Convert InteractionResponse object into flask.Response object
     """
     return flask.Response(
-        response=json.dumps(asdict(response, dict_factory=_asdict_ignore_none)),
+        response=serializer.dumps(response),
         headers=headers,
         status=status,
         mimetype="application/json"
     )
 
 
+# Response for an interaction which has been handled already.
+_REPLAYED_RESPONSE = '{"message": "Interaction has been handled already"}'
+
+# Attribute of interaction data identifying the handler, by interaction type.
+_DISPATCH_ATTRIBUTES = {
+    discord_types.InteractionType.APPLICATION_COMMAND: "name",
+    discord_types.InteractionType.APPLICATION_COMMAND_AUTOCOMPLETE: "name",
+    discord_types.InteractionType.MESSAGE_COMPONENT: "custom_id",
+    discord_types.InteractionType.MODAL_SUBMIT: "custom_id"
+}
+
+# Seconds objects fetched by get_channel, get_guild, get_webhook, get_message and get_user are cached, by class.
+ENTITY_CACHE_TTL: Dict[type, float] = {
+    channel.Channel: 60.0,
+    channel.Message: 60.0,
+    guild.Guild: 300.0,
+    webhook.Webhook: 60.0,
+    user_module.User: 300.0
+}
+
+# Class and attribute of InteractionResolvedData of the resolved objects put in the entity cache.
+# Resolved channels are partial (id, name, type and permissions), and get_channel must not return them.
+_SEEDED_RESOLVED_DATA = (
+    (user_module.User, "users"),
+    (channel.Message, "messages")
+)
+
+# Interaction types routed to subcommand handlers, with arguments.
+_COMMAND_TYPES = frozenset((
+    discord_types.InteractionType.APPLICATION_COMMAND,
+    discord_types.InteractionType.APPLICATION_COMMAND_AUTOCOMPLETE
+))
+
+
+class RequestHeaders(Protocol):
+    """
+        Case-insensitive request headers, e.g. flask.Request.headers.
+    """
+    def get(self, key: str) -> Optional[str]:
+        ...
+
+    def __getitem__(self, key: str) -> str:
+        ...
+
+
+# Outcome of handling an interaction: response (or pre-encoded JSON) and HTTP status code.
+InteractionResult = Tuple[Union[interaction.InteractionResponse, str], int]
+
+# Function registered to handle an interaction.
+InteractionHandler = Callable[
+    [interaction.InteractionRequest],
+    Union[interaction.InteractionResponse, Awaitable[interaction.InteractionResponse]]
+]
+
+
+def _error_result(content: str, status: int) -> InteractionResult:
+    return interaction.InteractionResponse(
+        type=discord_types.InteractionResponseType.CHANNEL_MESSAGE_WITH_SOURCE,
+        data=interaction.InteractionResponseMessage(
+            content=content
+        )
+    ), status
+
+
+def _describe_http_error(error: requests.HTTPError) -> str:
+    """
+        Status code and body of the response to a failed API call, e.g. the reason Discord refused a command.
+    """
+    if error.response is None:
+        return str(error)
+    return f"{error.response.status_code} {error.response.text}"
+
+
+def _encode_result(result: InteractionResult) -> str:
+    """
+        Get the response body of InteractionResult.
+    """
+    (response, _) = result
+    if isinstance(response, str):
+        return response
+    return serializer.dumps(response)
+
+
+def _flask_response_from_result(result: InteractionResult) -> flask.Response:
+    """
+        Convert InteractionResult into flask.Response object
+    """
+    (response, status) = result
+    if isinstance(response, str):
+        return flask.Response(response=response, status=status, mimetype="application/json")
+    return _flask_response_from_interaction(response, status=status)
+
+
+def _is_json_content_type(content_type: Optional[str]) -> bool:
+    """
+        Same as flask.Request.is_json, test if the content type is application/json or application/*+json.
+    """
+    if not content_type:
+        return False
+    mimetype = content_type.split(";", 1)[0].strip().lower()
+    return mimetype == "application/json" or (mimetype.startswith("application/") and mimetype.endswith("+json"))
+
+
+async def _await(awaitable: Awaitable[Any]) -> Any:
+    return await awaitable
+
+
 @dataclass
 class InstallParams(discord_types.DiscordDataClass):
     scopes: List[str]
@@ -69,7 +208,7 @@ class Application(discord_types.DiscordDataClass):
     rpc_origins: Optional[List[str]] = None
     terms_of_service_url: Optional[str] = None
     privacy_policy_url: Optional[str] = None
-    owner: Optional[user.User] = None
+    owner: Optional[user_module.User] = None
     guild_id: Optional[discord_types.Snowflake] = None
     primary_sku_id: Optional[discord_types.Snowflake] = None
     slug: Optional[str] = None
@@ -90,14 +229,74 @@ class Application(discord_types.DiscordDataClass):
     _command_list: Optional[Dict[str, Any]] = field(default_factory=dict)  # type: ignore[assignment]
     _logger: Optional[logging.Logger] = None
     _previously_registered_commands: Optional[List[Dict[str, Any]]] = None
+    # Requests with X-Signature-Timestamp older (or newer) than this many seconds are rejected. None to disable.
+    _timestamp_tolerance: Optional[float] = 300.0
+    # Number of recently seen interactions remembered for replay detection. 0 to disable.
+    _replay_cache_size: int = 10000
+    _api_base: str = "https://discord.com/api/v8"
+    _http_options: Optional[http_client.ConnectionPoolOptions] = None
+    # Maximum API requests per second across all rate limit buckets. 0 to disable.
+    _global_rate_limit: int = 50
+    # Collect commands defined with application_command and register them all at once with sync_commands.
+    _defer_command_sync: bool = False
+    # File remembering the command specs last registered, so unchanged commands are not fetched and compared at startup.
+    _command_cache_path: Optional[str] = None
+    # Decode nested parts of interactions (data, member, user, message) when a handler first reads them.
+    # Malformed nested parts are then reported by the handler instead of a 400 response.
+    _lazy_decoding: bool = True
+    # Number of deferred command handlers running at the same time, and waiting for a worker.
+    _deferred_workers: int = 8
+    _deferred_queue_size: int = 100
+    # Receiver of latency metrics, see the metrics module. None to disable timing.
+    _metrics: Optional[metrics.MetricsSink] = None
+    # Path serving the metrics in Prometheus text format. Metrics default to a PrometheusSink when set.
+    _metrics_endpoint: Optional[str] = None
+    # Number of objects kept by get_channel, get_guild, get_webhook, get_message and get_user. 0 to disable.
+    _entity_cache_size: int = 1000
+    # Seconds fetched objects are kept, by class. Defaults to ENTITY_CACHE_TTL.
+    _entity_cache_ttl: Optional[Dict[Type[Any], float]] = None
+    # Put the users, messages and channels interactions come with in the entity cache.
+    _entity_cache_seeding: bool = True
+    # Send identical GET requests made at the same time once, and share the response.
+    _coalesce_requests: bool = True
 
     def __post_init__(self) -> None:
-        if isinstance(self.owner, dict):
-            self.owner = user.User(**self.owner)  # type: ignore[unreachable]
-        if isinstance(self.flags, int):
-            self.flags = discord_types.ApplicationFlags(self.flags)
-        if isinstance(self.install_params, dict):
-            self.install_params = InstallParams(**self.install_params)  # type: ignore[unreachable]
+        super().__post_init__()
+
+        self._verifier: Optional[signature.SignatureVerifier] = None
+        self._http: Optional[http_client.HTTPClient] = None
+        self._http_lock = threading.Lock()
+        self._async_executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self._deferred: Optional[deferred.DeferredExecutor] = None
+        self._rate_limiter = ratelimit.RateLimiter(global_limit=self._global_rate_limit)
+        self._seen_interactions: Optional[replay.SeenSet] = None
+        self._command_cache: Optional[command_cache.RegistrationCache] = None
+        self._entity_cache: Optional[cache.EntityCache] = None
+        self._in_flight_requests = singleflight.SingleFlight() if self._coalesce_requests else None
+        # (interaction type, command name or custom_id) -> handler, see _add_handler
+        self._handlers: Dict[Tuple[discord_types.InteractionType, str], Dict[str, Any]] = {}
+        self._prefix_handlers: Dict[Tuple[discord_types.InteractionType, str], Dict[str, Any]] = {}
+        # Distinct lengths of custom_id prefixes by interaction type, longest first
+        self._prefix_lengths: Dict[discord_types.InteractionType, List[int]] = {}
+        # Option converters of commands and subcommands, see routing.compile_routes
+        self._routes: routing.Routes = {}
+        if self._command_cache_path is not None:
+            self._command_cache = command_cache.RegistrationCache(self._command_cache_path, str(self.id))
+        if self._replay_cache_size > 0:
+            self._seen_interactions = replay.SeenSet(
+                self._replay_cache_size,
+                self._timestamp_tolerance if self._timestamp_tolerance is not None else 300.0
+            )
+        if self._entity_cache_size > 0:
+            self._entity_cache = cache.EntityCache(
+                self._entity_cache_size,
+                self._entity_cache_ttl if self._entity_cache_ttl is not None else ENTITY_CACHE_TTL
+            )
+        if self._metrics_endpoint is not None:
+            if self._metrics is None:
+                self._metrics = metrics.PrometheusSink()
+            if not isinstance(self._metrics, metrics.PrometheusSink):
+                raise ValueError("_metrics_endpoint requires _metrics to be a PrometheusSink")
 
         if self.verify_key is not None and self._bot_token is not None:
             # Initializing flask
@@ -108,158 +307,470 @@ class Application(discord_types.DiscordDataClass):
                 """
                     Handler for incoming message.
                 """
-                # Request must is application/json
-                if not flask.request.is_json:
-                    self._logger.warning("Invalid request: Content-Type is not application/json")  # type: ignore[union-attr]
-                    return _flask_response_from_interaction(
-                        interaction.InteractionResponse(
-                            type=discord_types.InteractionResponseType.CHANNEL_MESSAGE_WITH_SOURCE,
-                            data=interaction.InteractionResponseMessage(
-                                content="Invalid message: Request content type must be json"
-                            )
-                        ),
-                        status=400
-                    )
-
-                # Request signature verification
-                verifier = nacl.signing.VerifyKey(self.verify_key.encode("ascii"), nacl.encoding.HexEncoder)  # type: ignore[union-attr]
-                verified = False
-                try:
-                    verifier.verify(
-                        flask.request.headers["X-Signature-Timestamp"].encode("utf-8") + flask.request.data,
-                        nacl.encoding.HexEncoder.decode(flask.request.headers["X-Signature-Ed25519"].encode("ascii"))
-                    )
-                    verified = True
-                except nacl.exceptions.BadSignatureError:
-                    return _flask_response_from_interaction(
-                        interaction.InteractionResponse(
-                            type=discord_types.InteractionResponseType.CHANNEL_MESSAGE_WITH_SOURCE,
-                            data=interaction.InteractionResponseMessage(
-                                content="Invalid message: Failed to test signature"
-                            )
-                        ),
-                        status=401
-                    )
-                if not verified:
-                    self._logger.info("Message verification failed.")  # type: ignore[union-attr]
-                    # Mandated 401 response by Discord, when signature mismatch
-                    response = _flask_response_from_interaction(
-                        interaction.InteractionResponse(
-                            type=discord_types.InteractionResponseType.CHANNEL_MESSAGE_WITH_SOURCE,
-                            data=interaction.InteractionResponseMessage(
-                                content="Invalid message: Invalid signature"
-                            )
-                        ),
-                        status=401
-                    )
-                    return response
-
-                # Handle request
-                try:
-                    request_data = interaction.InteractionRequest(_app=self, **flask.request.json)  # type: ignore[arg-type]
-                except TypeError as e:
-                    # TypeError is raised when missing attributes
-                    self._logger.warning(str(e))  # type: ignore[union-attr]
-                    return _flask_response_from_interaction(
-                        interaction.InteractionResponse(
-                            type=discord_types.InteractionResponseType.CHANNEL_MESSAGE_WITH_SOURCE,
-                            data=interaction.InteractionResponseMessage(
-                                content="Invalid message: missing attributes"
-                            )
-                        ),
-                        status=400
-                    )
-
-                if request_data.type == discord_types.InteractionType.PING:
-                    self._logger.info("Ping event detected.")  # type: ignore[union-attr]
-                    return _flask_response_from_interaction(
-                        interaction.InteractionResponse(type=discord_types.InteractionCallbackType.PONG)
-                    )
-
-                elif request_data.type == discord_types.InteractionType.APPLICATION_COMMAND:
-                    if request_data.data.name in self._command_list:  # type: ignore[union-attr, operator]
-                        self._logger.info(  # type: ignore[union-attr]
-                            "'%s' function is called using command '%s'.",
-                            self._command_list[request_data.data.name]["function"].__name__,  # type: ignore[union-attr, index]
-                            request_data.data.name  # type: ignore[union-attr]
-                        )
-                        command_response: interaction.InteractionResponse = \
-                            self._command_list[request_data.data.name]["function"](request_data)  # type: ignore[union-attr, index]
-                        return _flask_response_from_interaction(command_response)
-                    self._logger.warning(  # type: ignore[union-attr]
-                        "Handler for command '%s' is not found.",
-                        request_data.data.name  # type: ignore[union-attr]
-                    )
-                    return _flask_response_from_interaction(
-                        interaction.InteractionResponse(
-                            type=discord_types.InteractionCallbackType.CHANNEL_MESSAGE_WITH_SOURCE,
-                            data=interaction.InteractionResponseMessage(
-                                content="No such command"
-                            )
-                        ),
-                        status=404
-                    )
-
-                elif request_data.type == discord_types.InteractionType.MESSAGE_COMPONENT:
-                    # TODO: implement here
-                    return _flask_response_from_interaction(
-                        interaction.InteractionResponse(
-                            type=discord_types.InteractionResponseType.CHANNEL_MESSAGE_WITH_SOURCE,
-                            data=interaction.InteractionResponseMessage(
-                                content="Function not implemented"
-                            )
-                        ),
-                        status=501
-                    )
-                elif request_data.type == discord_types.InteractionType.APPLICATION_COMMAND_AUTOCOMPLETE:
-                    # TODO: implement here
-                    return _flask_response_from_interaction(
-                        interaction.InteractionResponse(
-                            type=discord_types.InteractionResponseType.CHANNEL_MESSAGE_WITH_SOURCE,
-                            data=interaction.InteractionResponseMessage(
-                                content="Function not implemented"
-                            )
-                        ),
-                        status=501
-                    )
-                elif request_data.type == discord_types.InteractionType.MODAL_SUBMIT:
-                    # TODO: implement here
-                    return _flask_response_from_interaction(
-                        interaction.InteractionResponse(
-                            type=discord_types.InteractionResponseType.CHANNEL_MESSAGE_WITH_SOURCE,
-                            data=interaction.InteractionResponseMessage(
-                                content="Function not implemented"
-                            )
-                        ),
-                        status=501
-                    )
-                else:
-                    # Unrecognized message type
-                    self._logger.warning(  # type: ignore[union-attr]
-                        "Invalid request: Unknown type: %s",
-                        str(request_data.type)
-                    )
-                    return _flask_response_from_interaction(
-                        interaction.InteractionResponse(
-                            type=discord_types.InteractionResponseType.CHANNEL_MESSAGE_WITH_SOURCE,
-                            data=interaction.InteractionResponseMessage(
-                                content="Invalid interaction type"
-                            )
-                        ),
-                        status=400
-                    )
+                timer = metrics.start_timer(self._metrics)
+                body = flask.request.get_data()
+                if timer is not None:
+                    timer.lap("read")
+                response = _flask_response_from_result(self._handle_interaction(flask.request.headers, body, timer))
+                if timer is not None:
+                    timer.lap("encode")
+                    timer.stop()
+                return response
 
             self._handle_command = _handle_command
+            self.asgi_app = asgi.ASGIApplication(self)
 
             # Register command router
             self._flask.route(
                 self._endpoint if self._endpoint else "/",
                 methods=["POST"]
             )(_handle_command)
-            (self._previously_registered_commands, _) = self.call_api(  # type: ignore[misc]
-                "GET",
-                f"/applications/{self.id}/commands"
+
+            if self._metrics_endpoint is not None:
+                self._flask.route(self._metrics_endpoint, methods=["GET"])(self._render_metrics)
+
+    def _render_metrics(self) -> flask.Response:
+        """
+            Handler for the metrics endpoint.
+        """
+        return flask.Response(
+            self._metrics.render(),  # type: ignore[union-attr]
+            status=200,
+            content_type=metrics.PROMETHEUS_CONTENT_TYPE
+        )
+
+    def _handle_interaction(
+        self,
+        headers: 'RequestHeaders',
+        body: bytes,
+        timer: Optional[metrics.Timer] = None
+    ) -> InteractionResult:
+        """
+            Handle an incoming interaction in the calling thread.
+
+            Coroutine handlers are run to completion with asyncio.run.
+        """
+        request_data = self._preprocess_interaction(headers, body, timer)
+        if not isinstance(request_data, interaction.InteractionRequest):
+            return request_data
+        function = self._dispatch_interaction(request_data)
+        if timer is not None:
+            timer.lap("dispatch")
+        if not callable(function):
+            return function
+        command_response = function(request_data)
+        if inspect.isawaitable(command_response):
+            command_response = asyncio.run(_await(command_response))
+        if timer is not None:
+            timer.lap("handler")
+        return command_response, 200  # type: ignore[return-value]
+
+    def _preprocess_interaction(
+        self,
+        headers: 'RequestHeaders',
+        body: bytes,
+        timer: Optional[metrics.Timer] = None
+    ) -> Union[interaction.InteractionRequest, InteractionResult]:
+        """
+            Validate an incoming interaction and build the InteractionRequest object.
+
+            :param headers: Case-insensitive mapping of request headers.
+            :param bytes body: Raw request body.
+            :param timer: Timer of the verify, parse and decode stages.
+            :return: InteractionRequest when the request is valid, or the response to send otherwise.
+        """
+        # Request must is application/json
+        if not _is_json_content_type(headers.get("Content-Type")):
+            self._logger.warning("Invalid request: Content-Type is not application/json")  # type: ignore[union-attr]
+            return _error_result("Invalid message: Request content type must be json", 400)
+
+        # Request signature verification
+        if not self._get_verifier().verify(
+            headers.get("X-Signature-Timestamp"),
+            body,
+            headers.get("X-Signature-Ed25519")
+        ):
+            self._logger.info("Message verification failed.")  # type: ignore[union-attr]
+            # Mandated 401 response by Discord, when signature mismatch
+            return _error_result("Invalid message: Invalid signature", 401)
+
+        # Replay protection, done before any parsing so duplicates are cheap to reject
+        if self._timestamp_tolerance is not None and \
+                not replay.is_timestamp_fresh(headers.get("X-Signature-Timestamp"), self._timestamp_tolerance):
+            self._logger.info("Stale request: X-Signature-Timestamp is out of tolerance.")  # type: ignore[union-attr]
+            return _error_result("Invalid message: Request expired", 401)
+        if self._seen_interactions is not None and \
+                not self._seen_interactions.add(headers["X-Signature-Ed25519"].lower()):
+            self._logger.info("Replayed request detected.")  # type: ignore[union-attr]
+            return _REPLAYED_RESPONSE, 409
+        if timer is not None:
+            timer.lap("verify")
+
+        try:
+            payload = json_codec.loads(body)
+        except ValueError:
+            self._logger.warning("Invalid request: Malformed JSON")  # type: ignore[union-attr]
+            return _error_result("Invalid message: Malformed JSON", 400)
+        if timer is not None:
+            timer.lap("parse")
+        if not isinstance(payload, dict):
+            return _error_result("Invalid message: missing attributes", 400)
+
+        # Handle request
+        try:
+            request_data = decoder.decode(interaction.InteractionRequest, payload, _app=self, _lazy=self._lazy_decoding)
+        except TypeError as e:
+            # TypeError is raised when missing attributes
+            self._logger.warning(str(e))  # type: ignore[union-attr]
+            return _error_result("Invalid message: missing attributes", 400)
+        # Only valid interactions are recorded, so that a malformed one doesn't reject its redelivery.
+        if self._seen_interactions is not None and \
+                not self._seen_interactions.add(("id", payload["id"])):
+            self._logger.info("Duplicated interaction %s detected.", payload["id"])  # type: ignore[union-attr]
+            return _REPLAYED_RESPONSE, 409
+        if timer is not None:
+            timer.lap("decode")
+        return request_data
+
+    def _dispatch_interaction(
+        self,
+        request_data: interaction.InteractionRequest
+    ) -> Union[InteractionResult, InteractionHandler]:
+        """
+            Find the handler for an interaction.
+
+            :return: The function which should handle the interaction, or the response to send.
+        """
+        interaction_type = request_data.type
+        if interaction_type == discord_types.InteractionType.PING:
+            self._logger.info("Ping event detected.")  # type: ignore[union-attr]
+            return interaction.InteractionResponse(type=discord_types.InteractionCallbackType.PONG), 200
+        if interaction_type not in _DISPATCH_ATTRIBUTES:
+            # Unrecognized message type
+            self._logger.warning(  # type: ignore[union-attr]
+                "Invalid request: Unknown type: %s",
+                str(interaction_type)
+            )
+            return _error_result("Invalid interaction type", 400)
+
+        try:
+            # Interaction data is decoded here, on first access.
+            key = getattr(request_data.data, _DISPATCH_ATTRIBUTES[interaction_type], None)
+            route = None
+            if interaction_type in _COMMAND_TYPES and request_data.data is not None:
+                (route, _) = routing.find_route(request_data.data)
+        except (TypeError, ValueError, KeyError) as e:
+            self._logger.warning("Invalid request: Malformed interaction data: %s", e)  # type: ignore[union-attr]
+            return _error_result("Invalid interaction data", 400)
+        handler = None
+        if route is not None:
+            request_data._converters = self._routes.get(route)
+            if route != key:
+                handler = self._handlers.get((interaction_type, route))
+                if handler is not None:
+                    key = route
+        if handler is None:
+            handler = self._handlers.get((interaction_type, key))  # type: ignore[arg-type]
+        if handler is None and key is not None:
+            handler = self._find_prefix_handler(interaction_type, key)
+        if handler is None:
+            self._logger.warning(  # type: ignore[union-attr]
+                "Handler for %s '%s' is not found.",
+                interaction_type.name,
+                key
             )
+            if interaction_type == discord_types.InteractionType.APPLICATION_COMMAND:
+                return _error_result("No such command", 404)
+            return _error_result("No such handler", 404)
+        self._logger.info(  # type: ignore[union-attr]
+            "'%s' function is called for %s '%s'.",
+            handler["function"].__name__,
+            interaction_type.name,
+            key
+        )
+        if self._entity_cache is not None and self._entity_cache_seeding:
+            self._seed_entity_cache(request_data)
+        if handler.get("deferred"):
+            return self._defer_command(handler["function"], request_data)
+        return handler["function"]  # type: ignore[no-any-return]
+
+    def _find_prefix_handler(self, interaction_type: discord_types.InteractionType, custom_id: str) -> Optional[Dict[str, Any]]:
+        """
+            Find the handler registered with the longest prefix of custom_id.
+
+            Only one lookup per distinct prefix length is done, however many handlers are registered.
+        """
+        for length in self._prefix_lengths.get(interaction_type, ()):
+            handler = self._prefix_handlers.get((interaction_type, custom_id[:length]))
+            if handler is not None:
+                return handler
+        return None
+
+    def _add_handler(
+        self,
+        interaction_type: discord_types.InteractionType,
+        key: str,
+        function: InteractionHandler,
+        prefix: bool = False,
+        **options: Any
+    ) -> Dict[str, Any]:
+        """
+            Add function to the dispatch table.
+
+            :param key: Command name, or custom_id of components and modals.
+            :param bool prefix: Handle every custom_id starting with key.
+            :param options: Additional handler options, e.g. deferred.
+        """
+        handler = {"function": function, **options}
+        if prefix:
+            self._prefix_handlers[(interaction_type, key)] = handler
+            lengths = set(self._prefix_lengths.get(interaction_type, ()))
+            lengths.add(len(key))
+            self._prefix_lengths[interaction_type] = sorted(lengths, reverse=True)
+        else:
+            self._handlers[(interaction_type, key)] = handler
+        return handler
+
+    def _get_deferred_executor(self) -> deferred.DeferredExecutor:
+        if self._deferred is None:
+            with self._http_lock:
+                if self._deferred is None:
+                    self._deferred = deferred.DeferredExecutor(
+                        self._deferred_workers,
+                        self._deferred_queue_size,
+                        self._logger
+                    )
+        return self._deferred
+
+    def _defer_command(
+        self,
+        function: InteractionHandler,
+        request_data: interaction.InteractionRequest
+    ) -> InteractionResult:
+        """
+            Run a deferred command handler in background and tell Discord the response will come later.
+        """
+        if not self._get_deferred_executor().submit(function, request_data):
+            self._logger.warning("Deferred command queue is full, '%s' is rejected.", request_data.data.name)  # type: ignore[union-attr]
+            return interaction.InteractionResponse(
+                type=discord_types.InteractionResponseType.CHANNEL_MESSAGE_WITH_SOURCE,
+                data=interaction.InteractionResponseMessage(
+                    content="The application is busy, please try again later.",
+                    flags=discord_types.MessageFlags.EPHEMERAL
+                )
+            ), 200
+        return interaction.InteractionResponse(
+            type=discord_types.InteractionResponseType.DEFERRED_CHANNEL_MESSAGE_WITH_SOURCE
+        ), 200
+
+    @property
+    def deferred_stats(self) -> Dict[str, Any]:
+        """
+            Queue depth, counters and latency of deferred command handlers.
+        """
+        return self._get_deferred_executor().stats
+
+    def _get_entity(
+        self,
+        cls: Any,
+        entity_id: discord_types.Snowflake,
+        path: str,
+        fields: Optional[Iterable[str]] = None,
+        use_cache: bool = True
+    ) -> Any:
+        """
+            Get an object from the entity cache, or from Discord API at path.
+
+            :param fields: Only decode these fields of an object fetched from Discord, which is then not cached.
+            :param bool use_cache: Get the object from the cache if it is there.
+        """
+        entity_id = discord_types.Snowflake(entity_id)
+        if use_cache and self._entity_cache is not None:
+            entity = self._entity_cache.get(cls, entity_id)
+            if entity is not None:
+                return entity
+        data, _ = self.call_api("GET", path)  # type: ignore[misc]
+        if fields is not None:
+            return decoder.decode_fields(cls, data, fields, _app=self)
+        entity = decoder.decode(cls, data, _app=self)
+        self._cache_entity(entity)
+        return entity
+
+    def _seed_entity_cache(self, request_data: interaction.InteractionRequest) -> None:
+        """
+            Put the users and messages an interaction comes with in the entity cache.
+
+            Parts of the interaction not decoded yet are cached as they are, and decoded when first read.
+            Resolved channels are partial, and are left out with roles and members.
+        """
+        now = time.monotonic()
+        (member, decoded) = lazy.peek(request_data, "member")
+        if member is not None:
+            self._seed(user_module.User, member.user if decoded else member.get("user"), decoded, now)
+        else:
+            self._seed(user_module.User, *lazy.peek(request_data, "user"), now)
+        self._seed(channel.Message, *lazy.peek(request_data, "message"), now)
+        (resolved, decoded) = lazy.peek(request_data.data, "resolved") if request_data.data is not None else (None, True)
+        if not resolved:
+            return
+        for (cls, attribute) in _SEEDED_RESOLVED_DATA:
+            objects = getattr(resolved, attribute) if decoded else resolved.get(attribute)
+            for entity in (objects or {}).values():
+                self._seed(cls, entity, decoded, now)
+
+    def _seed(self, cls: Any, entity: Any, decoded: bool, now: float) -> None:
+        """
+            Put an object, or its payload, in the entity cache.
+        """
+        if entity is None:
+            return
+        if decoded:
+            if hasattr(cls, "_app"):
+                entity._app = self
+            self._entity_cache.put(entity, now)  # type: ignore[union-attr]
+            return
+        try:
+            entity_id = discord_types.Snowflake(entity["id"])
+        except (KeyError, TypeError, ValueError):
+            return
+        self._entity_cache.put_payload(  # type: ignore[union-attr]
+            cls,
+            entity_id,
+            entity,
+            functools.partial(decoder.decode, cls, _app=self),
+            now
+        )
+
+    def _cache_entity(self, entity: Any) -> None:
+        """
+            Put an object just fetched or changed in the entity cache.
+        """
+        if self._entity_cache is not None:
+            self._entity_cache.put(entity)
+
+    def _invalidate_entity(self, cls: Type[Any], entity_id: discord_types.Snowflake) -> None:
+        if self._entity_cache is not None:
+            self._entity_cache.invalidate(cls, entity_id)
+
+    def get_channel(self, channel_id: discord_types.Snowflake, fields: Optional[Iterable[str]] = None) -> channel.Channel:
+        """
+            Get a channel. Channels fetched recently are returned from the entity cache.
+
+            :param fields: When the channel is fetched, only decode these fields, see :py:func:`decoder.decode_fields`.
+        """
+        return self._get_entity(channel.Channel, channel_id, f"/channels/{channel_id}", fields)  # type: ignore[no-any-return]
+
+    def get_guild(
+        self,
+        guild_id: discord_types.Snowflake,
+        fields: Optional[Iterable[str]] = None,
+        with_counts: bool = False
+    ) -> guild.Guild:
+        """
+            Get a guild. Guilds fetched recently are returned from the entity cache.
+
+            Guilds are large: decoding them takes much longer than fetching from the cache.
+            When only a few attributes are used, list them in fields, or see :py:meth:`get_guild_preview`.
+
+            :param fields: When the guild is fetched, only decode these fields, see :py:func:`decoder.decode_fields`.
+            :param bool with_counts: Fetch the guild with approximate_member_count and approximate_presence_count.
+        """
+        if with_counts:
+            return self._get_entity(  # type: ignore[no-any-return]
+                guild.Guild,
+                guild_id,
+                f"/guilds/{guild_id}?with_counts=true",
+                fields,
+                use_cache=False
+            )
+        return self._get_entity(guild.Guild, guild_id, f"/guilds/{guild_id}", fields)  # type: ignore[no-any-return]
+
+    def get_guild_preview(self, guild_id: discord_types.Snowflake) -> guild.GuildPreview:
+        """
+            Get the name, icon, description, emojis, stickers and approximate member counts of a guild,
+            a much smaller response than the guild. Previews fetched recently are returned from the entity cache.
+        """
+        return self._get_entity(guild.GuildPreview, guild_id, f"/guilds/{guild_id}/preview")  # type: ignore[no-any-return]
+
+    def get_webhook(self, webhook_id: discord_types.Snowflake) -> webhook.Webhook:
+        """
+            Get a webhook. Webhooks fetched recently are returned from the entity cache.
+        """
+        return self._get_entity(webhook.Webhook, webhook_id, f"/webhooks/{webhook_id}")  # type: ignore[no-any-return]
+
+    def get_message(self, channel_id: discord_types.Snowflake, message_id: discord_types.Snowflake) -> channel.Message:
+        """
+            Get a message. Messages fetched recently are returned from the entity cache.
+        """
+        return self._get_entity(  # type: ignore[no-any-return]
+            channel.Message,
+            message_id,
+            f"/channels/{channel_id}/messages/{message_id}"
+        )
+
+    def get_user(self, user_id: discord_types.Snowflake) -> user_module.User:
+        """
+            Get a user. Users fetched recently, or seen in interactions, are returned from the entity cache.
+        """
+        return self._get_entity(user_module.User, user_id, f"/users/{user_id}")  # type: ignore[no-any-return]
+
+    @property
+    def entity_cache_stats(self) -> Dict[str, int]:
+        """
+            Size, hits, misses and evictions of the cache used by get_channel, get_guild, get_webhook,
+            get_message and get_user.
+        """
+        if self._entity_cache is None:
+            return {"size": 0, "hits": 0, "misses": 0, "evictions": 0}
+        return self._entity_cache.stats
+
+    @property
+    def coalescing_stats(self) -> Dict[str, int]:
+        """
+            Number of GET requests sent, and of calls which shared the response of an identical request in flight.
+        """
+        if self._in_flight_requests is None:
+            return {"executed": 0, "coalesced": 0, "in_flight": 0}
+        return self._in_flight_requests.stats
+
+    def _get_verifier(self) -> signature.SignatureVerifier:
+        """
+            Get the signature verifier for incoming requests.
+
+            The verifier is built once and only rebuilt when verify_key has changed.
+        """
+        self._verifier = signature.get_verifier(self._verifier, self.verify_key)
+        return self._verifier
+
+    def _get_http_client(self) -> http_client.HTTPClient:
+        """
+            Get the pooled HTTP client for API calls, created on first use.
+        """
+        if self._http is None:
+            with self._http_lock:
+                if self._http is None:
+                    self._http = http_client.HTTPClient(self._http_options or http_client.ConnectionPoolOptions())
+        return self._http
+
+    @property
+    def connection_stats(self) -> Dict[str, int]:
+        """
+            Number of API requests sent, connections opened and connections reused by this application.
+        """
+        if self._http is None:
+            return http_client.ConnectionStats().as_dict()
+        return self._http.stats.as_dict()
+
+    def close(self) -> None:
+        """
+            Release the pooled connections used for API calls.
+        """
+        if self._http is not None:
+            self._http.close()
+        if self._async_executor is not None:
+            self._async_executor.shutdown(wait=False)
+        if self._deferred is not None:
+            self._deferred.shutdown(wait=False)
 
     @property
     def _is_authorized(self) -> bool:
@@ -273,6 +784,32 @@ class Application(discord_types.DiscordDataClass):
         data: Optional[bytes] = None,
         json: Optional[object] = None,
         use_bot_token: bool = True
+    ) -> Tuple[Any, requests.Response]:
+        """
+            Call Discord REST API.
+
+            Requests are paced according to Discord rate limits, and requests answered with 429 are retried.
+
+            GET requests without headers are sent once for all the threads making them at the same time,
+            and the response is shared: it must not be modified.
+
+            :return: (decoded JSON response or None, response object)
+        """
+        if method == "GET" and headers is None and data is None and json is None and self._in_flight_requests is not None:
+            return self._in_flight_requests.do(
+                (path, use_bot_token),
+                lambda: self._call_api(method, path, use_bot_token=use_bot_token)
+            )
+        return self._call_api(method, path, headers, data, json, use_bot_token)
+
+    def _call_api(
+        self,
+        method: str,
+        path: str,
+        headers: Union[requests.structures.CaseInsensitiveDict[Any], dict[str, str], None] = None,
+        data: Optional[bytes] = None,
+        json: Optional[object] = None,
+        use_bot_token: bool = True
     ) -> Tuple[Any, requests.Response]:
         if headers is None:
             headers = requests.structures.CaseInsensitiveDict()
@@ -283,36 +820,83 @@ class Application(discord_types.DiscordDataClass):
                 headers["Authorization"] = f"Bot {self._bot_token}"
         kwargs: Dict[str, Any] = {
             "method": method,
-            "url": f"https://discord.com/api/v8{path}",
+            "url": f"{self._api_base}{path}",
             "headers": headers
         }
         if data and json:
             raise RuntimeError("body and json are specified at the same time")
         if data:
             if isinstance(data, discord_types.DiscordDataClass):
-                kwargs["json"] = asdict(data, dict_factory=_asdict_ignore_none)
-                if "Content-Type" not in kwargs["headers"]:
-                    kwargs["headers"]["Content-Type"] = "application/json"
+                json = data
             else:
                 kwargs["data"] = data
         if json:
-            if isinstance(json, discord_types.DiscordDataClass):
-                kwargs["json"] = asdict(json, dict_factory=_asdict_ignore_none)
-            else:
-                kwargs["json"] = json
+            # Encoded with json_codec rather than by requests, with snowflakes as strings.
+            kwargs["data"] = json_codec.dumps(serializer.convert(json)).encode("utf-8")
             if "Content-Type" not in kwargs["headers"]:
                 kwargs["headers"]["Content-Type"] = "application/json"
-        response = requests.request(**kwargs)
+        http = self._get_http_client()
+        started = time.perf_counter() if self._metrics is not None else 0.0
+        response = self._rate_limiter.send(method, path, lambda: http.request(**kwargs))
+        if self._metrics is not None:
+            self._metrics.observe(
+                metrics.API_SECONDS,
+                time.perf_counter() - started,
+                method=method,
+                status=str(response.status_code)
+            )
         response.raise_for_status()
         if response.status_code == 204:
             # 204 No Content
             return None, response
         if "Content-Type" in response.headers and response.headers["Content-Type"].lower() == "application/json":
-            return response.json(), response  # type: ignore[no-any-return]
+            return json_codec.loads(response.content), response
         else:
             raise RuntimeError(f"Server responded with unexpected content type: {response.headers['Content-Type']}")
 
-    def application_command(self, options: interaction.ApplicationCommand, register_on_change: bool = True) -> Callable[[Any], Any]:
+    async def call_api_async(
+        self,
+        method: str,
+        path: str,
+        headers: Union[requests.structures.CaseInsensitiveDict[Any], dict[str, str], None] = None,
+        data: Optional[bytes] = None,
+        json: Optional[object] = None,
+        use_bot_token: bool = True
+    ) -> Tuple[Any, requests.Response]:
+        """
+            Same as call_api, but can be awaited in async command handlers.
+
+            The request is sent from a worker thread, so the event loop keeps serving other interactions.
+            There are as many worker threads as pooled connections per host.
+        """
+        if self._async_executor is None:
+            with self._http_lock:
+                if self._async_executor is None:
+                    # More threads than pooled connections per host won't send more requests at once.
+                    options = self._http_options or http_client.ConnectionPoolOptions()
+                    self._async_executor = concurrent.futures.ThreadPoolExecutor(
+                        max_workers=options.pool_maxsize,
+                        thread_name_prefix="discord_app_api"
+                    )
+        return await asyncio.get_running_loop().run_in_executor(
+            self._async_executor,
+            functools.partial(
+                self.call_api,
+                method,
+                path,
+                headers=headers,
+                data=data,
+                json=json,
+                use_bot_token=use_bot_token
+            )
+        )
+
+    def application_command(
+        self,
+        options: interaction.ApplicationCommand,
+        register_on_change: bool = True,
+        deferred: bool = False
+    ) -> Callable[[Any], Any]:
         """
             Define the following function as command handler.
             The command spec, , is defined as "option" parameter.
@@ -328,61 +912,272 @@ class Application(discord_types.DiscordDataClass):
                 # Do things
                 ...
             ```
+
+            The handler can also be a coroutine function (async def).
+
+            Set "deferred" to True for handlers which may take longer than Discord's 3 seconds limit.
+            Discord is told the response will come later, the handler runs on a background worker
+            and its response replaces the "thinking..." message.
         """
         if not self._is_authorized:
             raise RuntimeError("Unable to register a command that you have no control of. (Missing public_key and bot_token)")
 
-        def decorator(
-            function: Callable[[interaction.InteractionRequest], interaction.InteractionResponse]
-        ) -> Callable[[interaction.InteractionRequest], interaction.InteractionResponse]:
-            self._command_list[options.name] = {  # type: ignore[index]
-                "function": function,
-                "options": options
-            }
+        def decorator(function: InteractionHandler) -> InteractionHandler:
+            self._command_list[options.name] = self._add_handler(  # type: ignore[index]
+                discord_types.InteractionType.APPLICATION_COMMAND,
+                options.name,
+                function,
+                options=options,
+                deferred=deferred,
+                register_on_change=register_on_change
+            )
+            self._routes.update(routing.compile_routes(options))
+
+            if self._defer_command_sync:
+                # Registered all at once by sync_commands
+                return function
+
+            spec = serializer.to_dict(options)
+            scope = command_cache.scope_key(options.guild_id)
+            digest = command_cache.spec_hash(spec)
+            if self._command_cache is not None and self._command_cache.get(scope, options.name) == digest:
+                # Registered by a previous run
+                return function
 
             same_command_spec = False
+            response = None
             prev_option = next(
-                (command for command in self._previously_registered_commands  # type: ignore[union-attr]
+                (command for command in self._get_registered_commands()
                     if command['name'] == options.name),
                 None
             )
             if prev_option is not None:
                 # Is a registered command, detect if command spec has changed.
-                prev_option = interaction.ApplicationCommand(**prev_option)
-                new_options = interaction.ApplicationCommand(**(
-                    asdict(prev_option, dict_factory=_asdict_ignore_none) |
-                    asdict(options, dict_factory=_asdict_ignore_none)))
-                same_command_spec = (new_options == prev_option)
+                same_command_spec = not _command_spec_changed(prev_option, options)
             if not same_command_spec:
-                if prev_option is None:
-                    self._logger.info("Registering new command %s", options.name)  # type: ignore[union-attr]
-                    (_, response) = self.call_api(  # type: ignore[misc]
-                        method="POST",
-                        path=f"/applications/{self.id}/commands",
-                        headers={"Content-Type": "application/json"},
-                        json=asdict(options, dict_factory=_asdict_ignore_none)
-                    )
-                    self._logger.info(f"Registration retruned with status code {response.status_code}")  # type: ignore[union-attr]
-                else:
-                    self._logger.info("Command specification has changed: %s", options.name)  # type: ignore[union-attr]
-                    self._logger.debug("Before %s", repr(prev_option))  # type: ignore[union-attr]
-                    self._logger.debug("After %s", repr(options))  # type: ignore[union-attr]
-                    if register_on_change:
-                        self._logger.info("Registering command %s", options.name)  # type: ignore[union-attr]
+                try:
+                    if prev_option is None:
+                        self._logger.info("Registering new command %s", options.name)  # type: ignore[union-attr]
                         (_, response) = self.call_api(  # type: ignore[misc]
-                            method="PATCH",
-                            path=f"/applications/{self.id}/commands/{prev_option.id}",
+                            method="POST",
+                            path=f"/applications/{self.id}/commands",
                             headers={"Content-Type": "application/json"},
-                            json=asdict(options, dict_factory=_asdict_ignore_none)
+                            json=spec
                         )
                         self._logger.info(f"Registration retruned with status code {response.status_code}")  # type: ignore[union-attr]
+                    else:
+                        self._logger.info("Command specification has changed: %s", options.name)  # type: ignore[union-attr]
+                        self._logger.debug("Before %s", repr(prev_option))  # type: ignore[union-attr]
+                        self._logger.debug("After %s", repr(options))  # type: ignore[union-attr]
+                        if register_on_change:
+                            self._logger.info("Registering command %s", options.name)  # type: ignore[union-attr]
+                            (_, response) = self.call_api(  # type: ignore[misc]
+                                method="PATCH",
+                                path=f"/applications/{self.id}/commands/{prev_option['id']}",
+                                headers={"Content-Type": "application/json"},
+                                json=spec
+                            )
+                            self._logger.info(f"Registration retruned with status code {response.status_code}")  # type: ignore[union-attr]
+                except requests.HTTPError as e:
+                    self._logger.error(  # type: ignore[union-attr]
+                        "Registration of command %s failed: %s", options.name, _describe_http_error(e)
+                    )
+                    raise
+            if same_command_spec or response is not None:
+                self._update_command_cache(scope, {options.name: digest}, replace=False)
+            return function
+        return decorator
+
+    def subcommand(
+        self,
+        command_name: str,
+        *path: str,
+        deferred: bool = False
+    ) -> Callable[[InteractionHandler], InteractionHandler]:
+        """
+            Define the following function as handler of a subcommand.
+
+            The command, with its subcommand groups and subcommands, is registered with
+            :py:meth:`application_command`. Its handler is called for subcommands without their own handler.
+            Options given to the subcommand are in request_data.arguments, converted according to their type.
+
+            ```
+            @app.subcommand("config", "role", "add")  # /config role add
+            def add_role(discord_request):
+                role = discord_request.arguments["role"]
+                ...
+            ```
+
+            "deferred" works as in :py:meth:`application_command`.
+        """
+        route = " ".join((command_name, *path))
+
+        def decorator(function: InteractionHandler) -> InteractionHandler:
+            self._add_handler(discord_types.InteractionType.APPLICATION_COMMAND, route, function, deferred=deferred)
             return function
         return decorator
 
+    def autocomplete(self, command_name: str) -> Callable[[InteractionHandler], InteractionHandler]:
+        """
+            Define the following function as autocomplete handler of a command.
+
+            The handler returns an InteractionResponse of type APPLICATION_AUTOCOMPLETE_RESULT.
+            The option being typed is the one with "focused" set in request_data.data.options.
+            command_name can also name a subcommand, e.g. "config role add", see :py:meth:`subcommand`.
+
+            ```
+            @app.autocomplete("fruit")
+            def fruit_choices(discord_request):
+                ...
+            ```
+        """
+        def decorator(function: InteractionHandler) -> InteractionHandler:
+            self._add_handler(discord_types.InteractionType.APPLICATION_COMMAND_AUTOCOMPLETE, command_name, function)
+            return function
+        return decorator
+
+    def component(self, custom_id: str, prefix: bool = False) -> Callable[[InteractionHandler], InteractionHandler]:
+        """
+            Define the following function as handler of message components (buttons, select menus) with custom_id.
+
+            Set "prefix" to True to handle every custom_id starting with custom_id,
+            e.g. "vote:" for buttons "vote:yes" and "vote:no". The longest matching prefix wins,
+            and handlers registered for the exact custom_id are preferred.
+
+            ```
+            @app.component("vote:", prefix=True)
+            def vote(discord_request):
+                choice = discord_request.data.custom_id[len("vote:"):]
+                ...
+            ```
+        """
+        def decorator(function: InteractionHandler) -> InteractionHandler:
+            self._add_handler(discord_types.InteractionType.MESSAGE_COMPONENT, custom_id, function, prefix)
+            return function
+        return decorator
+
+    def modal(self, custom_id: str, prefix: bool = False) -> Callable[[InteractionHandler], InteractionHandler]:
+        """
+            Define the following function as handler of submitted modals with custom_id.
+
+            "prefix" works as in :py:meth:`component`.
+        """
+        def decorator(function: InteractionHandler) -> InteractionHandler:
+            self._add_handler(discord_types.InteractionType.MODAL_SUBMIT, custom_id, function, prefix)
+            return function
+        return decorator
+
+    def sync_commands(self) -> bool:
+        """
+            Register every command defined with application_command using bulk overwrite.
+
+            One PUT request is sent for global commands and one per guild, and only if the
+            registered commands differ from the defined ones. Commands registered on Discord but
+            no longer defined in a scope (global or a guild with defined commands) are removed.
+
+            Used when "_defer_command_sync" is True. run() and the ASGI server startup call this
+            automatically; call it yourself when serving the Flask app with another WSGI server.
+
+            :return: True if any command has been registered or removed.
+            :raises requests.HTTPError: Discord refused the commands of a scope. Other scopes are registered anyway.
+        """
+        scopes: Dict[Optional[discord_types.Snowflake], List[Dict[str, Any]]] = {}
+        for command in self._command_list.values():  # type: ignore[union-attr]
+            scopes.setdefault(command["options"].guild_id, []).append(command)
+
+        changed = False
+        failure: Optional[requests.HTTPError] = None
+        for (guild_id, commands) in scopes.items():
+            scope = command_cache.scope_key(guild_id)
+            specs = {
+                command["options"].name: serializer.to_dict(command["options"])
+                for command in commands
+            }
+            hashes = {name: command_cache.spec_hash(spec) for (name, spec) in specs.items()}
+            if self._command_cache is not None and self._command_cache.scope(scope) == hashes:
+                # Registered by a previous run
+                continue
+
+            if guild_id is None:
+                path = f"/applications/{self.id}/commands"
+                registered = self._get_registered_commands()
+            else:
+                path = f"/applications/{self.id}/guilds/{guild_id}/commands"
+                (registered, _) = self.call_api("GET", path)
+            remaining = {
+                (command["name"], command.get("type", discord_types.ApplicationCommandType.CHAT_INPUT)): command
+                for command in registered or []
+            }
+            body = []
+            dirty = False
+            for command in commands:
+                options: interaction.ApplicationCommand = command["options"]
+                prev_option = remaining.pop((options.name, options.type), None)
+                if prev_option is None:
+                    self._logger.info("Registering new command %s", options.name)  # type: ignore[union-attr]
+                    dirty = True
+                elif _command_spec_changed(prev_option, options):
+                    self._logger.info("Command specification has changed: %s", options.name)  # type: ignore[union-attr]
+                    if not command["register_on_change"]:
+                        # Not cached either, so it is compared again on next start.
+                        body.append(prev_option)
+                        del hashes[options.name]
+                        continue
+                    dirty = True
+                body.append(specs[options.name])
+            if remaining:
+                self._logger.info("Removing commands %s", ", ".join(name for (name, _) in remaining))  # type: ignore[union-attr]
+                dirty = True
+            if dirty:
+                try:
+                    (result, response) = self.call_api("PUT", path, json=body)
+                except requests.HTTPError as e:
+                    self._logger.error(  # type: ignore[union-attr]
+                        "Bulk registration of %d commands to %s failed: %s", len(body), path, _describe_http_error(e)
+                    )
+                    failure = failure or e
+                    continue
+                self._logger.info("Bulk registration of %d commands returned with status code %d", len(body), response.status_code)  # type: ignore[union-attr]
+                if guild_id is None:
+                    self._previously_registered_commands = result
+                changed = True
+            self._update_command_cache(scope, hashes, replace=True)
+        if failure is not None:
+            raise failure
+        return changed
+
+    def _get_registered_commands(self) -> List[Dict[str, Any]]:
+        """
+            Global commands registered on Discord, fetched on first use.
+        """
+        if self._previously_registered_commands is None:
+            (self._previously_registered_commands, _) = self.call_api(  # type: ignore[misc]
+                "GET",
+                f"/applications/{self.id}/commands"
+            )
+        return self._previously_registered_commands or []
+
+    def _update_command_cache(self, scope: str, hashes: Dict[str, str], replace: bool) -> None:
+        if self._command_cache is None:
+            return
+        try:
+            if replace:
+                self._command_cache.replace_scope(scope, hashes)
+            else:
+                for (name, digest) in hashes.items():
+                    self._command_cache.set(scope, name, digest)
+        except OSError:
+            # Only costs a fetch and comparison on next start.
+            self._logger.warning("Unable to write command cache %s", self._command_cache_path, exc_info=True)  # type: ignore[union-attr]
+
     def run(self, *args: Any, **kwargs: Any) -> None:
         """
             Starts web server for incoming requests.
+
+            This is Flask's development server. Use the "asgi_app" attribute to serve with an ASGI server instead.
         """
+        if self._defer_command_sync:
+            self.sync_commands()
         return self._flask.run(*args, **kwargs)
 
     @classmethod
@@ -390,8 +1185,14 @@ class Application(discord_types.DiscordDataClass):
         cls,
         id: discord_types.Snowflake,
         bot_token: str,
-        endpoint: str = "/"
+        endpoint: str = "/",
+        **kwargs: Any
     ) -> 'Application':  # type: ignore[valid-type]
+        """
+            Fetch application information from Discord and create the Application object.
+
+            Additional keyword arguments are passed to the constructor, e.g. _timestamp_tolerance.
+        """
         appinfo_response = requests.request(
             "GET",
             "https://discord.com/api/v8/oauth2/applications/@me",
@@ -400,12 +1201,13 @@ class Application(discord_types.DiscordDataClass):
             }
         )
         appinfo_response.raise_for_status()
-        app_obj = appinfo_response.json()
-        if app_obj['id'] == id:
+        app_obj = json_codec.loads(appinfo_response.content)
+        if app_obj['id'] == str(id):
             return cls(
                 _bot_token=bot_token,
                 _endpoint=endpoint,
-                **app_obj
+                **app_obj,
+                **kwargs
             )
         raise ValueError(f"Discord responded with different application ID \"{app_obj['id']}\". Expected: \"{id}\"")
 
@@ -0,0 +1,151 @@
+"""
+    ASGI server interface for Discord application.
+
+    Serves the same interaction endpoint as the Flask application, with ``async def``
+    command handlers awaited directly on the event loop. Regular handlers are run in
+    a worker thread so they don't block other interactions.
+
+    Usage example (with uvicorn):
+
+    ```
+    app = discord_app.Application.from_basic_data(...)
+    asgi_app = app.asgi_app
+
+    # $ uvicorn my_module:asgi_app
+    ```
+"""
+import asyncio
+import inspect
+from typing import Any, Awaitable, Callable, Dict, List, MutableMapping, Optional, Tuple
+
+import requests.structures
+
+from . import application
+from . import interaction
+from . import metrics
+
+
+Scope = MutableMapping[str, Any]
+Message = MutableMapping[str, Any]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+
+
+async def _call_handler(
+    function: 'application.InteractionHandler',
+    request_data: interaction.InteractionRequest
+) -> interaction.InteractionResponse:
+    if inspect.iscoroutinefunction(function):
+        return await function(request_data)  # type: ignore[no-any-return]
+    response = await asyncio.to_thread(function, request_data)
+    if inspect.isawaitable(response):
+        response = await response
+    return response
+
+
+class ASGIApplication():
+    """
+        ASGI application handling Discord interactions for an :py:class:`application.Application`.
+    """
+
+    def __init__(self, app: 'application.Application') -> None:
+        self.app = app
+
+    async def handle(
+        self,
+        headers: requests.structures.CaseInsensitiveDict[str],
+        body: bytes,
+        timer: Optional[metrics.Timer] = None
+    ) -> 'application.InteractionResult':
+        """
+            Handle an interaction request.
+
+            :param headers: Request headers.
+            :param bytes body: Raw request body.
+            :param timer: Timer of the stages up to the handler.
+        """
+        result = self.app._preprocess_interaction(headers, body, timer)
+        if not isinstance(result, interaction.InteractionRequest):
+            return result
+        function = self.app._dispatch_interaction(result)
+        if timer is not None:
+            timer.lap("dispatch")
+        if not callable(function):
+            return function
+        response = await _call_handler(function, result)
+        if timer is not None:
+            timer.lap("handler")
+        return response, 200
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "lifespan":
+            while True:
+                message = await receive()
+                if message["type"] == "lifespan.startup":
+                    if self.app._defer_command_sync:
+                        try:
+                            await asyncio.to_thread(self.app.sync_commands)
+                        except Exception as e:
+                            # The server would otherwise wait for the startup forever.
+                            await send({"type": "lifespan.startup.failed", "message": str(e)})
+                            return
+                    await send({"type": "lifespan.startup.complete"})
+                elif message["type"] == "lifespan.shutdown":
+                    self.app.close()
+                    await send({"type": "lifespan.shutdown.complete"})
+                    return
+        if scope["type"] != "http":
+            return
+
+        if scope["path"] == self.app._metrics_endpoint and scope["method"] == "GET":
+            await self._send(
+                send,
+                200,
+                self.app._metrics.render().encode("utf-8"),  # type: ignore[union-attr]
+                metrics.PROMETHEUS_CONTENT_TYPE.encode("latin-1")
+            )
+            return
+        if scope["path"] != (self.app._endpoint or "/"):
+            await self._send(send, 404, b'{"message": "Not Found"}')
+            return
+        if scope["method"] != "POST":
+            await self._send(send, 405, b'{"message": "Method Not Allowed"}')
+            return
+
+        timer = metrics.start_timer(self.app._metrics)
+        chunks: List[bytes] = []
+        while True:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                return
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body", False):
+                break
+        headers: requests.structures.CaseInsensitiveDict[str] = requests.structures.CaseInsensitiveDict({
+            k.decode("latin-1"): v.decode("latin-1") for (k, v) in scope["headers"]
+        })
+
+        body = b"".join(chunks)
+        if timer is not None:
+            timer.lap("read")
+
+        result = await self.handle(headers, body, timer)
+        response_body = application._encode_result(result).encode("utf-8")
+        if timer is not None:
+            timer.lap("encode")
+            timer.stop()
+        await self._send(send, result[1], response_body)
+
+    @staticmethod
+    async def _send(send: Send, status: int, body: bytes, content_type: bytes = b"application/json") -> None:
+        response_headers: List[Tuple[bytes, bytes]] = [
+            (b"content-type", content_type),
+            (b"content-length", str(len(body)).encode("ascii"))
+        ]
+        start: Dict[str, Any] = {
+            "type": "http.response.start",
+            "status": status,
+            "headers": response_headers
+        }
+        await send(start)
+        await send({"type": "http.response.body", "body": body})
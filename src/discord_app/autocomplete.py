@@ -0,0 +1,133 @@
+"""
+    Answering autocomplete interactions from a fixed set of candidates.
+"""
+import bisect
+from collections import OrderedDict
+import threading
+from typing import Iterable, List, Tuple, Union
+
+from . import discord_types
+from . import interaction
+from . import routing
+
+
+# Maximum number of choices in an autocomplete response, set by Discord.
+MAX_CHOICES = 25
+
+
+class AutocompleteIndex():
+    """
+        Candidates sorted by case-insensitive name, searched by prefix in O(log n).
+
+        With fuzzy set, candidates containing the typed text follow those starting with it.
+        They are found by scanning all names at once, stopping as soon as there are enough choices.
+        Recent results are kept in an LRU cache, as every keystroke of every user is a query.
+
+        The handle method is an autocomplete handler:
+
+        ```
+        fruits = AutocompleteIndex(["apple", "banana", ...])
+        app.autocomplete("fruit")(fruits.handle)
+        ```
+
+        :param candidates: Choice names, or choices with a value different from their name.
+        :param bool fuzzy: Also match candidates containing the typed text.
+        :param int limit: Maximum number of choices returned, up to MAX_CHOICES.
+        :param int cache_size: Number of queries whose results are kept.
+    """
+
+    def __init__(
+        self,
+        candidates: Iterable[Union[str, 'interaction.ApplicationCommandOptionChoice']],
+        fuzzy: bool = False,
+        limit: int = MAX_CHOICES,
+        cache_size: int = 1024
+    ) -> None:
+        if not 0 < limit <= MAX_CHOICES:
+            raise ValueError(f"limit must be between 1 and {MAX_CHOICES}")
+        choices = [
+            interaction.ApplicationCommandOptionChoice(name=candidate, value=candidate)
+            if isinstance(candidate, str) else candidate
+            for candidate in candidates
+        ]
+        entries = sorted(((_normalize(choice.name), choice) for choice in choices), key=lambda entry: entry[0])
+        self.fuzzy = fuzzy
+        self.limit = limit
+        self.cache_size = cache_size
+        self._keys = [key for (key, _) in entries]
+        self._choices = [choice for (_, choice) in entries]
+        # All keys in one string, and where each of them starts, for the fuzzy search
+        self._text = "\n".join(self._keys)
+        self._starts: List[int] = []
+        position = 0
+        for key in self._keys:
+            self._starts.append(position)
+            position += len(key) + 1
+        self._cache: 'OrderedDict[str, Tuple[interaction.ApplicationCommandOptionChoice, ...]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def _prefix_matches(self, query: str) -> List[int]:
+        keys = self._keys
+        end = start = bisect.bisect_left(keys, query)
+        while end < len(keys) and end - start < self.limit and keys[end].startswith(query):
+            end += 1
+        return list(range(start, end))
+
+    def _substring_matches(self, query: str, count: int) -> List[int]:
+        """
+            Find up to count candidates containing query, other than those starting with it.
+        """
+        (text, starts) = (self._text, self._starts)
+        matches: List[int] = []
+        position = text.find(query)
+        while position >= 0 and len(matches) < count:
+            index = bisect.bisect_right(starts, position) - 1
+            # The first match in a candidate starting with query is at its start.
+            if starts[index] != position:
+                matches.append(index)
+            if index + 1 == len(starts):
+                break
+            position = text.find(query, starts[index + 1])
+        return matches
+
+    def search(self, query: str) -> List['interaction.ApplicationCommandOptionChoice']:
+        """
+            Find the choices for what the user has typed, candidates starting with it first.
+        """
+        query = _normalize(query)
+        with self._lock:
+            cached = self._cache.get(query)
+            if cached is not None:
+                self._cache.move_to_end(query)
+                return list(cached)
+        indexes = self._prefix_matches(query)
+        if self.fuzzy and query and len(indexes) < self.limit:
+            indexes += self._substring_matches(query, self.limit - len(indexes))
+        result = tuple(self._choices[index] for index in indexes)
+        if self.cache_size > 0:
+            with self._lock:
+                self._cache[query] = result
+                if len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        return list(result)
+
+    def handle(self, request: 'interaction.InteractionRequest') -> 'interaction.InteractionResponse':
+        """
+            Autocomplete handler answering the focused option.
+        """
+        value = ""
+        if request.data is not None:
+            (_, options) = routing.find_route(request.data)
+            value = next((str(option.value) for option in options if option.focused and option.value is not None), "")
+        return interaction.InteractionResponse(
+            type=discord_types.InteractionResponseType.APPLICATION_AUTOCOMPLETE_RESULT,
+            data=interaction.InteractionResponseAutocomplete(choices=self.search(value))
+        )
+
+
+def _normalize(text: str) -> str:
+    # Line feeds separate the keys in AutocompleteIndex._text.
+    return text.casefold().replace("\n", " ")
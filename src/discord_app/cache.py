@@ -0,0 +1,140 @@
+"""
+    Cache of objects fetched from Discord API.
+"""
+from collections import OrderedDict
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple, Type, TypeVar
+
+
+T = TypeVar("T")
+
+
+class EntityCache():
+    """
+        Bounded cache of objects by class and ID.
+
+        Objects expire after the TTL of their class. When the cache is full, the least recently used
+        object is dropped. Lookup and insertion are O(1).
+
+        Cached objects are shared by everyone getting them from the cache. Objects can also be
+        cached as their API payload, decoded when they are first read.
+
+        :param int max_size: Maximum number of objects kept.
+        :param ttl: Seconds objects of each class are kept, by class.
+        :param float default_ttl: Seconds objects of other classes are kept.
+    """
+
+    def __init__(self, max_size: int, ttl: Optional[Dict[type, float]] = None, default_ttl: float = 60.0) -> None:
+        if max_size <= 0:
+            raise ValueError("max_size must be a positive integer")
+        self.max_size = max_size
+        self.ttl = dict(ttl or {})
+        self.default_ttl = default_ttl
+        # (class, ID) -> (expiry time, object or payload, decoder of the payload), least recently used first
+        self._entries: 'OrderedDict[Tuple[type, Hashable], Tuple[float, Any, Optional[Callable[[Any], Any]]]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, cls: Type[T], entity_id: Hashable, now: Optional[float] = None) -> Optional[T]:
+        """
+            Get the object of cls with entity_id, or None if it is not cached or has expired.
+        """
+        if now is None:
+            now = time.monotonic()
+        key = (cls, entity_id)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= now:
+                if entry is not None:
+                    del self._entries[key]
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            (expire_at, entity, decode) = entry
+            if decode is None:
+                self._hits += 1
+                return entity  # type: ignore[no-any-return]
+        # Payloads are decoded without holding the lock, which would block every other thread.
+        # Threads reading the same payload at the same time each decode it.
+        try:
+            entity = decode(entity)
+        except (TypeError, ValueError):
+            # Malformed payload
+            with self._lock:
+                if self._entries.get(key) is entry:
+                    del self._entries[key]
+                self._misses += 1
+            return None
+        with self._lock:
+            # Unless the entry has been replaced or dropped meanwhile
+            if self._entries.get(key) is entry:
+                self._entries[key] = (expire_at, entity, None)
+            self._hits += 1
+        return entity  # type: ignore[no-any-return]
+
+    def put(self, entity: Any, now: Optional[float] = None) -> None:
+        """
+            Cache entity by its class and id attribute.
+        """
+        self._put(type(entity), entity.id, entity, None, now)
+
+    def put_payload(
+        self,
+        cls: type,
+        entity_id: Hashable,
+        payload: Any,
+        decode: Callable[[Any], Any],
+        now: Optional[float] = None
+    ) -> None:
+        """
+            Cache the payload of an object of cls, decoded with decode when it is first read.
+        """
+        self._put(cls, entity_id, payload, decode, now)
+
+    def _put(
+        self,
+        cls: type,
+        entity_id: Hashable,
+        value: Any,
+        decode: Optional[Callable[[Any], Any]],
+        now: Optional[float]
+    ) -> None:
+        if now is None:
+            now = time.monotonic()
+        key = (cls, entity_id)
+        with self._lock:
+            self._entries.pop(key, None)
+            while len(self._entries) >= self.max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+            self._entries[key] = (now + self.ttl.get(cls, self.default_ttl), value, decode)
+
+    def invalidate(self, cls: type, entity_id: Hashable) -> None:
+        """
+            Drop the object of cls with entity_id, e.g. after changing or deleting it.
+        """
+        with self._lock:
+            self._entries.pop((cls, entity_id), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """
+            Number of cached objects, hits, misses and evictions of objects for lack of room.
+        """
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions
+            }
@@ -1,7 +1,9 @@
 
 from dataclasses import dataclass
-from typing import List, Optional, Any, Union
+import datetime
+from typing import Dict, Iterable, Iterator, List, Optional, Any, Tuple, Union
 
+from . import decoder
 from . import guild
 from . import discord_types
 from . import user as user_module
@@ -12,6 +14,16 @@ from . import application as application_module
 from . import webhook
 
 
+# Most messages deleted by one bulk delete request.
+BULK_DELETE_MAX = 100
+# Discord refuses to bulk delete messages older than this.
+BULK_DELETE_MAX_AGE = datetime.timedelta(days=14)
+# Most messages returned by one request for the message history.
+HISTORY_PAGE_SIZE = 100
+# Most characters in the content of a message.
+MAX_CONTENT_LENGTH = 2000
+
+
 @dataclass
 class AllowedMentions(discord_types.DiscordDataClass):
     parse: List[discord_types.AllowedMentionType]
@@ -19,12 +31,6 @@ class AllowedMentions(discord_types.DiscordDataClass):
     users: List[discord_types.Snowflake]
     replied_user: bool
 
-    def __post_init__(self) -> None:
-        self.parse = [
-            discord_types.AllowedMentionType(t) if isinstance(t, str) else t
-            for t in self.parse
-        ]
-
 
 @dataclass
 class ThreadMetadata(discord_types.DiscordDataClass):
@@ -47,7 +53,7 @@ class ThreadMember(discord_types.DiscordDataClass):
 @dataclass
 class Overwrite(discord_types.DiscordDataClass):
     id: discord_types.Snowflake
-    type: discord_types.Snowflake
+    type: int
     allow: str
     deny: str
 
@@ -85,23 +91,6 @@ class Channel(discord_types.DiscordDataClass):
     # This is for api calls.
     _app: Optional['application_module.Application'] = None
 
-    def __post_init__(self) -> None:
-        if isinstance(self.recipients, list):
-            self.recipients = [user_module.User(**u) if isinstance(u, dict) else u for u in self.recipients]
-        if isinstance(self.video_quality_mode, int):
-            self.video_quality_mode = discord_types.VideoQualityMode(self.video_quality_mode)
-        if isinstance(self.flags, int):
-            self.flags = discord_types.ChannelFlag(self.flags)
-        if isinstance(self.thread_metadata, dict):
-            self.thread_metadata = ThreadMetadata(**self.thread_metadata)  # type: ignore[unreachable]
-        if isinstance(self.member, dict):
-            self.member = ThreadMember(**self.member)  # type: ignore[unreachable]
-        if isinstance(self.permission_overwrites, list):
-            self.permission_overwrites = [
-                Overwrite(**overwrite) if isinstance(overwrite, dict) else overwrite
-                for overwrite in self.permission_overwrites
-            ]
-
     @property
     def _is_text_channel(self) -> bool:
         return self.type not in [
@@ -161,10 +150,141 @@ class Channel(discord_types.DiscordDataClass):
                 f"/channels/{self.id}/messages",
                 json=msg_dict
             )
-            return Message(_app=self._app, **msg_json)
+            return decoder.decode(Message, msg_json, _app=self._app)
         else:
             raise RuntimeError("Unable to post message: application is not authorized.")
 
+    def post_messages(self, lines: Iterable[str], separator: str = "\n") -> List['Message']:
+        """
+            Post lines of text in as few messages as possible.
+
+            Consecutive lines are joined with separator as long as the content fits in one message,
+            and lines longer than a message are split. Messages are posted one after another, in order,
+            paced by the rate limit of the channel.
+
+            :return: The messages posted.
+        """
+        messages = []
+        content = ""
+        for line in lines:
+            while len(line) > MAX_CONTENT_LENGTH:
+                if content:
+                    messages.append(self.post_message(content=content))
+                    content = ""
+                messages.append(self.post_message(content=line[:MAX_CONTENT_LENGTH]))
+                line = line[MAX_CONTENT_LENGTH:]
+            if content and len(content) + len(separator) + len(line) <= MAX_CONTENT_LENGTH:
+                content += separator + line
+                continue
+            if content:
+                messages.append(self.post_message(content=content))
+            content = line
+        if content:
+            messages.append(self.post_message(content=content))
+        return messages
+
+    def bulk_delete(self, messages: Iterable[Union[discord_types.Snowflake, 'Message']]) -> int:
+        """
+            Delete messages of this channel, up to 100 per request.
+
+            Messages older than two weeks, which Discord doesn't bulk delete, are deleted one by one.
+
+            :param messages: The messages, or their IDs.
+            :return: Number of messages deleted.
+            :raises RuntimeError: if the application is None or the application is not authorized.
+        """
+        if self._app is None or not self._app._is_authorized:
+            raise RuntimeError("Unable to delete messages: application is not authorized.")
+        # Messages by ID, without duplicates which Discord refuses
+        by_id: Dict[discord_types.Snowflake, Optional[Message]] = {}
+        for message in messages:
+            if isinstance(message, Message):
+                by_id[message.id] = message
+            else:
+                by_id.setdefault(discord_types.Snowflake(message), None)
+        # A bit of margin for requests sent later on
+        oldest = discord_types.Snowflake.from_datetime(
+            datetime.datetime.now(datetime.timezone.utc) - BULK_DELETE_MAX_AGE + datetime.timedelta(minutes=1)
+        )
+        recent = [message_id for message_id in by_id if message_id >= oldest]
+        single = [message_id for message_id in by_id if message_id < oldest]
+        # Messages deleted by each request, with its path and body
+        batches: List[Tuple[List[discord_types.Snowflake], str, Optional[Dict[str, Any]]]] = []
+        for start in range(0, len(recent), BULK_DELETE_MAX):
+            chunk = recent[start:start + BULK_DELETE_MAX]
+            if len(chunk) == 1:
+                # Bulk delete takes at least 2 messages.
+                single += chunk
+                continue
+            batches.append((
+                chunk,
+                f"/channels/{self.id}/messages/bulk-delete",
+                {"messages": [str(message_id) for message_id in chunk]}
+            ))
+        batches += [([message_id], f"/channels/{self.id}/messages/{message_id}", None) for message_id in single]
+        for (chunk, path, body) in batches:
+            if body is None:
+                self._app.call_api("DELETE", path)
+            else:
+                self._app.call_api("POST", path, json=body)
+            # Messages deleted so far are invalidated, even if a later request fails.
+            for message_id in chunk:
+                deleted = by_id[message_id]
+                if deleted is not None:
+                    deleted._valid = False
+                self._app._invalidate_entity(Message, message_id)
+        return len(by_id)
+
+    def history(
+        self,
+        limit: Optional[int] = None,
+        before: Optional[discord_types.Snowflake] = None,
+        after: Optional[discord_types.Snowflake] = None
+    ) -> Iterator['Message']:
+        """
+            Iterate over the messages of this channel, newest first, or oldest first when after is given.
+
+            Messages are fetched 100 at a time while iterating, and decoded one by one.
+
+            :param limit: Most messages returned, or None for all of them.
+            :param before: Only messages older than this message ID.
+            :param after: Only messages newer than this message ID.
+            :raises ValueError: if both before and after are given.
+            :raises RuntimeError: if the application is None or the application is not authorized.
+        """
+        if before is not None and after is not None:
+            raise ValueError("before and after cannot be used together")
+        if self._app is None or not self._app._is_authorized:
+            raise RuntimeError("Unable to get messages: application is not authorized.")
+        if after is not None:
+            return self._history(self._app, limit, "after", after)
+        return self._history(self._app, limit, "before", before)
+
+    def _history(
+        self,
+        app: 'application_module.Application',
+        remaining: Optional[int],
+        direction: str,
+        cursor: Optional[discord_types.Snowflake]
+    ) -> Iterator['Message']:
+        while remaining is None or remaining > 0:
+            page_size = HISTORY_PAGE_SIZE if remaining is None else min(remaining, HISTORY_PAGE_SIZE)
+            path = f"/channels/{self.id}/messages?limit={page_size}"
+            if cursor is not None:
+                path += f"&{direction}={cursor}"
+            page, _ = app.call_api("GET", path)
+            if not page:
+                return
+            # Discord lists messages newest first.
+            page = sorted(page, key=lambda payload: int(payload["id"]), reverse=direction == "before")
+            for payload in page:
+                yield decoder.decode(Message, payload, _app=app)
+            cursor = discord_types.Snowflake(page[-1]["id"])
+            if remaining is not None:
+                remaining -= len(page)
+            if len(page) < page_size:
+                return
+
     def create_webhook(self, name: str, avatar: Optional[str] = None) -> 'webhook.Webhook':
         """
         Create a webhook endpoint.
@@ -188,7 +308,7 @@ class Channel(discord_types.DiscordDataClass):
             f"/channels/{self.id}/webhooks",
             json=req_body
         )
-        return webhook.Webhook(_app=self._app, **resp_json)
+        return decoder.decode(webhook.Webhook, resp_json, _app=self._app)
 
     def list_webhooks(self) -> List['webhook.Webhook']:
         """
@@ -200,7 +320,7 @@ class Channel(discord_types.DiscordDataClass):
             "GET",
             f"/channels/{self.id}/webhooks"
         )
-        return [webhook.Webhook(_app=self._app, **wh) for wh in list_wh]
+        return decoder.decode_list(webhook.Webhook, list_wh, _app=self._app)
 
 
 PartialChannel = Channel
@@ -213,9 +333,6 @@ class ChannelMention(discord_types.DiscordDataClass):
     type: discord_types.ChannelType
     name: str
 
-    def __post_init__(self) -> None:
-        self.type = discord_types.ChannelType(self.type)
-
 
 @dataclass
 class EmbedThumbnail(discord_types.DiscordDataClass):
@@ -285,27 +402,6 @@ class Embed(discord_types.DiscordDataClass):
     author: Optional[EmbedAuthor] = None
     fields: Optional[List[EmbedField]] = None
 
-    def __post_init__(self) -> None:
-        if isinstance(self.type, str):
-            self.type = discord_types.EmbedType(self.type)
-        if isinstance(self.footer, dict):
-            self.footer = EmbedFooter(**self.footer)  # type: ignore[unreachable]
-        if isinstance(self.image, dict):
-            self.image = EmbedImage(**self.image)  # type: ignore[unreachable]
-        if isinstance(self.thumbnail, dict):
-            self.thumbnail = EmbedThumbnail(**self.thumbnail)  # type: ignore[unreachable]
-        if isinstance(self.video, dict):
-            self.video = EmbedVideo(**self.video)  # type: ignore[unreachable]
-        if isinstance(self.provider, dict):
-            self.provider = EmbedProvider(**self.provider)  # type: ignore[unreachable]
-        if isinstance(self.author, dict):
-            self.author = EmbedAuthor(**self.author)  # type: ignore[unreachable]
-        if isinstance(self.fields, list):
-            self.fields = [
-                EmbedField(**field) if isinstance(field, dict) else field
-                for field in self.fields
-            ]
-
 
 @dataclass
 class PartialAttachment(discord_types.DiscordDataClass):
@@ -335,19 +431,26 @@ class MessageComponent(discord_types.DiscordDataClass):
         'MessageComponentActionRow',
         'MessageComponentButton',
         'MessageComponentSelectMenu',
-        'MessageComponentTextInput'
+        'MessageComponentTextInput',
+        'MessageComponentUnknown'
     ]:
+        if cls is MessageComponent:
+            return cls._resolve_class(kwargs)(*args, **kwargs)  # type: ignore[no-any-return]
+        else:
+            return super(MessageComponent, cls).__new__(cls)  # type: ignore[return-value]
+
+    @classmethod
+    def _resolve_class(cls, payload: Dict[str, Any]) -> type:
+        """
+            Component class for a payload, by its type. MessageComponentUnknown for types the library doesn't know.
+        """
         CLASS_MAP = {
             discord_types.MessageComponentType.ACTION_ROW: MessageComponentActionRow,
             discord_types.MessageComponentType.BUTTON: MessageComponentButton,
             discord_types.MessageComponentType.SELECT_MENU: MessageComponentSelectMenu,
             discord_types.MessageComponentType.TEXT_INPUT: MessageComponentTextInput
         }
-        target = CLASS_MAP[kwargs['type']]
-        if cls is MessageComponent:
-            return target(*args, **kwargs)  # type: ignore[no-any-return]
-        else:
-            return super(MessageComponent, cls).__new__(cls)  # type: ignore[return-value]
+        return CLASS_MAP.get(payload.get('type'), MessageComponentUnknown)  # type: ignore[arg-type]
 
 
 @dataclass
@@ -356,10 +459,7 @@ class MessageComponentActionRow(MessageComponent):
     type: discord_types.MessageComponentType = discord_types.MessageComponentType.ACTION_ROW
 
     def __post_init__(self) -> None:
-        self.components = [
-            MessageComponent(component) if isinstance(component, dict) else component
-            for component in self.components
-        ]
+        super().__post_init__()
         if self.type != discord_types.MessageComponentType.ACTION_ROW:
             raise ValueError(f"type for {self.__class__.__name__} must be MessageComponentType.ACTION_ROW")
         self.type = discord_types.MessageComponentType.ACTION_ROW
@@ -376,12 +476,10 @@ class MessageComponentButton(MessageComponent):
     disabled: Optional[bool] = None
 
     def __post_init__(self) -> None:
-        self.style = discord_types.MessageComponentButtonStyle(self.style)
+        super().__post_init__()
         if self.type != discord_types.MessageComponentType.BUTTON:
             raise ValueError(f"type for {self.__class__.__name__} must be MessageComponentType.BUTTON")
         self.type = discord_types.MessageComponentType.BUTTON
-        if isinstance(self.emoji, dict):
-            self.emoji = emoji_module.Emoji(**self.emoji)  # type: ignore[unreachable]
 
 
 @dataclass
@@ -392,10 +490,6 @@ class MessageComponentSelectOption(discord_types.DiscordDataClass):
     description: Optional[str] = None
     emoji: Optional[emoji_module.Emoji] = None
 
-    def __post_init__(self) -> None:
-        if isinstance(self.emoji, dict):
-            self.emoji = emoji_module.Emoji(**self.emoji)  # type: ignore[unreachable]
-
 
 @dataclass
 class MessageComponentSelectMenu(MessageComponent):
@@ -408,20 +502,26 @@ class MessageComponentSelectMenu(MessageComponent):
     placeholder: Optional[str] = None
 
     def __post_init__(self) -> None:
-        self.options = [
-            MessageComponentSelectOption(**option) if isinstance(option, dict) else option
-            for option in self.options
-        ]
+        super().__post_init__()
         if self.type != discord_types.MessageComponentType.SELECT_MENU:
             raise ValueError(f"type for {self.__class__.__name__} must be MessageComponentType.SELECT_MENU")
         self.type = discord_types.MessageComponentType.SELECT_MENU
 
 
+@dataclass
+class MessageComponentUnknown(MessageComponent):
+    """
+        Component of a type added to Discord after this library. Only its type is kept.
+    """
+    type: int
+
+
 @dataclass
 class MessageComponentTextInput(MessageComponent):
     custom_id: str
-    style: discord_types.MessageComponentTextInputStyle
-    label: str
+    # style and label are required when sending a modal, but not given in submitted modals.
+    style: Optional[discord_types.MessageComponentTextInputStyle] = None
+    label: Optional[str] = None
     type: discord_types.MessageComponentType = discord_types.MessageComponentType.TEXT_INPUT
     min_length: Optional[int] = None
     max_length: Optional[int] = None
@@ -430,7 +530,7 @@ class MessageComponentTextInput(MessageComponent):
     placeholder: Optional[str] = None
 
     def __post_init__(self) -> None:
-        self.style = discord_types.MessageComponentTextInputStyle(self.style)
+        super().__post_init__()
         if self.type != discord_types.MessageComponentType.TEXT_INPUT:
             raise ValueError(f"type for {self.__class__.__name__} must be MessageComponentType.TEXT_INPUT")
         self.type = discord_types.MessageComponentType.TEXT_INPUT
@@ -452,13 +552,6 @@ class MessageInteraction(discord_types.DiscordDataClass):
     user: 'user_module.User'
     member: Optional['guild.PartialGuildMember'] = None
 
-    def __post_init__(self) -> None:
-        self.type = discord_types.InteractionType(self.type)
-        if isinstance(self.user, dict):
-            self.user = user_module.User(**self.user)  # type: ignore[unreachable]
-        if isinstance(self.member, dict):
-            self.member = guild.PartialGuildMember(**self.member)  # type: ignore[unreachable]
-
 
 @dataclass
 class Reaction(discord_types.DiscordDataClass):
@@ -473,6 +566,7 @@ class MessageActivity(discord_types.DiscordDataClass):
     party_id: Optional[str] = None
 
 
+@discord_types.slots
 @dataclass
 class Message(discord_types.DiscordDataClass):
     id: discord_types.Snowflake
@@ -512,66 +606,6 @@ class Message(discord_types.DiscordDataClass):
     _app: Optional['application_module.Application'] = None
     _valid: bool = True
 
-    def __post_init__(self) -> None:
-        self.mentions = [
-            user_module.User(**u) if isinstance(u, dict) else u
-            for u in self.mentions
-        ]
-        self.mention_roles = [
-            guild.Role(**role) if isinstance(role, dict) else role
-            for role in self.mention_roles
-        ]
-        self.attachments = [
-            Attachment(**attachment) if isinstance(attachment, dict) else attachment
-            for attachment in self.attachments
-        ]
-        self.embeds = [
-            Embed(**embed) if isinstance(embed, dict) else embed
-            for embed in self.embeds
-        ]
-        self.type = discord_types.MessageType(self.type)
-        if isinstance(self.author, dict):
-            self.author = user_module.User(**self.author)  # type: ignore[unreachable]
-        if isinstance(self.member, dict):
-            self.member = guild.PartialGuildMember(**self.member)  # type: ignore[unreachable]
-        if isinstance(self.mention_channels, list):
-            self.mention_channels = [
-                channel.ChannelMention(**cm) if isinstance(cm, dict) else cm
-                for cm in self.mention_channels
-            ]
-        if isinstance(self.reactions, list):
-            self.reactions = [
-                Reaction(**reaction) if isinstance(reaction, dict) else reaction
-                for reaction in self.reactions
-            ]
-        if isinstance(self.flags, int):
-            self.flags = discord_types.MessageFlags(self.flags)
-        if isinstance(self.message_reference, dict):
-            self.message_reference = MessageReference(**self.message_reference)  # type: ignore[unreachable]
-        if isinstance(self.referenced_message, dict):
-            self.referenced_message = Message(**self.referenced_message)  # type: ignore[unreachable]
-        if isinstance(self.interaction, dict):
-            self.interaction = MessageInteraction(**self.interaction)  # type: ignore[unreachable]
-        if isinstance(self.thread, dict):
-            self.thread = channel.Channel(**self.thread)  # type: ignore[unreachable]
-        if isinstance(self.components, list):
-            self.components = [
-                MessageComponent(**component) if isinstance(component, dict) else component
-                for component in self.components
-            ]
-        if isinstance(self.activity, dict):
-            self.activity = MessageActivity(**self.activity)  # type: ignore[unreachable]
-        if isinstance(self.sticker_items, list):
-            self.sticker_items = [
-                sticker.StickerItem(**item) if isinstance(item, dict) else item
-                for item in self.sticker_items
-            ]
-        if isinstance(self.stickers, list):
-            self.stickers = [
-                sticker.Sticker(**stkr) if isinstance(stkr, dict) else stkr
-                for stkr in self.stickers  # name as stkr due to imported mudule name also called sticker
-            ]
-
     def delete(self) -> None:
         """
             Detele this message.
@@ -586,6 +620,7 @@ class Message(discord_types.DiscordDataClass):
                 f"/channels/{self.channel_id}/messages/{self.id}"
             )
             self._valid = False
+            self._app._invalidate_entity(Message, self.id)
 
     def edit(
         self,
@@ -622,20 +657,19 @@ class Message(discord_types.DiscordDataClass):
                 f"/channels/{self.channel_id}/messages/{self.id}",
                 json=msg_dict
             )
-            new_msg = Message(_app=self._app, **msg_json)
-            self.__dict__.update(new_msg.__dict__)
+            new_msg = decoder.decode(Message, msg_json, _app=self._app)
+            self._update_from(new_msg)
+            self._app._cache_entity(self)
 
-    def get_channel(self) -> Channel:
+    def get_channel(self, fields: Optional[Iterable[str]] = None) -> Channel:
         """
             Get Channel object where this message is in.
+
+            :param fields: Only decode these fields, see :py:meth:`application.Application.get_channel`.
         """
         if self._app is None:
             raise RuntimeError("self._app not found")
-        chn_info, _ = self._app.call_api(
-            "GET",
-            f"/channels/{self.channel_id}"
-        )
-        return Channel(_app=self._app, **chn_info)
+        return self._app.get_channel(self.channel_id, fields)
 
 
 @dataclass
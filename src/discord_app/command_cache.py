@@ -0,0 +1,98 @@
+"""
+    Content hash of command specs, and a file remembering the specs last registered.
+
+    Lets an application skip fetching and comparing registered commands at startup
+    when no command has changed since the previous run.
+"""
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from typing import Any, Dict, Optional
+
+
+GLOBAL_SCOPE = "global"
+
+
+def scope_key(guild_id: Optional[Any]) -> str:
+    """
+        Cache scope of a command: "global", or the guild id for guild commands.
+    """
+    return GLOBAL_SCOPE if guild_id is None else str(guild_id)
+
+
+def spec_hash(spec: Dict[str, Any]) -> str:
+    """
+        SHA-256 of a command spec, as sent to Discord.
+
+        Keys are sorted so the hash doesn't depend on attribute order. Lists keep their order,
+        as the order of options and choices is part of the spec.
+    """
+    canonical = json.dumps(spec, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class RegistrationCache():
+    """
+        Hashes of the last registered command specs by scope and command name, stored in a JSON file.
+
+        The cache only knows what this application registered. Delete the file after changing
+        commands by other means (another deployment, Discord developer portal...).
+
+        :param str path: Cache file path.
+        :param application_id: Files written for another application are ignored.
+    """
+
+    def __init__(self, path: str, application_id: Any) -> None:
+        self.path = path
+        self.application_id = str(application_id)
+        self._lock = threading.Lock()
+        self._scopes: Dict[str, Dict[str, str]] = self._load()
+
+    def _load(self) -> Dict[str, Dict[str, str]]:
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("application_id") != self.application_id:
+            return {}
+        scopes = data.get("scopes")
+        return scopes if isinstance(scopes, dict) else {}
+
+    def get(self, scope: str, name: str) -> Optional[str]:
+        with self._lock:
+            return self._scopes.get(scope, {}).get(name)
+
+    def scope(self, scope: str) -> Dict[str, str]:
+        """
+            Hashes of every command cached in scope.
+        """
+        with self._lock:
+            return dict(self._scopes.get(scope, {}))
+
+    def set(self, scope: str, name: str, digest: str) -> None:
+        with self._lock:
+            self._scopes.setdefault(scope, {})[name] = digest
+            self._save()
+
+    def replace_scope(self, scope: str, hashes: Dict[str, str]) -> None:
+        """
+            Replace every command of scope, as done by a bulk overwrite.
+        """
+        with self._lock:
+            self._scopes[scope] = dict(hashes)
+            self._save()
+
+    def _save(self) -> None:
+        # Written to a temporary file first so that concurrently starting workers never read a partial file.
+        directory = os.path.dirname(os.path.abspath(self.path))
+        (fd, temp_path) = tempfile.mkstemp(dir=directory, prefix=".commands-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"application_id": self.application_id, "scopes": self._scopes}, f)
+            os.replace(temp_path, self.path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
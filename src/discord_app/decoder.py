@@ -0,0 +1,497 @@
+"""
+    Conversion of Discord API payloads into DiscordDataClass objects.
+
+    Converters are generated once per class from its type hints: nested objects, lists and
+    mappings of objects, and enums are converted in one pass. Keys not defined by the class
+    are ignored by decode, so attributes added to the API don't break parsing.
+"""
+import dataclasses
+import enum
+import inspect
+import types
+import typing
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple, Type, TypeVar
+
+from . import discord_types
+from . import lazy
+
+
+T = TypeVar("T")
+
+_decoders: Dict[type, Callable[[Dict[str, Any]], Any]] = {}
+_projections: Dict[Tuple[type, FrozenSet[str]], Callable[[Dict[str, Any]], Any]] = {}
+_normalizers: Dict[type, Callable[[Any], None]] = {}
+_missing = object()
+# Objects of classes with more fields get their __dict__ from a copy of the default values.
+_BULK_FIELDS = 16
+
+
+class EnumTable():
+    """
+        Lookup of enum members by value, faster than calling the enum class.
+
+        Members are looked up in a dict built once per class. Other values are converted
+        once, then cached up to cache_size of them: combined flags become pseudo-members,
+        and values added to the API after the enum was written are kept as they are.
+
+        :param enum_cls: Enum or flag class.
+        :param int cache_size: Maximum number of non-member values remembered.
+    """
+
+    def __init__(self, enum_cls: Type[enum.Enum], cache_size: int = 256) -> None:
+        self.enum_cls = enum_cls
+        self.cache_size = cache_size
+        self.members: Dict[Any, Any] = {member.value: member for member in enum_cls.__members__.values()}
+        self._member_count = len(self.members)
+
+    def __call__(self, value: Any) -> Any:
+        member = self.members.get(value, _missing)
+        if member is _missing:
+            return self.convert(value)
+        return member
+
+    def convert(self, value: Any) -> Any:
+        """
+            Convert a value which is not in the table yet.
+        """
+        try:
+            member = self.enum_cls(value)
+        except ValueError:
+            member = value
+        if len(self.members) - self._member_count < self.cache_size:
+            self.members[value] = member
+        return member
+
+
+_enum_tables: Dict[type, EnumTable] = {}
+
+
+def enum_table(enum_cls: Type[enum.Enum]) -> EnumTable:
+    """
+        Get the shared EnumTable of enum_cls.
+    """
+    table = _enum_tables.get(enum_cls)
+    if table is None:
+        table = _enum_tables[enum_cls] = EnumTable(enum_cls)
+    return table
+
+
+def _to_snowflake(value: Any) -> Any:
+    if value.__class__ is str:
+        try:
+            return int.__new__(discord_types.Snowflake, value)
+        except ValueError:
+            pass
+    return value
+
+
+def _to_snowflakes(value: Any) -> Any:
+    if value.__class__ is list and any(x.__class__ is str for x in value):
+        return [_to_snowflake(x) for x in value]
+    return value
+
+
+def _unwrap_optional(hint: Any) -> Any:
+    if typing.get_origin(hint) is typing.Union:
+        types = [arg for arg in typing.get_args(hint) if arg is not type(None)]
+        if len(types) == 1:
+            return types[0]
+    return hint
+
+
+def _is_self(hint: Any) -> bool:
+    return repr(hint) in ("typing.Self", "typing_extensions.Self")
+
+
+def _late_decoder(namespace: Dict[str, Any], name: str, cls: type) -> Callable[[Dict[str, Any]], Any]:
+    """
+        Placeholder for the decoder of cls in generated code, replaced by the decoder on first call.
+
+        Classes may refer to each other (or themselves), so decoders can't be generated up front.
+    """
+    def first_call(payload: Dict[str, Any]) -> Any:
+        namespace[name] = get_decoder(cls)
+        return namespace[name](payload)
+    return first_call
+
+
+def _converter(hint: Any, owner: type) -> Optional[Callable[[Any], Any]]:
+    """
+        Build the function converting a raw value of type hint.
+
+        :return: None if values of this type are used as they are.
+    """
+    hint = _unwrap_optional(hint)
+    origin = typing.get_origin(hint)
+    args = typing.get_args(hint)
+    if origin is list:
+        item = _converter(args[0], owner) if args else None
+        if item is None:
+            return None
+
+        def convert_list(value: Any) -> Any:
+            if value.__class__ is list:
+                return [item(x) for x in value]  # type: ignore[misc]
+            return value
+        return convert_list
+    if origin is dict:
+        mapped = _converter(args[1], owner) if len(args) == 2 else None
+        if mapped is None:
+            return None
+
+        def convert_dict(value: Any) -> Any:
+            if value.__class__ is dict:
+                return {k: mapped(v) for (k, v) in value.items()}  # type: ignore[misc]
+            return value
+        return convert_dict
+    if _is_self(hint):
+        hint = owner
+    if not isinstance(hint, type):
+        # Unions of several types can't be told apart, they are kept as they are.
+        return None
+    if hint is discord_types.Snowflake:
+        return _to_snowflake
+    if issubclass(hint, enum.Enum):
+        enum_cls = hint
+        table = enum_table(hint)
+
+        def convert_enum(value: Any) -> Any:
+            if value.__class__ is enum_cls or value is None:
+                return value
+            return table(value)
+        return convert_enum
+    if dataclasses.is_dataclass(hint):
+        dataclass_cls = hint
+
+        def convert_dataclass(value: Any) -> Any:
+            if value.__class__ is dict:
+                return get_decoder(dataclass_cls)(value)
+            return value
+        return convert_dataclass
+    return None
+
+
+def _snowflake_converter(hint: Any) -> Optional[Callable[[Any], Any]]:
+    """
+        :return: The conversion of a Snowflake or List[Snowflake] field, None for other types.
+    """
+    hint = _unwrap_optional(hint)
+    if typing.get_origin(hint) is list and typing.get_args(hint):
+        if _unwrap_optional(typing.get_args(hint)[0]) is discord_types.Snowflake:
+            return _to_snowflakes
+    elif hint is discord_types.Snowflake:
+        return _to_snowflake
+    return None
+
+
+def _install_snowflake_fields(cls: type, hints: Dict[str, Any]) -> None:
+    """
+        Make the Snowflake and List[Snowflake] fields of cls convert their values on first access.
+    """
+    for f in _converted_fields(cls):
+        convert = _snowflake_converter(hints.get(f.name))
+        attribute = inspect.getattr_static(cls, f.name, None)
+        if convert is None or isinstance(attribute, lazy.SnowflakeField):
+            continue
+        slot = attribute if isinstance(attribute, types.MemberDescriptorType) else None
+        setattr(cls, f.name, lazy.SnowflakeField(f.name, convert, slot))
+
+
+def _conversion_lines(i: int, hint: Any, owner: type, namespace: Dict[str, Any]) -> List[str]:
+    """
+        Generate the code converting "value", a raw value of type hint.
+    """
+    hint = _unwrap_optional(hint)
+    if _is_self(hint):
+        hint = owner
+    if _snowflake_converter(hint) is not None:
+        # Converted on first access by lazy.SnowflakeField
+        return []
+    if isinstance(hint, type) and issubclass(hint, enum.Enum):
+        # Table lookup is inlined, most values are members.
+        table = enum_table(hint)
+        namespace.update({f"_enum{i}": hint, f"_lookup{i}": table.members.get, f"_convert{i}": table.convert})
+        return [
+            f"    if value is not None and value.__class__ is not _enum{i}:",
+            f"        member = _lookup{i}(value, _missing)",
+            f"        value = _convert{i}(value) if member is _missing else member"
+        ]
+    if isinstance(hint, type) and dataclasses.is_dataclass(hint):
+        namespace[f"_decode{i}"] = _late_decoder(namespace, f"_decode{i}", hint)
+        return [
+            "    if value.__class__ is dict:",
+            f"        value = _decode{i}(value)"
+        ]
+    item_hint = _unwrap_optional(typing.get_args(hint)[0]) if typing.get_origin(hint) is list else None
+    if _is_self(item_hint):
+        item_hint = owner
+    if isinstance(item_hint, type) and issubclass(item_hint, enum.Enum):
+        namespace[f"_table{i}"] = enum_table(item_hint)
+        return [
+            "    if value.__class__ is list:",
+            f"        value = [_table{i}(x) for x in value]"
+        ]
+    if isinstance(item_hint, type) and dataclasses.is_dataclass(item_hint):
+        namespace[f"_decode{i}"] = _late_decoder(namespace, f"_decode{i}", item_hint)
+        return [
+            "    if value.__class__ is list:",
+            f"        value = [_decode{i}(x) if x.__class__ is dict else x for x in value]"
+        ]
+    convert = _converter(hint, owner)
+    if convert is None:
+        return []
+    namespace[f"_convert{i}"] = convert
+    return [
+        "    if value is not None:",
+        f"        value = _convert{i}(value)"
+    ]
+
+
+def _converted_fields(cls: type) -> List[dataclasses.Field]:  # type: ignore[type-arg]
+    """
+        Fields converted according to their type hints: fields for application use
+        (with a underscore as the first character of their name) and lazy fields are left alone.
+    """
+    return [
+        f for f in dataclasses.fields(cls)
+        if f.name[0] != "_" and not isinstance(inspect.getattr_static(cls, f.name, None), lazy.LazyField)
+    ]
+
+
+def _compile_normalizer(cls: type) -> Callable[[Any], None]:
+    hints = typing.get_type_hints(cls)
+    _install_snowflake_fields(cls, hints)
+    lines = ["def normalize(obj):"]
+    namespace: Dict[str, Any] = {"_missing": _missing}
+    for (i, f) in enumerate(_converted_fields(cls)):
+        conversion = _conversion_lines(i, hints.get(f.name), cls, namespace)
+        if conversion:
+            lines += [f"    value = obj.{f.name}", *conversion, f"    obj.{f.name} = value"]
+    lines.append("    return None")
+    exec("\n".join(lines), namespace)
+    normalize: Callable[[Any], None] = namespace["normalize"]
+    return normalize
+
+
+def _has_own_post_init(cls: type) -> bool:
+    """
+        Test if cls does more in __post_init__ than converting its attributes.
+    """
+    return getattr(cls, "__post_init__", None) not in (None, discord_types.DiscordDataClass.__post_init__)
+
+
+def _has_instance_dict(cls: type) -> bool:
+    """
+        Test if attributes of cls objects are all stored in their __dict__.
+    """
+    if not any("__dict__" in vars(base) for base in cls.__mro__):
+        return False
+    return not any(isinstance(inspect.getattr_static(cls, f.name, None), lazy.LazyField) for f in dataclasses.fields(cls))
+
+
+def _assignment(i: int, cls: type, name: str, namespace: Dict[str, Any]) -> str:
+    """
+        Generate the code setting attribute name of obj to "value".
+    """
+    attribute = inspect.getattr_static(cls, name, None)
+    if isinstance(attribute, lazy.SnowflakeField):
+        # The raw value is stored directly, the descriptor would only pass it on.
+        if attribute.slot is None:
+            return f"    obj.__dict__[{name!r}] = value"
+        namespace[f"_store{i}"] = attribute.slot.__set__
+        return f"    _store{i}(obj, value)"
+    return f"    obj.{name} = value"
+
+
+def _compile_decoder(cls: type) -> Callable[[Dict[str, Any]], Any]:
+    hints = typing.get_type_hints(cls)
+    _install_snowflake_fields(cls, hints)
+    fields = dataclasses.fields(cls)
+    converted = {f.name for f in _converted_fields(cls)}
+    namespace: Dict[str, Any] = {
+        "cls": cls,
+        "_new": object.__new__,
+        "_missing": _missing,
+        "_missing_attributes": _missing_attributes
+    }
+    lines = ["def decode(payload):"]
+    if "_resolve_class" in vars(cls):
+        # Polymorphic base class, the actual class depends on the payload.
+        namespace["_get_decoder"] = get_decoder
+        lines += [
+            "    target = cls._resolve_class(payload)",
+            "    if target is not cls:",
+            "        return _get_decoder(target)(payload)"
+        ]
+    namespace["_required"] = frozenset(
+        f.name for f in fields if f.default is dataclasses.MISSING and f.default_factory is dataclasses.MISSING
+    )
+    lines.append("    obj = _new(cls)")
+    if _has_instance_dict(cls) and len(fields) > _BULK_FIELDS:
+        # Attributes are copied into __dict__ all at once, then converted where needed.
+        # Fields without a default value are _missing until the payload sets them: the number of
+        # attributes is only wrong when the payload has unknown keys.
+        namespace["_defaults"] = {f.name: _missing if f.default is dataclasses.MISSING else f.default for f in fields}
+        namespace["_names"] = frozenset(f.name for f in fields)
+        lines += [
+            "    attributes = _defaults.copy()",
+            "    attributes.update(payload)",
+            f"    if len(attributes) != {len(fields)}:",
+            "        for name in payload.keys() - _names:",
+            "            del attributes[name]"
+        ]
+        if namespace["_required"]:
+            required = " or ".join(f"attributes[{name!r}] is _missing" for name in sorted(namespace["_required"]))
+            lines += [f"    if {required}:", "        _missing_attributes(cls, payload, _required)"]
+        for (i, f) in enumerate(fields):
+            if f.default_factory is not dataclasses.MISSING:  # type: ignore[misc]
+                namespace[f"_factory{i}"] = f.default_factory  # type: ignore[misc]
+                lines.append(f"    if attributes[{f.name!r}] is _missing: attributes[{f.name!r}] = _factory{i}()")
+            if f.name in converted:
+                conversion = _conversion_lines(i, hints.get(f.name), cls, namespace)
+                if conversion:
+                    lines += [f"    value = attributes[{f.name!r}]", *conversion, f"    attributes[{f.name!r}] = value"]
+        lines.append("    obj.__dict__ = attributes")
+    else:
+        # Fields are looked up in the payload one by one, unknown keys are never read.
+        # Setting them one by one is faster than building a __dict__ when there are few of them.
+        # A missing required field raises KeyError, reported like a missing constructor argument.
+        body = []
+        for (i, f) in enumerate(fields):
+            if f.default is not dataclasses.MISSING:
+                namespace[f"_default{i}"] = f.default
+                body.append(f"    value = payload[{f.name!r}] if {f.name!r} in payload else _default{i}")
+            elif f.default_factory is not dataclasses.MISSING:  # type: ignore[misc]
+                namespace[f"_factory{i}"] = f.default_factory  # type: ignore[misc]
+                body.append(f"    value = payload[{f.name!r}] if {f.name!r} in payload else _factory{i}()")
+            else:
+                body.append(f"    value = payload[{f.name!r}]")
+            if f.name in converted:
+                body += _conversion_lines(i, hints.get(f.name), cls, namespace)
+            body.append(_assignment(i, cls, f.name, namespace))
+        if body:
+            lines += [
+                "    try:",
+                *(f"    {line}" for line in body),
+                "    except KeyError:",
+                "        _missing_attributes(cls, payload, _required)",
+                "        raise"
+            ]
+    if _has_own_post_init(cls):
+        lines.append("    obj.__post_init__()")
+    lines.append("    return obj")
+    exec("\n".join(lines), namespace)
+    decode: Callable[[Dict[str, Any]], Any] = namespace["decode"]
+    decode.__qualname__ = f"{cls.__qualname__}.decode"
+    return decode
+
+
+def _compile_projection(cls: type, names: FrozenSet[str]) -> Callable[[Dict[str, Any]], Any]:
+    """
+        Generate the decoder of the named fields of cls. Other fields are set to their default, or None.
+        Fields for application use (_app...) are taken from the payload.
+    """
+    hints = typing.get_type_hints(cls)
+    _install_snowflake_fields(cls, hints)
+    fields = dataclasses.fields(cls)
+    unknown = names - {f.name for f in fields}
+    if unknown:
+        raise ValueError(f"{cls.__name__} has no field {', '.join(sorted(unknown))}")
+    converted = {f.name for f in _converted_fields(cls)}
+    namespace: Dict[str, Any] = {"cls": cls, "_new": object.__new__, "_missing": _missing}
+    lines = ["def decode(payload):", "    obj = _new(cls)", "    get = payload.get"]
+    for (i, f) in enumerate(fields):
+        if f.default is not dataclasses.MISSING:
+            namespace[f"_default{i}"] = f.default
+            default = f"_default{i}"
+        elif f.default_factory is not dataclasses.MISSING:  # type: ignore[misc]
+            namespace[f"_factory{i}"] = f.default_factory  # type: ignore[misc]
+            default = f"_factory{i}()"
+        else:
+            default = "None"
+        if f.name in names or f.name == "id" or f.name[0] == "_":
+            lines.append(f"    value = get({f.name!r}, _missing)")
+            lines.append(f"    if value is _missing: value = {default}")
+            if f.name in converted:
+                lines += _conversion_lines(i, hints.get(f.name), cls, namespace)
+        else:
+            lines.append(f"    value = {default}")
+        lines.append(f"    obj.{f.name} = value")
+    lines.append("    return obj")
+    exec("\n".join(lines), namespace)
+    decode: Callable[[Dict[str, Any]], Any] = namespace["decode"]
+    decode.__qualname__ = f"{cls.__qualname__}.decode_fields"
+    return decode
+
+
+def _missing_attributes(cls: type, payload: Dict[str, Any], required: frozenset) -> None:  # type: ignore[type-arg]
+    missing = required - payload.keys()
+    if missing:
+        raise TypeError(f"{cls.__name__} missing required argument: {', '.join(sorted(missing))}")
+
+
+def get_decoder(cls: Type[T]) -> Callable[[Dict[str, Any]], T]:
+    """
+        Get the function creating a cls object from a payload.
+    """
+    decoder = _decoders.get(cls)
+    if decoder is None:
+        decoder = _decoders[cls] = _compile_decoder(cls)
+    return decoder
+
+
+def decode(cls: Type[T], payload: Dict[str, Any], **kwargs: Any) -> T:
+    """
+        Create a cls object from an API payload, ignoring keys cls doesn't define.
+
+        :param payload: Decoded JSON object.
+        :param kwargs: Additional attributes, e.g. _app.
+        :raises TypeError: A required attribute is missing.
+    """
+    if kwargs:
+        payload = {**payload, **kwargs}
+    return get_decoder(cls)(payload)
+
+
+def decode_fields(cls: Type[T], payload: Dict[str, Any], fields: Iterable[str], **kwargs: Any) -> T:
+    """
+        Create a cls object from an API payload, decoding only the named fields (and id).
+
+        Other attributes are set to their default value, or None, whether they are required or not,
+        and nothing is checked: the object is only meant for reading these fields.
+        Nested objects in the named fields are decoded entirely.
+
+        :param fields: Names of the fields to decode.
+        :param kwargs: Additional attributes, e.g. _app.
+        :raises ValueError: cls has no such field.
+    """
+    if "_resolve_class" in vars(cls):
+        cls = cls._resolve_class(payload)  # type: ignore[attr-defined]
+    names = frozenset(fields)
+    decoder = _projections.get((cls, names))
+    if decoder is None:
+        decoder = _projections[(cls, names)] = _compile_projection(cls, names)
+    if kwargs:
+        payload = {**payload, **kwargs}
+    return decoder(payload)  # type: ignore[no-any-return]
+
+
+def decode_list(cls: Type[T], payloads: List[Dict[str, Any]], **kwargs: Any) -> List[T]:
+    """
+        Decode every item of payloads.
+    """
+    decoder = get_decoder(cls)
+    if kwargs:
+        return [decoder({**payload, **kwargs}) for payload in payloads]
+    return [decoder(payload) for payload in payloads]
+
+
+def normalize(obj: Any) -> None:
+    """
+        Convert raw values in the attributes of a dataclass object, according to its type hints.
+    """
+    cls = obj.__class__
+    normalizer = _normalizers.get(cls)
+    if normalizer is None:
+        normalizer = _normalizers[cls] = _compile_normalizer(cls)
+    normalizer(obj)
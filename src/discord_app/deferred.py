@@ -0,0 +1,125 @@
+"""
+    Background execution of slow command handlers.
+
+    Discord expects an answer to an interaction within 3 seconds. Deferred commands are
+    answered with DEFERRED_CHANNEL_MESSAGE_WITH_SOURCE right away, while the handler runs
+    on a worker thread. Its response is then delivered by editing the original response.
+"""
+import asyncio
+import concurrent.futures
+import inspect
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from . import interaction
+
+
+class DeferredExecutor():
+    """
+        Bounded thread pool running deferred command handlers.
+
+        :param int max_workers: Number of handlers running at the same time.
+        :param int max_queue: Maximum number of handlers waiting for a worker. Further interactions are rejected.
+        :param Optional[logging.Logger] logger: Where handler errors are logged.
+    """
+
+    def __init__(self, max_workers: int, max_queue: int, logger: Optional[logging.Logger] = None) -> None:
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._logger = logger or logging.getLogger(__name__)
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="discord_app_deferred"
+        )
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._running = 0
+        self._completed = 0
+        self._failed = 0
+        self._rejected = 0
+        self._wait_total = 0.0
+        self._latency_total = 0.0
+        self._latency_max = 0.0
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """
+            Queue depth, counters and latency (seconds from submission to delivery) of deferred handlers.
+        """
+        with self._lock:
+            finished = self._completed + self._failed
+            return {
+                "queued": self._queued,
+                "running": self._running,
+                "completed": self._completed,
+                "failed": self._failed,
+                "rejected": self._rejected,
+                "queue_wait_avg": self._wait_total / finished if finished else 0.0,
+                "latency_avg": self._latency_total / finished if finished else 0.0,
+                "latency_max": self._latency_max
+            }
+
+    def submit(
+        self,
+        function: Callable[[interaction.InteractionRequest], Any],
+        request_data: interaction.InteractionRequest
+    ) -> bool:
+        """
+            Run function with request_data on a worker thread and deliver its response.
+
+            :return: False if the queue is full and the handler won't run.
+        """
+        with self._lock:
+            if self._queued >= self.max_queue:
+                self._rejected += 1
+                return False
+            self._queued += 1
+        self._executor.submit(self._run, function, request_data, time.monotonic())
+        return True
+
+    def _run(
+        self,
+        function: Callable[[interaction.InteractionRequest], Any],
+        request_data: interaction.InteractionRequest,
+        submitted_at: float
+    ) -> None:
+        started_at = time.monotonic()
+        with self._lock:
+            self._queued -= 1
+            self._running += 1
+        failed = False
+        try:
+            response = function(request_data)
+            if inspect.isawaitable(response):
+                response = asyncio.run(_await(response))
+            if response is not None:
+                request_data.edit_original_response(response.data)
+        except Exception:
+            failed = True
+            self._logger.exception("Deferred handler '%s' failed.", getattr(function, "__name__", repr(function)))
+            try:
+                request_data.edit_original_response(interaction.InteractionResponseMessage(
+                    content="An error occurred while processing this command."
+                ))
+            except Exception:
+                self._logger.exception("Unable to report the failure of deferred handler.")
+        finished_at = time.monotonic()
+        with self._lock:
+            self._running -= 1
+            if failed:
+                self._failed += 1
+            else:
+                self._completed += 1
+            self._wait_total += started_at - submitted_at
+            latency = finished_at - submitted_at
+            self._latency_total += latency
+            self._latency_max = max(self._latency_max, latency)
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait)
+
+
+async def _await(awaitable: Any) -> Any:
+    return await awaitable
@@ -3,8 +3,16 @@
 
     Mostly enumerates and flags.
 """
+import dataclasses
 from dataclasses import dataclass
+import datetime
 from enum import Enum, IntEnum, IntFlag
+from typing import Any, Type, TypeVar
+
+from . import decoder
+
+
+T = TypeVar("T")
 
 
 #############################################################
@@ -12,12 +20,110 @@ from enum import Enum, IntEnum, IntFlag
 #############################################################
 
 
-Snowflake = str  # I know this is an int, but API returns as a str
+# Unix time of the first second of 2015 in milliseconds, the start of snowflake timestamps.
+DISCORD_EPOCH = 1420070400000
+
+
+class Snowflake(int):
+    """
+        Discord ID, a 64-bit integer.
+
+        The API transfers snowflakes as strings. A Snowflake is created from either form and is
+        serialized back to a string, but otherwise behaves as an integer: compare it with
+        integers (``user.id == 80351110224678912``), or convert it first (``str(user.id) == "80351110224678912"``).
+        Mappings keyed by snowflakes can be looked up with integers.
+
+        See https://discord.com/developers/docs/reference#snowflakes
+    """
+    __slots__ = ()
+
+    @property
+    def timestamp(self) -> int:
+        """
+            Creation time in milliseconds since unix epoch.
+        """
+        return (self >> 22) + DISCORD_EPOCH
+
+    @property
+    def created_at(self) -> datetime.datetime:
+        """
+            Creation time (UTC).
+        """
+        return datetime.datetime.fromtimestamp(self.timestamp / 1000, tz=datetime.timezone.utc)
+
+    @property
+    def worker_id(self) -> int:
+        return (self >> 17) & 0x1F
+
+    @property
+    def process_id(self) -> int:
+        return (self >> 12) & 0x1F
+
+    @property
+    def increment(self) -> int:
+        """
+            Sequence number of IDs generated by the same process within a millisecond.
+        """
+        return self & 0xFFF
+
+    @classmethod
+    def from_datetime(cls, time: datetime.datetime) -> 'Snowflake':
+        """
+            The smallest snowflake created at time, e.g. for "before" and "after" parameters of API calls.
+        """
+        return cls((int(time.timestamp() * 1000) - DISCORD_EPOCH) << 22)
 
 
 @dataclass
 class DiscordDataClass():
-    pass
+    # Subclasses decorated with slots() store their attributes without a __dict__.
+    __slots__ = ()
+
+    def __post_init__(self) -> None:
+        # Nested objects, lists of objects and enums are converted according to type hints.
+        decoder.normalize(self)
+
+    def _update_from(self, other: 'DiscordDataClass') -> None:
+        """
+            Replace every attribute of this object with those of other, e.g. after the object is edited.
+        """
+        for f in dataclasses.fields(other):
+            setattr(self, f.name, getattr(other, f.name))
+
+
+def slots(cls: Type[T]) -> Type[T]:
+    """
+        Class decorator storing attributes of a dataclass in __slots__ instead of a __dict__.
+
+        Same as ``@dataclass(slots=True)``, which is only available since Python 3.10.
+        Apply it above ``@dataclass``. Base classes must be slotted as well for the object
+        to have no __dict__.
+
+        ```
+        @slots
+        @dataclass
+        class User(DiscordDataClass):
+            ...
+        ```
+    """
+    inherited = {name for base in cls.__mro__[1:] for name in getattr(base, "__slots__", ())}
+    names = tuple(f.name for f in dataclasses.fields(cls) if f.name not in inherited)  # type: ignore[arg-type]
+    namespace = dict(vars(cls))
+    for name in names:
+        # Default values are kept by the dataclass, they would conflict with slot descriptors.
+        namespace.pop(name, None)
+    namespace.pop("__dict__", None)
+    namespace.pop("__weakref__", None)
+    namespace["__slots__"] = names
+    slotted: Type[T] = type(cls)(cls.__name__, cls.__bases__, namespace)  # type: ignore[misc]
+    slotted.__qualname__ = cls.__qualname__
+    # Methods using super() without arguments refer to the class through a __class__ cell.
+    for value in namespace.values():
+        function: Any = getattr(value, "__func__", value)
+        for cell in getattr(function, "__closure__", None) or ():
+            if cell.cell_contents is cls:
+                cell.cell_contents = slotted
+    return slotted
 
 
 #############################################################
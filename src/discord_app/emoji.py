@@ -5,6 +5,7 @@ from . import discord_types
 from . import user as user_module
 
 
+@discord_types.slots
 @dataclass
 class Emoji(discord_types.DiscordDataClass):
     id: discord_types.Snowflake
@@ -15,7 +16,3 @@ class Emoji(discord_types.DiscordDataClass):
     managed: Optional[bool] = None
     animated: Optional[bool] = None
     available: Optional[bool] = None
-
-    def __post_init__(self) -> None:
-        if isinstance(self.user, dict):
-            self.user = user_module.User(**self.user)  # type: ignore[unreachable]
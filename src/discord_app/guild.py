@@ -2,6 +2,7 @@
 from dataclasses import dataclass
 from typing import List, Optional, Any
 
+from . import decoder
 from . import discord_types
 from . import user as user_module
 from . import emoji
@@ -23,6 +24,7 @@ class RoleTags(discord_types.DiscordDataClass):
     premium_subscriber: Optional[Any] = None
 
 
+@discord_types.slots
 @dataclass
 class Role(discord_types.DiscordDataClass):
     """
@@ -40,17 +42,13 @@ class Role(discord_types.DiscordDataClass):
     unicode_emoji: Optional[str] = None
     tags: Optional[RoleTags] = None
 
-    def __post_init__(self) -> None:
-        if isinstance(self.tags, dict):
-            self.tags = RoleTags(**self.tags)  # type: ignore[unreachable]
-
 
 @dataclass
 class WelcomeScreenChannel(discord_types.DiscordDataClass):
     channel_id: discord_types.Snowflake
     description: str
     emoji_id: discord_types.Snowflake
-    emoji_name: discord_types.Snowflake
+    emoji_name: Optional[str]
 
 
 @dataclass
@@ -58,12 +56,6 @@ class WelcomeScreen(discord_types.DiscordDataClass):
     description: str
     welcome_channels: List[WelcomeScreenChannel]
 
-    def __post_init__(self) -> None:
-        self.welcome_channels = [
-            WelcomeScreenChannel(**wsc) if isinstance(wsc, dict) else wsc
-            for wsc in self.welcome_channels
-        ]
-
 
 @dataclass
 class PartialGuild(discord_types.DiscordDataClass):
@@ -74,19 +66,6 @@ class PartialGuild(discord_types.DiscordDataClass):
     default_message_notifications: discord_types.DefaultMessageNotificationLevel
     explicit_content_filter: discord_types.ExplicitContentFilterLevel
 
-    def __post_init__(self) -> None:
-        self.roles = [
-            Role(**r) if isinstance(r, dict) else r
-            for r in self.roles
-        ]
-        self.channels = [
-            channel.Channel(**c) if isinstance(c, dict) else c
-            for c in self.channels
-        ]
-        self.verification_level = discord_types.VerificationLevel(self.verification_level)
-        self.default_message_notifications = discord_types.DefaultMessageNotificationLevel(self.default_message_notifications)
-        self.explicit_content_filter = discord_types.ExplicitContentFilterLevel(self.explicit_content_filter)
-
 
 @dataclass
 class Guild(PartialGuild):
@@ -139,58 +118,6 @@ class Guild(PartialGuild):
 
     _app: Optional['application.Application'] = None
 
-    def __post_init__(self) -> None:
-        super().__post_init__()
-        self.emojis = [
-            emoji.Emoji(**e) if isinstance(e, dict) else e
-            for e in self.emojis
-        ]
-        self.features = [
-            discord_types.GuildFeature(f) if isinstance(f, str) else f
-            for f in self.features
-        ]
-        self.mfa_level = discord_types.MFALevel(self.mfa_level)
-        self.system_channel_flags = discord_types.SystemChannelFlags(self.system_channel_flags)
-        self.premium_tier = discord_types.GuildPremiumTier(self.premium_tier)
-        self.nsfw_level = discord_types.GuildNSFWLevel(self.nsfw_level)
-        if isinstance(self.voice_states, list):
-            self.voice_states = [
-                voice.PartialVoiceState(**vs) if isinstance(vs, dict) else vs
-                for vs in self.voice_states
-            ]
-        if isinstance(self.members, list):
-            self.members = [
-                GuildMember(**gm) if isinstance(gm, dict) else gm
-                for gm in self.members
-            ]
-        if isinstance(self.threads, list):
-            self.threads = [
-                channel.Channel(**t) if isinstance(t, dict) else t
-                for t in self.threads
-            ]
-        if isinstance(self.welcome_screen, dict):
-            self.welcome_screen = WelcomeScreen(**self.welcome_screen)  # type: ignore[unreachable]
-        if isinstance(self.stage_instances, list):
-            self.stage_instances = [
-                stage_instance.StageInstance(**si) if isinstance(si, dict) else si
-                for si in self.stage_instances
-            ]
-        if isinstance(self.stickers, list):
-            self.stickers = [
-                sticker.Sticker(**s) if isinstance(s, dict) else s
-                for s in self.stickers
-            ]
-        if isinstance(self.guild_scheduled_events, list):
-            self.guild_scheduled_events = [
-                guild_scheduled_event.GuildScheduledEvent(**gse) if isinstance(gse, dict) else gse
-                for gse in self.guild_scheduled_events
-            ]
-        if isinstance(self.presences, list):
-            self.presences = [
-                presence.PresenceUpdateEvent(**p) if isinstance(p, dict) else p
-                for p in self.presences
-            ]
-
     def list_webhooks(self) -> List['webhook.Webhook']:
         """
         Get a list of webhooks that binded to this guild.
@@ -201,7 +128,7 @@ class Guild(PartialGuild):
             "GET",
             f"/guilds/{self.id}/webhooks"
         )
-        return [webhook.Webhook(_app=self._app, **wh) for wh in list_wh]
+        return decoder.decode_list(webhook.Webhook, list_wh, _app=self._app)
 
 
 @dataclass
@@ -218,20 +145,6 @@ class GuildPreview(discord_types.DiscordDataClass):
     description: str
     stickers: List[sticker.Sticker]
 
-    def __post_init__(self) -> None:
-        self.emojis = [
-            emoji.Emoji(**e) if isinstance(e, dict) else e
-            for e in self.emojis
-        ]
-        self.features = [
-            discord_types.GuildFeature(feature) if isinstance(feature, str) else feature
-            for feature in self.features
-        ]
-        self.stickers = [
-            sticker.Sticker(**s) if isinstance(s, dict) else s
-            for s in self.stickers
-        ]
-
 
 @dataclass
 class GuildWidgetSettings(discord_types.DiscordDataClass):
@@ -248,17 +161,8 @@ class GetGuildWidget(discord_types.DiscordDataClass):  # The name is not an typo
     members: List['user_module.PartialUser']  # The documentation show here uses partial user for some reason
     presence_count: int
 
-    def __post_init__(self) -> None:
-        self.channels = [
-            channel.PartialChannel(**c) if isinstance(c, dict) else c
-            for c in self.channels
-        ]
-        self.members = [
-            user_module.PartialUser(**m) if isinstance(m, dict) else m
-            for m in self.members
-        ]
-
 
+@discord_types.slots
 @dataclass
 class PartialGuildMember(discord_types.DiscordDataClass):
     """
@@ -278,6 +182,7 @@ class PartialGuildMember(discord_types.DiscordDataClass):
     is_pending: Optional[Any] = None
 
 
+@discord_types.slots
 @dataclass
 class GuildMember(PartialGuildMember):
     """
@@ -287,11 +192,6 @@ class GuildMember(PartialGuildMember):
     deaf: bool = False
     mute: bool = False
 
-    def __post_init__(self) -> None:
-        # Parent class didn't define __post_init__ function, no need to execute.
-        if isinstance(self.user, dict):
-            self.user = user_module.User(**self.user)  # type: ignore[unreachable]
-
 
 @dataclass
 class IntegrationAccount(discord_types.DiscordDataClass):
@@ -307,10 +207,6 @@ class IntegrationApplication(discord_types.DiscordDataClass):
     description: str
     bot: Optional['user_module.User']
 
-    def __post_init__(self) -> None:
-        if isinstance(self.bot, dict):
-            self.bot = user_module.User(**self.bot)  # type: ignore[unreachable]
-
 
 @dataclass
 class Integration(discord_types.DiscordDataClass):
@@ -330,22 +226,8 @@ class Integration(discord_types.DiscordDataClass):
     revoked: Optional[bool] = None
     application: Optional[IntegrationApplication] = None
 
-    def __post_init__(self) -> None:
-        if isinstance(self.account, dict):
-            self.account = IntegrationAccount(**self.account)  # type: ignore[unreachable]
-        if isinstance(self.expire_behavior, int):
-            self.expire_behavior = discord_types.IntegrationExpireBehavior(self.expire_behavior)
-        if isinstance(self.user, dict):
-            self.user = user_module.User(**self.user)  # type: ignore[unreachable]
-        if isinstance(self.application, dict):
-            self.application = IntegrationApplication(**self.application)  # type: ignore[unreachable]
-
 
 @dataclass
 class Ban(discord_types.DiscordDataClass):
     reason: str
     user: 'user_module.User'
-
-    def __post_init__(self) -> None:
-        if isinstance(self.user, dict):
-            self.user = user_module.User(**self.user)  # type: ignore[unreachable]
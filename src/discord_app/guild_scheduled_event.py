@@ -35,17 +35,10 @@ class GuildScheduledEvent(discord_types.DiscordDataClass):
     scheduled_end_time: Optional[str] = None
 
     def __post_init__(self) -> None:
-        self.privacy_level = discord_types.GuildScheduledEventPrivacyLevel(self.privacy_level)
-        self.status = discord_types.GuildScheduledEventStatus(self.status)
-        self.entity_type = discord_types.GuildScheduledEventEntityType(self.entity_type)
-        if isinstance(self.creator, dict):
-            self.creator = user_module.User(**self.creator)  # type: ignore[unreachable]
-
+        super().__post_init__()
         if self.entity_type is discord_types.GuildScheduledEventEntityType.EXTERNAL:
             if self.entity_metadata is None or self.scheduled_end_time is None:
                 raise AttributeError("entity_metadata and scheduled_end_time is required for EXTERNAL event type.")
-            if isinstance(self.entity_metadata, dict):
-                self.entity_metadata = GuildScheduledEventEntityMetadata(**self.entity_metadata)  # type: ignore[unreachable]
         else:
             if self.channel_id is None:
                 raise AttributeError(f"entity_metadata and scheduled_end_time is required for {self.entity_type.name} event type.")
@@ -56,9 +49,3 @@ class GuildScheduledEventUser(discord_types.DiscordDataClass):
     guild_scheduled_event_id: discord_types.Snowflake
     user: 'user_module.User'
     member: Optional['guild_module.GuildMember']
-
-    def __post_init__(self) -> None:
-        if isinstance(self.user, dict):
-            self.user = user_module.User(**self.user)  # type: ignore[unreachable]
-        if isinstance(self.member, dict):
-            self.member = guild_module.GuildMember(**self.member)  # type: ignore[unreachable]
@@ -0,0 +1,136 @@
+"""
+    Pooled HTTP client used for Discord REST API calls.
+"""
+from dataclasses import dataclass
+import threading
+from typing import Any, Dict, Type
+
+import requests
+import requests.adapters
+import urllib3.connection
+import urllib3.connectionpool
+
+
+@dataclass
+class ConnectionPoolOptions():
+    """
+        Connection pool configuration for :py:class:`HTTPClient`.
+    """
+    # Number of hosts with a connection pool kept around.
+    pool_connections: int = 4
+    # Maximum number of connections kept alive per host.
+    pool_maxsize: int = 16
+    # Wait for a free connection instead of opening an extra one when a host pool is exhausted.
+    pool_block: bool = False
+    # Keep connections open between requests.
+    keep_alive: bool = True
+    # Timeout in seconds for establishing a connection.
+    connect_timeout: float = 5.0
+    # Timeout in seconds between bytes received from the server.
+    read_timeout: float = 30.0
+    # Number of retries on connection errors. Requests which reached the server are never retried.
+    max_retries: int = 0
+
+
+class ConnectionStats():
+    """
+        Counters for requests sent and connections opened by an :py:class:`HTTPClient`.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.connections_opened = 0
+
+    def _count_request(self) -> None:
+        with self._lock:
+            self.requests += 1
+
+    def _count_connection(self) -> None:
+        with self._lock:
+            self.connections_opened += 1
+
+    @property
+    def connections_reused(self) -> int:
+        """
+            Number of requests sent through an already opened connection.
+        """
+        return max(self.requests - self.connections_opened, 0)
+
+    def as_dict(self) -> Dict[str, int]:
+        return {
+            "requests": self.requests,
+            "connections_opened": self.connections_opened,
+            "connections_reused": self.connections_reused
+        }
+
+
+def _counting_pool_classes(stats: ConnectionStats) -> Dict[str, Type[urllib3.connectionpool.HTTPConnectionPool]]:
+    """
+        Create urllib3 connection pool classes which count every connection established.
+    """
+    def counting_connection(base: Any) -> Any:
+        def connect(self: Any) -> None:
+            stats._count_connection()
+            base.connect(self)
+        return type(f"Counting{base.__name__}", (base,), {"connect": connect})
+
+    return {
+        "http": type("CountingHTTPConnectionPool", (urllib3.connectionpool.HTTPConnectionPool,), {
+            "ConnectionCls": counting_connection(urllib3.connection.HTTPConnection)
+        }),
+        "https": type("CountingHTTPSConnectionPool", (urllib3.connectionpool.HTTPSConnectionPool,), {
+            "ConnectionCls": counting_connection(urllib3.connection.HTTPSConnection)
+        })
+    }
+
+
+class _PoolAdapter(requests.adapters.HTTPAdapter):
+    def __init__(self, stats: ConnectionStats, **kwargs: Any) -> None:
+        self._stats = stats
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = _counting_pool_classes(self._stats)
+
+    def send(self, request: requests.PreparedRequest, *args: Any, **kwargs: Any) -> requests.Response:
+        self._stats._count_request()
+        return super().send(request, *args, **kwargs)
+
+
+class HTTPClient():
+    """
+        A requests.Session with a configured connection pool, shared by every API call of an application.
+
+        :param ConnectionPoolOptions options: Pool configuration.
+    """
+
+    def __init__(self, options: ConnectionPoolOptions) -> None:
+        self.options = options
+        self.stats = ConnectionStats()
+        self.session = requests.Session()
+        adapter = _PoolAdapter(
+            self.stats,
+            pool_connections=options.pool_connections,
+            pool_maxsize=options.pool_maxsize,
+            pool_block=options.pool_block,
+            max_retries=options.max_retries
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        if not options.keep_alive:
+            self.session.headers["Connection"] = "close"
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """
+            Same as requests.request, but sent through the connection pool with default timeouts.
+        """
+        kwargs.setdefault("timeout", (self.options.connect_timeout, self.options.read_timeout))
+        return self.session.request(method, url, **kwargs)
+
+    def close(self) -> None:
+        """
+            Close all pooled connections.
+        """
+        self.session.close()
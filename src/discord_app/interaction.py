@@ -1,13 +1,16 @@
 
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Union, Any
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Union, Any
 from typing_extensions import Self  # type: ignore[attr-defined]
 
+from . import decoder
 from . import discord_types
 from . import channel
 from . import user as user_module
 from . import guild as guild_module
 from . import application
+from . import lazy
+from . import routing
 
 
 @dataclass
@@ -38,18 +41,6 @@ class ApplicationCommandOption(discord_types.DiscordDataClass):
     max_value: Optional[Union[int, float]] = None
     autocomplete: Optional[bool] = False
 
-    def __post_init__(self) -> None:
-        self.type = discord_types.ApplicationCommandOptionType(self.type)
-        if isinstance(self.choices, list):
-            self.choices = [ApplicationCommandOptionChoice(**choice) if isinstance(choice, dict) else choice for choice in self.choices]
-        if isinstance(self.options, list):
-            self.options = [ApplicationCommandOption(**option) if isinstance(option, dict) else option for option in self.options]
-        if isinstance(self.channel_types, list):
-            self.channel_types = [
-                discord_types.ChannelType(channel_type) if isinstance(channel_type, discord_types.ChannelType) else channel_type
-                for channel_type in self.channel_types
-            ]
-
 
 @dataclass
 class ApplicationCommand(discord_types.DiscordDataClass):
@@ -72,11 +63,6 @@ class ApplicationCommand(discord_types.DiscordDataClass):
     default_member_permissions: Optional[Any] = None
     dm_permission: Optional[Any] = None
 
-    def __post_init__(self) -> None:
-        self.type = discord_types.ApplicationCommandType(self.type)
-        if isinstance(self.options, list):
-            self.options = [ApplicationCommandOption(**option) if isinstance(option, dict) else option for option in self.options]
-
 
 @dataclass
 class InteractionResponseData(discord_types.DiscordDataClass):
@@ -85,16 +71,22 @@ class InteractionResponseData(discord_types.DiscordDataClass):
         'InteractionResponseAutocomplete',
         'InteractionResponseModal'
     ]:
-        target: Any = InteractionResponseMessage
-        if "choices" in kwargs:
-            target = InteractionResponseAutocomplete
-        if "title" in kwargs or "custom_id" in kwargs:
-            target = InteractionResponseModal
         if cls is InteractionResponseData:
-            return target(*args, **kwargs)  # type: ignore[no-any-return]
+            return cls._resolve_class(kwargs)(*args, **kwargs)  # type: ignore[no-any-return]
         else:
             return super(InteractionResponseData, cls).__new__(cls)  # type: ignore[return-value]
 
+    @classmethod
+    def _resolve_class(cls, payload: Dict[str, Any]) -> type:
+        """
+            Response data class for a payload, guessed by its attributes.
+        """
+        if "title" in payload or "custom_id" in payload:
+            return InteractionResponseModal
+        if "choices" in payload:
+            return InteractionResponseAutocomplete
+        return InteractionResponseMessage
+
 
 @dataclass
 class InteractionResponseMessage(InteractionResponseData):
@@ -106,38 +98,11 @@ class InteractionResponseMessage(InteractionResponseData):
     components: Optional[List[channel.MessageComponent]] = None
     attachments: Optional[List[channel.PartialAttachment]] = None
 
-    def __post_init__(self) -> None:
-        if isinstance(self.embeds, list):
-            self.embeds = [
-                channel.Embed(**e) if isinstance(e, dict) else e
-                for e in self.embeds
-            ]
-        if isinstance(self.allowed_mentions, dict):
-            self.allowed_mentions = channel.AllowedMentions(**self.allowed_mentions)  # type: ignore[unreachable]
-        if isinstance(self.flags, int):
-            self.flags = discord_types.MessageFlags(self.flags)
-        if isinstance(self.components, list):
-            self.components = [
-                channel.MessageComponent(**component) if isinstance(component, dict) else component
-                for component in self.components
-            ]
-        if isinstance(self.attachments, list):
-            self.attachments = [
-                channel.PartialAttachment(**attachment) if isinstance(attachment, dict) else attachment
-                for attachment in self.attachments
-            ]
-
 
 @dataclass
 class InteractionResponseAutocomplete(InteractionResponseData):
     choices: List[ApplicationCommandOptionChoice]
 
-    def __post_init__(self) -> None:
-        self.choices = [
-            ApplicationCommandOptionChoice(**choice) if isinstance(choice, dict) else choice
-            for choice in self.choices
-        ]
-
 
 @dataclass
 class InteractionResponseModal(InteractionResponseData):
@@ -145,12 +110,6 @@ class InteractionResponseModal(InteractionResponseData):
     title: str
     components: List[channel.MessageComponent]
 
-    def __post_init__(self) -> None:
-        self.components = [
-            channel.MessageComponent(**component) if isinstance(component, dict) else component
-            for component in self.components
-        ]
-
 
 @dataclass
 class InteractionResponse(discord_types.DiscordDataClass):
@@ -178,9 +137,27 @@ class InteractionResponse(discord_types.DiscordDataClass):
                 # Response to ping shouldn't have data
                 self.data = None
             else:
-                self.data = target_cls(**self.data)
-
-
+                self.data = decoder.decode(target_cls, self.data)
+        super().__post_init__()
+
+
+def _decode_mapping(cls: Any) -> Any:
+    def decode(value: Dict[str, Any]) -> Dict[discord_types.Snowflake, Any]:
+        return {
+            discord_types.Snowflake(k): decoder.decode(cls, v) if isinstance(v, dict) else v
+            for (k, v) in value.items()
+        }
+    return decode
+
+
+@lazy.fields(
+    users=_decode_mapping(user_module.User),
+    members=_decode_mapping(guild_module.PartialGuildMember),
+    roles=_decode_mapping(guild_module.Role),
+    channels=_decode_mapping(channel.Channel),
+    messages=_decode_mapping(channel.Message),
+    attachments=_decode_mapping(channel.Attachment)
+)
 @dataclass
 class InteractionResolvedData(discord_types.DiscordDataClass):
     """
@@ -193,38 +170,6 @@ class InteractionResolvedData(discord_types.DiscordDataClass):
     messages: Optional[Dict[discord_types.Snowflake, channel.Message]] = None
     attachments: Optional[Dict[discord_types.Snowflake, channel.Attachment]] = None
 
-    def __post_init__(self) -> None:
-        if isinstance(self.users, dict):
-            self.users = {
-                discord_types.Snowflake(k): user_module.User(**v) if isinstance(v, dict) else v
-                for (k, v) in self.users.items()
-            }
-        if isinstance(self.members, dict):
-            self.members = {
-                discord_types.Snowflake(k): guild_module.PartialGuildMember(**v) if isinstance(v, dict) else v
-                for (k, v) in self.members.items()
-            }
-        if isinstance(self.roles, dict):
-            self.roles = {
-                discord_types.Snowflake(k): guild_module.Role(**v) if isinstance(v, dict) else v
-                for (k, v) in self.roles.items()
-            }
-        if isinstance(self.channels, dict):
-            self.channels = {
-                discord_types.Snowflake(k): channel.Channel(**v) if isinstance(v, dict) else v
-                for (k, v) in self.channels.items()
-            }
-        if isinstance(self.messages, dict):
-            self.messages = {
-                discord_types.Snowflake(k): channel.Message(**v) if isinstance(v, dict) else v
-                for (k, v) in self.messages.items()
-            }
-        if isinstance(self.attachments, dict):
-            self.attachments = {
-                discord_types.Snowflake(k): channel.Attachment(**v) if isinstance(v, dict) else v
-                for (k, v) in self.attachments.items()
-            }
-
 
 @dataclass
 class InteractionDataOption(discord_types.DiscordDataClass):
@@ -239,59 +184,49 @@ class InteractionDataOption(discord_types.DiscordDataClass):
     options: Optional[List[Self]] = None  # type: ignore
     focused: Optional[bool] = None
 
-    def __post_init__(self) -> None:
-        self.type = discord_types.ApplicationCommandOptionType(self.type)
-        if isinstance(self.options, list):
-            self.options = [
-                InteractionDataOption(**option) if isinstance(option, dict) else option
-                for option in self.options
-            ]
-
 
+@lazy.fields(
+    resolved=lambda value: decoder.decode(InteractionResolvedData, value),
+    components=lambda value: [
+        decoder.decode(channel.MessageComponent, component) if isinstance(component, dict) else component
+        for component in value
+    ]
+)
 @dataclass
 class InteractionData(discord_types.DiscordDataClass):
     """
         Additional data for incoming interaction message
+
+        id, name and type are given for application commands and autocomplete,
+        custom_id for message components and modal submits.
     """
-    id: discord_types.Snowflake
-    name: str
-    type: discord_types.ApplicationCommandType
+    id: Optional[discord_types.Snowflake] = None
+    name: Optional[str] = None
+    type: Optional[discord_types.ApplicationCommandType] = None
     resolved: Optional[InteractionResolvedData] = None
     options: Optional[List[InteractionDataOption]] = None
     guild_id: Optional[discord_types.Snowflake] = None
     custom_id: Optional[str] = None
     component_type: Optional[discord_types.MessageComponentType] = None
-    values: Optional[List[channel.MessageComponentSelectOption]] = None
+    # Values of the selected options of a select menu
+    values: Optional[List[str]] = None
     target_id: Optional[discord_types.Snowflake] = None
     components: Optional[List[channel.MessageComponent]] = None
 
-    def __post_init__(self) -> None:
-        self.type = discord_types.ApplicationCommandType(self.type)
-        if isinstance(self.resolved, dict):
-            self.resolved = InteractionResolvedData(**self.resolved)  # type: ignore[unreachable]
-        if isinstance(self.options, list):
-            self.options = [
-                InteractionDataOption(**option) if isinstance(option, dict) else option
-                for option in self.options
-            ]
-        if isinstance(self.component_type, int):
-            self.component_type = discord_types.MessageComponentType(self.component_type)
-        if isinstance(self.values, list):
-            self.values = [
-                channel.MessageComponentSelectOption(**option) if isinstance(option, dict) else option
-                for option in self.values
-            ]
-        if isinstance(self.components, list):
-            self.components = [
-                channel.MessageComponent(**component) if isinstance(component, dict) else component
-                for component in self.components
-            ]
-
 
+@lazy.fields(
+    data=lambda value: decoder.decode(InteractionData, value),
+    member=lambda value: decoder.decode(guild_module.GuildMember, value),
+    user=lambda value: decoder.decode(user_module.User, value),
+    message=lambda value: decoder.decode(channel.Message, value)
+)
 @dataclass
 class InteractionRequest(discord_types.DiscordDataClass):
     """
         Incoming interaction message
+
+        data, member, user and message are decoded when first read.
+        Set _lazy to False to decode everything when the object is created.
     """
     id: discord_types.Snowflake
     application_id: discord_types.Snowflake
@@ -309,24 +244,77 @@ class InteractionRequest(discord_types.DiscordDataClass):
 
     # Internal use only
     _app: Optional['application.Application'] = None
+    _lazy: bool = field(default=True, compare=False, repr=False)
+    # Converters of the options of the command route, set when the interaction is dispatched, see arguments
+    _converters: Optional[Dict[str, Any]] = field(default=None, compare=False, repr=False)
+    _arguments: Optional[Dict[str, Any]] = field(default=None, compare=False, repr=False)
 
     def __post_init__(self) -> None:
-        self.type = discord_types.InteractionType(self.type)
-        if isinstance(self.data, dict):  # type: ignore[unreachable]
-            self.data = InteractionData(**self.data)  # type: ignore[unreachable]
-        if isinstance(self.member, dict):
-            self.member = guild_module.GuildMember(**self.member)  # type: ignore[unreachable]
-        if isinstance(self.user, dict):
-            self.user = user_module.User(**self.user)  # type: ignore[unreachable]
-        if isinstance(self.message, dict):
-            self.message = channel.Message(**self.message)  # type: ignore[unreachable]
-
-    def get_channel(self) -> channel.Channel:
+        super().__post_init__()
+        if not self._lazy:
+            lazy.materialize(self)
+
+    @property
+    def arguments(self) -> Dict[str, Any]:
+        """
+            Options given to the command, or to the subcommand used, by name.
+
+            Values are converted according to the option type: users, channels, roles and attachments
+            are the objects resolved by Discord. They are converted when first read.
+
+            :raises TypeError: an option value doesn't match its type.
+            :raises ValueError: an option value doesn't match its type.
+        """
+        if self._arguments is None:
+            if self.data is None:
+                return {}
+            (_, options) = routing.find_route(self.data)
+            self._arguments = routing.extract_arguments(self.data, options, self._converters)
+        return self._arguments
+
+    def get_channel(self, fields: Optional[Iterable[str]] = None) -> channel.Channel:
+        """
+            Get the channel the interaction was sent from.
+
+            :param fields: Only decode these fields, see :py:meth:`application.Application.get_channel`.
+        """
         if self.channel_id and self._app:
-            channel_data, _ = self._app.call_api(  # type: ignore[misc]
-                "GET",
-                f"/channels/{self.channel_id}"
-            )
-            return channel.Channel(_app=self._app, **channel_data)
+            return self._app.get_channel(self.channel_id, fields)
         else:
             raise RuntimeError("self._app is unusable.")
+
+    def edit_original_response(self, data: Optional['InteractionResponseData']) -> Optional[channel.Message]:
+        """
+            Edit the response sent for this interaction.
+
+            This is how the result of a deferred response (DEFERRED_CHANNEL_MESSAGE_WITH_SOURCE) is delivered.
+
+            :param data: New content of the response message.
+            :return: The edited message.
+        """
+        if self._app is None:
+            raise RuntimeError("self._app is unusable.")
+        msg_json, _ = self._app.call_api(
+            "PATCH",
+            f"/webhooks/{self.application_id}/{self.token}/messages/@original",
+            json=data if data is not None else {},
+            use_bot_token=False
+        )
+        return decoder.decode(channel.Message, msg_json, _app=self._app) if msg_json else None
+
+    def create_followup_message(self, data: 'InteractionResponseData') -> Optional[channel.Message]:
+        """
+            Send another message for this interaction.
+
+            :param data: Content of the message.
+            :return: The new message.
+        """
+        if self._app is None:
+            raise RuntimeError("self._app is unusable.")
+        msg_json, _ = self._app.call_api(
+            "POST",
+            f"/webhooks/{self.application_id}/{self.token}",
+            json=data,
+            use_bot_token=False
+        )
+        return decoder.decode(channel.Message, msg_json, _app=self._app) if msg_json else None
@@ -0,0 +1,95 @@
+"""
+    JSON encoding and decoding used across discord_app.
+
+    Uses orjson or ujson when installed (``pip install discord_app[fast]``), the json module
+    otherwise. Every backend produces the same compact output, with non-ASCII characters
+    kept as they are, and encodes enums and flags as their values.
+"""
+from enum import Enum
+import json
+from typing import Any, Callable, Optional, Union
+
+
+BACKENDS = ("orjson", "ujson", "json")
+
+
+def _default(obj: Any) -> Any:
+    if isinstance(obj, Enum):
+        return obj.value
+    raise TypeError(f"Object of type {obj.__class__.__name__} is not JSON serializable")
+
+
+def _json_dumps(obj: Any) -> str:
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False, default=_default)
+
+
+# Name of the selected backend
+backend: str = "json"
+_dumps: Callable[[Any], str] = _json_dumps
+_loads: Callable[[Union[str, bytes]], Any] = json.loads
+
+
+def set_backend(name: Optional[str] = None) -> str:
+    """
+        Select the JSON library.
+
+        :param Optional[str] name: One of BACKENDS. None picks the fastest one installed.
+        :return: Name of the selected backend.
+        :raises ImportError: The requested library is not installed.
+    """
+    global backend, _dumps, _loads
+    for candidate in (BACKENDS if name is None else (name,)):
+        if candidate == "orjson":
+            try:
+                import orjson  # type: ignore
+            except ImportError:
+                if name is None:
+                    continue
+                raise
+            option = orjson.OPT_NON_STR_KEYS
+
+            def orjson_dumps(obj: Any) -> str:
+                return orjson.dumps(obj, default=_default, option=option).decode("utf-8")  # type: ignore[no-any-return]
+            (_dumps, _loads) = (orjson_dumps, orjson.loads)
+        elif candidate == "ujson":
+            try:
+                import ujson  # type: ignore
+            except ImportError:
+                if name is None:
+                    continue
+                raise
+
+            def ujson_dumps(obj: Any) -> str:
+                return ujson.dumps(  # type: ignore[no-any-return]
+                    obj,
+                    ensure_ascii=False,
+                    escape_forward_slashes=False,
+                    default=_default
+                )
+            (_dumps, _loads) = (ujson_dumps, ujson.loads)
+        elif candidate == "json":
+            (_dumps, _loads) = (_json_dumps, json.loads)
+        else:
+            raise ValueError(f"Unknown JSON backend {candidate}")
+        backend = candidate
+        return backend
+    raise ImportError("No JSON backend available")  # pragma: no cover
+
+
+def dumps(obj: Any) -> str:
+    """
+        Encode obj as JSON.
+    """
+    return _dumps(obj)
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """
+        Decode JSON text.
+
+        :raises ValueError: data is not valid JSON.
+    """
+    return _loads(data)
+
+
+set_backend()
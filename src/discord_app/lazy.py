@@ -0,0 +1,148 @@
+"""
+    Dataclass fields decoded on first access.
+
+    Payload parts that a handler rarely reads (the target message of a context menu command,
+    resolved users and members...) are kept as they came in the JSON payload until the
+    attribute is read. They are then decoded once, and the result replaces the raw value.
+"""
+import dataclasses
+from typing import Any, Callable, Optional, Tuple, Type, TypeVar
+
+
+T = TypeVar("T")
+
+
+class _Raw():
+    """
+        Value not decoded yet.
+    """
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
+
+
+class LazyField():
+    """
+        Data descriptor storing dict and list values as they are, and decoding them on first access.
+
+        :param str name: Attribute name.
+        :param decode: Function converting the raw value.
+    """
+
+    def __init__(self, name: str, decode: Callable[[Any], Any]) -> None:
+        self.name = name
+        self.decode = decode
+
+    def __get__(self, obj: Any, objtype: Optional[type] = None) -> Any:
+        if obj is None:
+            return self
+        value = obj.__dict__.get(self.name)
+        if type(value) is _Raw:
+            # Two threads may decode at the same time, one of the results is kept.
+            value = obj.__dict__[self.name] = self.decode(value.value)
+        return value
+
+    def __set__(self, obj: Any, value: Any) -> None:
+        obj.__dict__[self.name] = _Raw(value) if isinstance(value, (dict, list)) else value
+
+
+class SnowflakeField():
+    """
+        Data descriptor storing snowflakes (or lists of them) as the strings found in the payload,
+        and converting them on first access.
+
+        Creating an int subclass from a string costs more than decoding the rest of a small object,
+        while most IDs of a decoded payload are never read. The decoder installs this descriptor
+        on Snowflake and List[Snowflake] fields.
+
+        :param str name: Attribute name.
+        :param convert: Function converting the raw value, returning it as it is when there is nothing to convert.
+        :param slot: Slot descriptor storing the attribute, None if it is stored in __dict__.
+    """
+    __slots__ = ("name", "convert", "slot")
+
+    def __init__(self, name: str, convert: Callable[[Any], Any], slot: Any = None) -> None:
+        self.name = name
+        self.convert = convert
+        self.slot = slot
+
+    def __get__(self, obj: Any, objtype: Optional[type] = None) -> Any:
+        if obj is None:
+            return self
+        if self.slot is None:
+            try:
+                value = obj.__dict__[self.name]
+            except KeyError:
+                raise AttributeError(self.name) from None
+        else:
+            value = self.slot.__get__(obj, objtype)
+        if value.__class__ is str or value.__class__ is list:
+            converted = self.convert(value)
+            if converted is not value:
+                self.__set__(obj, converted)
+            return converted
+        return value
+
+    def __set__(self, obj: Any, value: Any) -> None:
+        if self.slot is None:
+            obj.__dict__[self.name] = value
+        else:
+            self.slot.__set__(obj, value)
+
+
+def fields(**decoders: Callable[[Any], Any]) -> Callable[[Type[T]], Type[T]]:
+    """
+        Class decorator making the named fields of a dataclass lazy. Apply it above @dataclass.
+
+        ```
+        @lazy.fields(user=lambda v: User(**v))
+        @dataclass
+        class Interaction():
+            user: Optional[User] = None
+        ```
+    """
+    def decorator(cls: Type[T]) -> Type[T]:
+        names = {f.name for f in dataclasses.fields(cls)}  # type: ignore[arg-type]
+        for (name, decode) in decoders.items():
+            if name not in names:
+                raise AttributeError(f"{cls.__name__} has no field {name}")
+            setattr(cls, name, LazyField(name, decode))
+        return cls
+    return decorator
+
+
+def is_decoded(obj: Any, name: str) -> bool:
+    """
+        Test if a lazy field has been decoded (or was given decoded).
+    """
+    return type(obj.__dict__.get(name)) is not _Raw
+
+
+def peek(obj: Any, name: str) -> Tuple[Any, bool]:
+    """
+        Get the value of a lazy field without decoding it.
+
+        :return: (value, decoded), value being the raw value when decoded is False.
+    """
+    value = obj.__dict__.get(name)
+    if type(value) is _Raw:
+        return value.value, False
+    return value, True
+
+
+def materialize(obj: Any) -> Any:
+    """
+        Decode every lazy field of obj and of the objects it contains.
+    """
+    if isinstance(obj, list):
+        for item in obj:
+            materialize(item)
+    elif isinstance(obj, dict):
+        for item in obj.values():
+            materialize(item)
+    elif dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        for (name, attr) in vars(type(obj)).items():
+            if isinstance(attr, LazyField):
+                materialize(getattr(obj, name))
+    return obj
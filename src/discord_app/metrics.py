@@ -0,0 +1,168 @@
+"""
+    Latency metrics of interaction handling and Discord API requests.
+
+    Set Application._metrics to a sink to collect them; nothing is timed otherwise.
+
+    Metrics observed, in seconds:
+
+    * discord_app_stage_seconds{stage}: each stage of handling an interaction, in order
+      read (request body), verify (signature and replay checks), parse (JSON), decode (InteractionRequest),
+      dispatch (finding the handler), handler and encode (response).
+    * discord_app_interaction_seconds: the whole handling of an interaction.
+    * discord_app_api_seconds{method,status}: call_api requests, including rate limit waits.
+"""
+import bisect
+from collections import defaultdict
+import math
+import threading
+import time
+from typing import Dict, List, Optional, Protocol, Sequence, Tuple
+
+
+STAGE_SECONDS = "discord_app_stage_seconds"
+INTERACTION_SECONDS = "discord_app_interaction_seconds"
+API_SECONDS = "discord_app_api_seconds"
+
+HELP = {
+    STAGE_SECONDS: "Time spent in each stage of handling an interaction.",
+    INTERACTION_SECONDS: "Time spent handling an interaction.",
+    API_SECONDS: "Time spent on Discord API requests."
+}
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Upper bounds of histogram buckets, in seconds. Stages before the handler take microseconds.
+DEFAULT_BUCKETS = (
+    0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+
+# Label names and values, sorted by name
+Labels = Tuple[Tuple[str, str], ...]
+
+
+class MetricsSink(Protocol):
+    """
+        Receiver of observed values.
+    """
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        ...
+
+
+class Timer():
+    """
+        Observe the time spent in consecutive stages.
+    """
+    __slots__ = ("sink", "started", "last")
+
+    def __init__(self, sink: MetricsSink) -> None:
+        self.sink = sink
+        self.started = self.last = time.perf_counter()
+
+    def lap(self, stage: str) -> None:
+        """
+            Observe the time since the previous stage ended, or since the timer started.
+        """
+        now = time.perf_counter()
+        self.sink.observe(STAGE_SECONDS, now - self.last, stage=stage)
+        self.last = now
+
+    def stop(self) -> None:
+        """
+            Observe the time since the timer started.
+        """
+        self.sink.observe(INTERACTION_SECONDS, time.perf_counter() - self.started)
+
+
+def start_timer(sink: Optional[MetricsSink]) -> Optional[Timer]:
+    return Timer(sink) if sink is not None else None
+
+
+class InMemorySink():
+    """
+        Keep every observation, e.g. for tests.
+    """
+
+    def __init__(self) -> None:
+        self.observations: Dict[str, List[Tuple[Dict[str, str], float]]] = defaultdict(list)
+
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        self.observations[name].append((labels, value))
+
+    def values(self, name: str, **labels: str) -> List[float]:
+        """
+            Observed values of a metric, with the given labels.
+        """
+        return [
+            value for (observed_labels, value) in self.observations.get(name, ())
+            if all(observed_labels.get(key) == label for (key, label) in labels.items())
+        ]
+
+
+class _Histogram():
+    __slots__ = ("counts", "sum")
+
+    def __init__(self, size: int) -> None:
+        # Observations in each bucket, the last one being +Inf
+        self.counts = [0] * size
+        self.sum = 0.0
+
+
+class PrometheusSink():
+    """
+        Aggregate observations in histograms, rendered in Prometheus text exposition format.
+
+        :param buckets: Upper bounds of the buckets, in increasing order.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        if list(buckets) != sorted(buckets):
+            raise ValueError("buckets must be in increasing order")
+        self.buckets = tuple(buckets)
+        self._histograms: Dict[str, Dict[Labels, _Histogram]] = defaultdict(dict)
+        self._lock = threading.Lock()
+
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        key = tuple(sorted(labels.items()))
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            histogram = self._histograms[name].get(key)
+            if histogram is None:
+                histogram = self._histograms[name][key] = _Histogram(len(self.buckets) + 1)
+            histogram.counts[index] += 1
+            histogram.sum += value
+
+    def render(self) -> str:
+        """
+            All histograms in Prometheus text exposition format (version 0.0.4).
+        """
+        bounds = [_format_value(bound) for bound in self.buckets] + ["+Inf"]
+        lines: List[str] = []
+        with self._lock:
+            for (name, histograms) in sorted(self._histograms.items()):
+                if name in HELP:
+                    lines.append(f"# HELP {name} {HELP[name]}")
+                lines.append(f"# TYPE {name} histogram")
+                for (labels, histogram) in sorted(histograms.items()):
+                    cumulative = 0
+                    for (bound, count) in zip(bounds, histogram.counts):
+                        cumulative += count
+                        lines.append(f"{name}_bucket{_format_labels(labels + (('le', bound),))} {cumulative}")
+                    lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(histogram.sum)}")
+                    lines.append(f"{name}_count{_format_labels(labels)} {cumulative}")
+        return "\n".join(lines) + "\n"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+def _format_labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    escaped = (
+        (key, value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"'))
+        for (key, value) in labels
+    )
+    return "{" + ",".join(f'{key}="{value}"' for (key, value) in escaped) + "}"
@@ -61,26 +61,6 @@ class Activity(discord_types.DiscordDataClass):
     flags: Optional[discord_types.ActivityFlag] = None
     buttons: Optional[List[ActivityButton]] = None
 
-    def __post_init__(self) -> None:
-        self.type = discord_types.ActivityType(self.type)
-        if isinstance(self.timestamps, dict):
-            self.timestamps = ActivityTimestamp(**self.timestamps)  # type: ignore[unreachable]
-        if isinstance(self.emoji, dict):
-            self.emoji = ActivityEmoji(**self.emoji)  # type: ignore[unreachable]
-        if isinstance(self.party, dict):
-            self.party = ActivityParty(**self.party)  # type: ignore[unreachable]
-        if isinstance(self.assets, dict):
-            self.assets = ActivityAsset(**self.assets)  # type: ignore[unreachable]
-        if isinstance(self.secrets, dict):
-            self.secrets = ActivitySecret(**self.secrets)  # type: ignore[unreachable]
-        if isinstance(self.flags, int):
-            self.flags = discord_types.ActivityFlag(self.flags)
-        if isinstance(self.buttons, list):
-            self.buttons = [
-                ActivityButton(**b) if isinstance(b, dict) else b
-                for b in self.buttons
-            ]
-
 
 @dataclass
 class ClientStatus(discord_types.DiscordDataClass):
@@ -96,14 +76,3 @@ class PresenceUpdateEvent(discord_types.DiscordDataClass):
     status: str
     activities: List[Activity]
     client_status: ClientStatus
-
-    def __post_init__(self) -> None:
-        if isinstance(self.user, dict):
-            self.user = user_module.User(**self.user)  # type: ignore[unreachable]
-        if isinstance(self.activities, list):
-            self.activities = [
-                Activity(**a) if isinstance(a, dict) else a
-                for a in self.activities
-            ]
-        if isinstance(self.client_status, dict):
-            self.client_status = ClientStatus(**self.client_status)  # type: ignore[unreachable]
@@ -0,0 +1,221 @@
+"""
+    Discord REST API rate limit handling.
+
+    See https://discord.com/developers/docs/topics/rate-limits
+"""
+import threading
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+import requests
+
+
+# Path segments after these are "major parameters": each value gets its own rate limit bucket.
+MAJOR_PARAMETERS = ("channels", "guilds", "webhooks", "interactions")
+
+
+def route_key(method: str, path: str) -> Tuple[str, str]:
+    """
+        Split an API call into its route template and major parameters.
+
+        ``route_key("PATCH", "/channels/1234/messages/5678")`` gives
+        ``("PATCH /channels/{channel_id}/messages/{id}", "1234")``.
+
+        :return: (route, major parameters)
+    """
+    path = path.split("?", 1)[0]
+    segments = path.strip("/").split("/")
+    resource = segments[0]
+    major = []
+    route = []
+    for i, segment in enumerate(segments):
+        if i == 1 and resource in MAJOR_PARAMETERS:
+            major.append(segment)
+            route.append("{" + resource[:-1] + "_id}")
+        elif i == 2 and resource in ("webhooks", "interactions"):
+            # Webhook / interaction token is a major parameter as well.
+            major.append(segment)
+            route.append("{token}")
+        elif segment.isdigit():
+            route.append("{id}")
+        else:
+            route.append(segment)
+    return f"{method.upper()} /{'/'.join(route)}", "/".join(major)
+
+
+def _header_float(response: requests.Response, name: str) -> Optional[float]:
+    value = response.headers.get(name)
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+class Bucket():
+    """
+        State of one rate limit bucket.
+
+        Requests are queued on the bucket until it has remaining allowance. Several requests
+        may be in flight at the same time as long as the allowance covers them.
+    """
+
+    def __init__(self) -> None:
+        self.condition = threading.Condition()
+        self.limit: Optional[int] = None
+        self.remaining: Optional[int] = None
+        self.reset_at: Optional[float] = None
+        self.in_flight = 0
+
+    def acquire(self, clock: Callable[[], float]) -> None:
+        with self.condition:
+            while True:
+                now = clock()
+                if self.reset_at is not None and now >= self.reset_at:
+                    if self.in_flight:
+                        # Responses from the previous window would be mistaken for the new one.
+                        self.condition.wait()
+                        continue
+                    self.remaining = self.limit
+                    self.reset_at = None
+                if self.remaining is None:
+                    # Limit is unknown until the first response, send requests one by one until then.
+                    if self.in_flight == 0:
+                        break
+                    self.condition.wait()
+                elif self.remaining > 0:
+                    self.remaining -= 1
+                    break
+                elif self.reset_at is None and self.in_flight == 0:
+                    # Exhausted but Discord didn't tell when it resets, let the server decide.
+                    break
+                else:
+                    self.condition.wait(None if self.reset_at is None else self.reset_at - now)
+            self.in_flight += 1
+
+    def release(self, response: Optional[requests.Response], clock: Callable[[], float]) -> None:
+        with self.condition:
+            self.in_flight -= 1
+            if response is not None:
+                limit = _header_float(response, "X-RateLimit-Limit")
+                remaining = _header_float(response, "X-RateLimit-Remaining")
+                reset_after = _header_float(response, "X-RateLimit-Reset-After")
+                if response.status_code == 429 and reset_after is None:
+                    reset_after = _header_float(response, "Retry-After")
+                    remaining = 0
+                if limit is not None:
+                    self.limit = int(limit)
+                if remaining is not None:
+                    # Requests still in flight are not counted in the header yet.
+                    server_remaining = max(int(remaining) - self.in_flight, 0)
+                    self.remaining = server_remaining if self.remaining is None else min(self.remaining, server_remaining)
+                if reset_after is not None:
+                    self.reset_at = clock() + reset_after
+                if self.remaining is None and self.limit is None:
+                    # This route has no rate limit headers.
+                    self.limit = self.remaining = 1 << 30
+            self.condition.notify_all()
+
+
+class RateLimiter():
+    """
+        Paces API requests so rate limits are not exceeded.
+
+        Requests are grouped into buckets by route and major parameters, following
+        X-RateLimit-Bucket, X-RateLimit-Remaining and X-RateLimit-Reset-After headers.
+        A global limit of requests per second is enforced on top of that, and a global 429
+        pauses every request until it expires.
+
+        :param int global_limit: Maximum requests per second across all buckets. 0 to disable.
+        :param int max_retries: How many times a request answered with 429 is retried.
+    """
+
+    def __init__(
+        self,
+        global_limit: int = 50,
+        max_retries: int = 3,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep
+    ) -> None:
+        self.global_limit = global_limit
+        self.max_retries = max_retries
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        # route -> bucket hash from X-RateLimit-Bucket
+        self._bucket_hashes: Dict[str, str] = {}
+        self._buckets: Dict[Tuple[str, str], Bucket] = {}
+        self._global_reset_at = 0.0
+        self._global_window_start = 0.0
+        self._global_count = 0
+        self.throttled = 0
+
+    def get_bucket(self, method: str, path: str) -> Bucket:
+        route, major = route_key(method, path)
+        with self._lock:
+            key = (self._bucket_hashes.get(route, route), major)
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                # Requests sent before the bucket hash was known are queued on the route itself.
+                bucket = self._buckets.get((route, major)) or Bucket()
+                self._buckets[key] = bucket
+            return bucket
+
+    def _learn_bucket(self, method: str, path: str, bucket: Bucket, response: requests.Response) -> None:
+        bucket_hash = response.headers.get("X-RateLimit-Bucket")
+        if not bucket_hash:
+            return
+        route, major = route_key(method, path)
+        with self._lock:
+            self._bucket_hashes[route] = bucket_hash
+            self._buckets.setdefault((bucket_hash, major), bucket)
+
+    def _wait_global(self) -> None:
+        while True:
+            with self._lock:
+                now = self._clock()
+                delay = self._global_reset_at - now
+                if delay <= 0 and self.global_limit > 0:
+                    if now - self._global_window_start >= 1:
+                        self._global_window_start = now
+                        self._global_count = 0
+                    if self._global_count < self.global_limit:
+                        self._global_count += 1
+                        return
+                    delay = self._global_window_start + 1 - now
+                elif delay <= 0:
+                    return
+                self.throttled += 1
+            self._sleep(delay)
+
+    def send(self, method: str, path: str, send: Callable[[], requests.Response]) -> requests.Response:
+        """
+            Send a request once its bucket has allowance, retrying when Discord still answers 429.
+
+            :param str method: HTTP method, used to pick the bucket.
+            :param str path: API path, used to pick the bucket.
+            :param send: Function which sends the request.
+        """
+        attempt = 0
+        while True:
+            self._wait_global()
+            bucket = self.get_bucket(method, path)
+            bucket.acquire(self._clock)
+            response: Optional[requests.Response] = None
+            try:
+                response = send()
+            finally:
+                bucket.release(response, self._clock)
+            if response is None:
+                raise RuntimeError(f"No response to {method} {path}")
+            self._learn_bucket(method, path, bucket, response)
+            if response.status_code != 429 or attempt >= self.max_retries:
+                return response
+            attempt += 1
+            with self._lock:
+                self.throttled += 1
+            retry_after = _header_float(response, "Retry-After") or _header_float(response, "X-RateLimit-Reset-After") or 1.0
+            if response.headers.get("X-RateLimit-Global", "").lower() == "true" or \
+                    response.headers.get("X-RateLimit-Scope") == "global":
+                with self._lock:
+                    self._global_reset_at = max(self._global_reset_at, self._clock() + retry_after)
+            # Otherwise the bucket itself holds the retry until it resets.
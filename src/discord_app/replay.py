@@ -0,0 +1,79 @@
+"""
+    Protection against stale and replayed interaction requests.
+"""
+from collections import OrderedDict
+import threading
+import time
+from typing import Hashable, Optional, Union
+
+
+def is_timestamp_fresh(
+    timestamp: Union[str, bytes, None],
+    tolerance: float,
+    now: Optional[float] = None
+) -> bool:
+    """
+        Test if X-Signature-Timestamp is within tolerance seconds of now (in either direction).
+
+        :param timestamp: Value of X-Signature-Timestamp header, unix time in seconds.
+        :param float tolerance: Maximum accepted difference in seconds.
+        :param Optional[float] now: Current unix time, defaults to time.time().
+    """
+    if not timestamp:
+        return False
+    try:
+        ts = float(timestamp)
+    except ValueError:
+        return False
+    if now is None:
+        now = time.time()
+    return abs(now - ts) <= tolerance
+
+
+class SeenSet():
+    """
+        Bounded set of recently seen keys.
+
+        Keys expire ttl seconds after being added. When the set is full, the oldest key is dropped.
+        Both lookup and insertion are O(1), and memory is capped by max_size.
+
+        :param int max_size: Maximum number of keys to remember.
+        :param float ttl: Seconds a key is remembered.
+    """
+
+    def __init__(self, max_size: int, ttl: float) -> None:
+        if max_size <= 0:
+            raise ValueError("max_size must be a positive integer")
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: 'OrderedDict[Hashable, float]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _evict(self, now: float) -> None:
+        # Keys are inserted in time order with the same ttl, so expired keys are always at the front.
+        entries = self._entries
+        while entries:
+            key, expire_at = next(iter(entries.items()))
+            if expire_at > now and len(entries) < self.max_size:
+                break
+            entries.popitem(last=False)
+
+    def add(self, key: Hashable, now: Optional[float] = None) -> bool:
+        """
+            Remember key.
+
+            :return: False if the key has been seen and not yet expired, True otherwise.
+        """
+        if now is None:
+            now = time.monotonic()
+        with self._lock:
+            expire_at = self._entries.get(key)
+            if expire_at is not None and expire_at > now:
+                return False
+            self._entries.pop(key, None)
+            self._evict(now)
+            self._entries[key] = now + self.ttl
+            return True
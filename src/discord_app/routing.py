@@ -0,0 +1,129 @@
+"""
+    Routing of application commands to subcommand handlers, and extraction of their options.
+
+    A route is named after the command and the subcommand group and subcommand used, separated
+    by spaces, as shown in Discord clients, e.g. "config set" or "config role add".
+"""
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from . import discord_types
+from . import interaction
+
+
+# Converts the value of an option, with the interaction data holding the resolved objects.
+Converter = Callable[[Any, 'interaction.InteractionData'], Any]
+
+# Route name -> option name -> converter
+Routes = Dict[str, Dict[str, Converter]]
+
+_BRANCH_TYPES = frozenset((
+    discord_types.ApplicationCommandOptionType.SUB_COMMAND,
+    discord_types.ApplicationCommandOptionType.SUB_COMMAND_GROUP
+))
+
+
+def _keep(value: Any, data: 'interaction.InteractionData') -> Any:
+    return value
+
+
+def _scalar(convert: Callable[[Any], Any]) -> Converter:
+    def converter(value: Any, data: 'interaction.InteractionData') -> Any:
+        return convert(value)
+    return converter
+
+
+def _resolved(*attributes: str) -> Converter:
+    """
+        Converter to the object resolved by Discord, or its Snowflake if it has not been resolved.
+
+        :param attributes: Attributes of InteractionResolvedData to look in, in order.
+    """
+    def converter(value: Any, data: 'interaction.InteractionData') -> Any:
+        snowflake = discord_types.Snowflake(value)
+        resolved = data.resolved
+        if resolved is not None:
+            for attribute in attributes:
+                objects = getattr(resolved, attribute)
+                if objects and snowflake in objects:
+                    return objects[snowflake]
+        return snowflake
+    return converter
+
+
+_CONVERTERS: Dict[discord_types.ApplicationCommandOptionType, Converter] = {
+    discord_types.ApplicationCommandOptionType.STRING: _keep,
+    discord_types.ApplicationCommandOptionType.INTEGER: _scalar(int),
+    discord_types.ApplicationCommandOptionType.BOOLEAN: _scalar(bool),
+    discord_types.ApplicationCommandOptionType.NUMBER: _scalar(float),
+    discord_types.ApplicationCommandOptionType.USER: _resolved("users"),
+    discord_types.ApplicationCommandOptionType.CHANNEL: _resolved("channels"),
+    discord_types.ApplicationCommandOptionType.ROLE: _resolved("roles"),
+    discord_types.ApplicationCommandOptionType.MENTIONABLE: _resolved("users", "roles"),
+    discord_types.ApplicationCommandOptionType.ATTACHMEHT: _resolved("attachments")
+}
+
+
+def converter_for(option_type: discord_types.ApplicationCommandOptionType) -> Converter:
+    """
+        Converter of option values of option_type. Values of unknown types are kept as they are.
+    """
+    return _CONVERTERS.get(option_type, _keep)
+
+
+def compile_routes(command: 'interaction.ApplicationCommand') -> Routes:
+    """
+        Build the routes of a command from its spec, with the converter of every option of each route.
+
+        The command itself is a route, with its options if it has no subcommands.
+    """
+    routes: Routes = {}
+
+    def visit(route: str, options: Optional[List['interaction.ApplicationCommandOption']]) -> None:
+        converters = {}
+        for option in options or ():
+            if option.type in _BRANCH_TYPES:
+                visit(f"{route} {option.name}", option.options)
+            else:
+                converters[option.name] = converter_for(option.type)
+        routes[route] = converters
+
+    visit(command.name, command.options)
+    return routes
+
+
+def find_route(data: 'interaction.InteractionData') -> Tuple[str, List['interaction.InteractionDataOption']]:
+    """
+        Find the route of a command interaction.
+
+        :return: Route name, and the options given to the subcommand (or to the command).
+    """
+    route = data.name or ""
+    options = data.options or []
+    # Subcommand groups and subcommands are the only option of their parent.
+    while options and options[0].type in _BRANCH_TYPES:
+        route = f"{route} {options[0].name}"
+        options = options[0].options or []
+    return route, options
+
+
+def extract_arguments(
+    data: 'interaction.InteractionData',
+    options: List['interaction.InteractionDataOption'],
+    converters: Optional[Dict[str, Converter]] = None
+) -> Dict[str, Any]:
+    """
+        Map option names to their converted values.
+
+        Options without a converter are converted according to the type given by Discord.
+        The focused option of autocomplete interactions is what the user is typing, and is kept as it is.
+    """
+    arguments = {}
+    for option in options:
+        if option.focused:
+            arguments[option.name] = option.value
+            continue
+        convert = converters.get(option.name) if converters else None
+        if convert is None:
+            convert = converter_for(option.type)
+        arguments[option.name] = convert(option.value, data)
+    return arguments
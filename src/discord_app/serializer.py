@@ -0,0 +1,93 @@
+"""
+    Fast conversion of DiscordDataClass objects into JSON.
+
+    Gives the same result as ``dataclasses.asdict(obj, dict_factory=_asdict_ignore_none)``:
+    fields with a falsy value, and fields with a underscore as the first character of their
+    name, are left out. Instead of deep-copying the object and filtering every field on
+    each call, a conversion function is generated once per class.
+"""
+import dataclasses
+from typing import Any, Callable, Dict
+
+from . import discord_types
+from . import json_codec
+
+
+# Values of these types are JSON-ready as they are.
+_ATOMIC = frozenset((str, int, float, bool, type(None)))
+
+_converters: Dict[type, Callable[[Any], Dict[str, Any]]] = {}
+
+
+def _compile(cls: type) -> Callable[[Any], Dict[str, Any]]:
+    """
+        Generate the conversion function of a dataclass.
+    """
+    lines = ["def to_dict(obj):", "    result = {}"]
+    for f in dataclasses.fields(cls):
+        if f.name[0] == "_":
+            continue
+        # Conversion may turn a value falsy (a dataclass with nothing set), so the test is done after it.
+        lines += [
+            f"    value = obj.{f.name}",
+            "    if value:",
+            "        if type(value) not in _ATOMIC:",
+            "            value = _convert(value)",
+            "        if value:",
+            f"            result[{f.name!r}] = value",
+        ]
+    lines.append("    return result")
+    namespace: Dict[str, Any] = {"_ATOMIC": _ATOMIC, "_convert": _convert}
+    exec("\n".join(lines), namespace)
+    converter: Callable[[Any], Dict[str, Any]] = namespace["to_dict"]
+    converter.__qualname__ = f"{cls.__qualname__}.to_dict"
+    return converter
+
+
+def _get_converter(cls: type) -> Callable[[Any], Dict[str, Any]]:
+    converter = _converters.get(cls)
+    if converter is None:
+        converter = _converters[cls] = _compile(cls)
+    return converter
+
+
+def _convert(value: Any) -> Any:
+    cls = type(value)
+    converter = _converters.get(cls)
+    if converter is not None:
+        return converter(value)
+    if cls in _ATOMIC:
+        return value
+    if cls is discord_types.Snowflake:
+        # Discord sends and expects snowflakes as strings.
+        return str(value)
+    if isinstance(value, (list, tuple)):
+        return [item if type(item) in _ATOMIC else _convert(item) for item in value]
+    if isinstance(value, dict):
+        # Like dataclasses.asdict, dict content is not filtered.
+        return {_convert(k): _convert(v) for (k, v) in value.items()}
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return _get_converter(cls)(value)
+    return value
+
+
+def convert(value: Any) -> Any:
+    """
+        Convert a value holding dataclass objects and snowflakes, e.g. a dict or a list of them, into
+        values ready for JSON encoding. Dataclass objects are converted as with :py:func:`to_dict`.
+    """
+    return _convert(value)
+
+
+def to_dict(obj: Any) -> Dict[str, Any]:
+    """
+        Convert a dataclass object into a dict ready for JSON encoding.
+    """
+    return _get_converter(type(obj))(obj)  # type: ignore[no-any-return]
+
+
+def dumps(obj: Any) -> str:
+    """
+        Encode a dataclass object as JSON.
+    """
+    return json_codec.dumps(to_dict(obj))
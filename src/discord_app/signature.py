@@ -0,0 +1,63 @@
+"""
+    Request signature verification for incoming Discord interactions.
+"""
+from typing import Optional, Union
+
+# Added "type: ignore" so mypy won't complain nacl doesn't have stub or py.typed.
+import nacl.signing     # type: ignore
+import nacl.encoding    # type: ignore
+import nacl.exceptions  # type: ignore
+
+
+class SignatureVerifier():
+    """
+        Verifies the Ed25519 signature Discord attaches to every interaction.
+
+        The public key is hex-decoded and parsed only once, so a single verifier
+        can be reused for every incoming request.
+
+        :param str public_key: Application public key as a hex string.
+    """
+
+    def __init__(self, public_key: str) -> None:
+        self.public_key = public_key
+        self._verify_key = nacl.signing.VerifyKey(public_key.encode("ascii"), nacl.encoding.HexEncoder)
+
+    def verify(
+        self,
+        timestamp: Union[str, bytes, None],
+        body: bytes,
+        signature: Union[str, bytes, None]
+    ) -> bool:
+        """
+            Test the signature of a request.
+
+            :param timestamp: Value of X-Signature-Timestamp header.
+            :param bytes body: Raw request body.
+            :param signature: Value of X-Signature-Ed25519 header.
+            :return: True if the signature matches, False if it doesn't or any of the input is malformed.
+        """
+        if not timestamp or not signature:
+            return False
+        if isinstance(timestamp, str):
+            timestamp = timestamp.encode("utf-8")
+        if isinstance(signature, str):
+            signature = signature.encode("ascii", errors="replace")
+        try:
+            self._verify_key.verify(
+                timestamp + body,
+                nacl.encoding.HexEncoder.decode(signature)
+            )
+        except (nacl.exceptions.BadSignatureError, ValueError, TypeError):
+            # ValueError / TypeError: signature is not a valid hex string or has wrong length.
+            return False
+        return True
+
+
+def get_verifier(current: Optional[SignatureVerifier], public_key: str) -> SignatureVerifier:
+    """
+        Return current verifier if it is built for public_key, otherwise build a new one.
+    """
+    if current is not None and current.public_key == public_key:
+        return current
+    return SignatureVerifier(public_key)
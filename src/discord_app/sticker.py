@@ -21,12 +21,6 @@ class Sticker(discord_types.DiscordDataClass):
     user: Optional['user_module.User'] = None
     sort_value: Optional[int] = None
 
-    def __post_init__(self) -> None:
-        self.type = discord_types.StickerType(self.type)
-        self.format_type = discord_types.StickerFormatType(self.format_type)
-        if isinstance(self.user, dict):
-            self.user = user_module.User(**self.user)  # type: ignore[unreachable]
-
 
 @dataclass
 class StickerItem(discord_types.DiscordDataClass):
@@ -34,9 +28,6 @@ class StickerItem(discord_types.DiscordDataClass):
     name: str
     format_type: discord_types.StickerFormatType
 
-    def __post_init__(self) -> None:
-        self.format_type = discord_types.StickerFormatType(self.format_type)
-
 
 @dataclass
 class StickerPack(discord_types.DiscordDataClass):
@@ -47,9 +38,3 @@ class StickerPack(discord_types.DiscordDataClass):
     description: str
     cover_sticker_id: Optional[discord_types.Snowflake] = None
     banner_asset_id: Optional[discord_types.Snowflake] = None
-
-    def __post_init__(self) -> None:
-        self.stickers = [
-            Sticker(**sticker) if isinstance(sticker, dict) else sticker
-            for sticker in self.stickers
-        ]
@@ -6,6 +6,7 @@ from . import discord_types
 from . import guild as guild_module
 
 
+@discord_types.slots
 @dataclass
 class User(discord_types.DiscordDataClass):
     """
@@ -30,14 +31,6 @@ class User(discord_types.DiscordDataClass):
     # The following attributes are undocumented
     avatar_decoration: Optional[Any] = None
 
-    def __post_init__(self) -> None:
-        if isinstance(self.flags, int):
-            self.flags = discord_types.UserFlag(self.flags)
-        if isinstance(self.premium_type, int):
-            self.premium_type = discord_types.PremiumTypes(self.premium_type)
-        if isinstance(self.public_flags, int):
-            self.public_flags = discord_types.UserFlag(self.public_flags)
-
 
 PartialUser = User
 
@@ -53,11 +46,3 @@ class Connection(discord_types.DiscordDataClass):
     visibility: discord_types.Visibility
     revoked: Optional[bool] = None
     integrations: Optional[List[guild_module.Integration]] = None
-
-    def __post_init__(self) -> None:
-        self.visibility = discord_types.Visibility(self.visibility)
-        if isinstance(self.integrations, list):
-            self.integrations = [
-                guild_module.Integration(**i) if isinstance(i, dict) else i
-                for i in self.integrations
-            ]
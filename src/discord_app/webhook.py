@@ -1,7 +1,8 @@
 
 from dataclasses import dataclass
-from typing import Any, Optional
+from typing import Any, Iterable, Optional
 
+from . import decoder
 from . import discord_types
 from . import user as user_module
 from . import guild as guild_module
@@ -34,13 +35,6 @@ class Webhook(discord_types.DiscordDataClass):
     _app: Optional['application.Application'] = None
     _valid: Optional[bool] = True
 
-    def __post_init__(self) -> None:
-        self.type = discord_types.WebhookType(self.type)
-        if isinstance(self.user, dict):
-            self.user = user_module.User(**self.user)  # type: ignore[unreachable]
-        if isinstance(self.source_guild, dict):
-            self.source_guild = guild_module.PartialGuild(**self.source_guild)  # type: ignore[unreachable]
-
     def edit(self, *_: Any, name: Optional[str] = None, avatar: Optional[str] = None, channel_id: Optional[discord_types.Snowflake] = None) -> None:
         """
             Modify this webhook
@@ -55,7 +49,7 @@ class Webhook(discord_types.DiscordDataClass):
             raise RuntimeError("Not a valid webhook. (Could be deleted)")
         edit_obj = {
             "name": name if name is not None else self.name,
-            "channel_id": channel_id if channel_id is not None else self.channel_id
+            "channel_id": str(channel_id if channel_id is not None else self.channel_id)
         }
         _webhook_name_test(edit_obj["name"])
         if avatar:
@@ -65,8 +59,9 @@ class Webhook(discord_types.DiscordDataClass):
             f"/webhooks/{self.id}",
             json=edit_obj
         )
-        obj = Webhook(_app=self._app, **new_wh)
-        self.__dict__.update(obj.__dict__)
+        obj = decoder.decode(Webhook, new_wh, _app=self._app)
+        self._update_from(obj)
+        self._app._cache_entity(self)
 
     def delete(self) -> None:
         """
@@ -81,30 +76,28 @@ class Webhook(discord_types.DiscordDataClass):
             f"/webhooks/{self.id}"
         )
         self._valid = False
+        self._app._invalidate_entity(Webhook, self.id)
 
-    def get_channel(self) -> 'channel.Channel':
+    def get_channel(self, fields: Optional[Iterable[str]] = None) -> 'channel.Channel':
         """
             Get the binded channel object.
+
+            :param fields: Only decode these fields, see :py:meth:`application.Application.get_channel`.
         """
         if self._app is None or not self._app._is_authorized:
             raise RuntimeError("Unable to create Webhook: application is not authorized.")
-        chn_info, _ = self._app.call_api(
-            "GET",
-            f"/channels/{self.channel_id}"
-        )
-        return channel.Channel(_app=self._app, **chn_info)
+        return self._app.get_channel(self.channel_id, fields)
 
-    def get_guild(self) -> 'guild_module.Guild':
+    def get_guild(self, fields: Optional[Iterable[str]] = None, with_counts: bool = False) -> 'guild_module.Guild':
         """
             Get the guild where this webhook is binded to.
+
+            :param fields: Only decode these fields, see :py:meth:`application.Application.get_guild`.
+            :param bool with_counts: Include approximate member counts.
         """
         if self._app is None or not self._app._is_authorized:
             raise RuntimeError("Unable to create Webhook: application is not authorized.")
         if self.guild_id:
-            guild_info, _ = self._app.call_api(
-                "GET",
-                f"/guilds/{self.guild_id}"
-            )
-            return guild_module.Guild(_app=self._app, **guild_info)
+            return self._app.get_guild(self.guild_id, fields, with_counts)
         else:
             raise ValueError("No valid guild_id in this webhook.")
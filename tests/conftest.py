@@ -0,0 +1,139 @@
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import threading
+import time
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
+import nacl.signing  # type: ignore
+import pytest
+
+import discord_app.application
+
+
+class OfflineApplication():
+    """
+        Application instance which doesn't talk to Discord, with helpers for posting signed interactions.
+    """
+
+    def __init__(self, app: discord_app.application.Application, signing_key: Any, api_calls: List[Tuple[Any, ...]]) -> None:
+        self.app = app
+        self.signing_key = signing_key
+        self.api_calls = api_calls
+        self.client = app._flask.test_client()
+
+    def sign(self, body: bytes, timestamp: str) -> str:
+        return self.signing_key.sign(timestamp.encode("utf-8") + body).signature.hex()  # type: ignore[no-any-return]
+
+    def signed_headers(self, body: bytes, timestamp: Any = None, signature: Any = None) -> Dict[str, str]:
+        timestamp = str(int(time.time())) if timestamp is None else timestamp
+        return {
+            "Content-Type": "application/json",
+            "X-Signature-Timestamp": timestamp,
+            "X-Signature-Ed25519": self.sign(body, timestamp) if signature is None else signature
+        }
+
+    def post(self, payload: Dict[str, Any], timestamp: Any = None, signature: Any = None) -> Any:
+        body = json.dumps(payload).encode("utf-8")
+        return self.client.post(
+            self.app._endpoint,
+            data=body,
+            headers=self.signed_headers(body, timestamp, signature)
+        )
+
+
+@pytest.fixture
+def offline_app(monkeypatch: pytest.MonkeyPatch) -> Iterator[OfflineApplication]:
+    api_calls: List[Tuple[Any, ...]] = []
+
+    def fake_call_api(self: Any, method: str, path: str, *args: Any, **kwargs: Any) -> Tuple[Any, Any]:
+        api_calls.append((method, path, args, kwargs))
+        return ([] if method == "GET" else None), SimpleNamespace(status_code=200)
+
+    monkeypatch.setattr(discord_app.application.Application, "call_api", fake_call_api)
+    signing_key = nacl.signing.SigningKey.generate()
+    app = discord_app.application.Application(
+        id="1234567890",
+        name="offline_app",
+        description="",
+        bot_public=False,
+        bot_require_code_grant=False,
+        verify_key=signing_key.verify_key.encode().hex(),
+        _bot_token="bot_token",
+        _endpoint="/interactions"
+    )
+    yield OfflineApplication(app, signing_key, api_calls)
+
+
+# (status, headers, json body) returned by a stub route
+StubResponse = Tuple[int, Dict[str, str], Any]
+
+
+class StubServer():
+    """
+        Local HTTP/1.1 server standing in for Discord API.
+
+        Set handler to a function taking (method, path, json body) and returning (status, headers, json body).
+    """
+
+    def __init__(self) -> None:
+        self.requests: List[Tuple[str, str, Any]] = []
+        self.handler: Callable[[str, str, Any], StubResponse] = lambda method, path, body: (200, {}, {})
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args: Any) -> None:
+                pass
+
+            def _handle(self) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                raw = self.rfile.read(length) if length else b""
+                body = json.loads(raw) if raw else None
+                stub.requests.append((self.command, self.path, body))
+                status, headers, response_body = stub.handler(self.command, self.path, body)
+                data = b"" if response_body is None else json.dumps(response_body).encode("utf-8")
+                self.send_response(status)
+                for k, v in headers.items():
+                    self.send_header(k, v)
+                if response_body is not None:
+                    self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            do_GET = do_POST = do_PATCH = do_PUT = do_DELETE = _handle
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def close(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def stub_server() -> Iterator[StubServer]:
+    server = StubServer()
+    yield server
+    server.close()
+
+
+def make_api_app(api_base: str, **kwargs: Any) -> discord_app.application.Application:
+    """
+        Application which sends API calls to api_base and doesn't serve interactions.
+    """
+    return discord_app.application.Application(
+        id="1234567890",
+        name="api_app",
+        description="",
+        bot_public=False,
+        bot_require_code_grant=False,
+        verify_key=None,  # type: ignore[arg-type]
+        _bot_token="bot_token",
+        _api_base=api_base,
+        **kwargs
+    )
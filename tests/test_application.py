@@ -11,5 +11,5 @@ app = discord_app.application.Application.from_basic_data(
 
 
 def test_application() -> None:
-    assert app.id == ENV.get("DISCORD_APP_ID")
+    assert str(app.id) == ENV.get("DISCORD_APP_ID")
     assert app._is_authorized
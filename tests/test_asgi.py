@@ -0,0 +1,94 @@
+import asyncio
+import json
+from typing import Any, Dict, List
+
+import pytest
+
+import discord_app
+from conftest import OfflineApplication
+
+
+def command_payload(interaction_id: str, name: str) -> Dict[str, Any]:
+    return {
+        "id": interaction_id,
+        "application_id": "1234567890",
+        "type": 2,
+        "token": "token",
+        "data": {"id": "1", "name": name, "type": 1}
+    }
+
+
+def register_commands(app: discord_app.Application) -> None:
+    @app.application_command(discord_app.ApplicationCommand(name="sync_cmd", description="sync"))
+    def sync_cmd(request: discord_app.InteractionRequest) -> discord_app.InteractionResponse:
+        return discord_app.InteractionResponse(
+            type=discord_app.InteractionResponseType.CHANNEL_MESSAGE_WITH_SOURCE,
+            data=discord_app.InteractionResponseMessage(content="sync")
+        )
+
+    @app.application_command(discord_app.ApplicationCommand(name="async_cmd", description="async"))
+    async def async_cmd(request: discord_app.InteractionRequest) -> discord_app.InteractionResponse:
+        await asyncio.sleep(0)
+        return discord_app.InteractionResponse(
+            type=discord_app.InteractionResponseType.CHANNEL_MESSAGE_WITH_SOURCE,
+            data=discord_app.InteractionResponseMessage(content="async")
+        )
+
+
+def asgi_post(offline_app: OfflineApplication, payload: Dict[str, Any], path: str = "/interactions") -> Dict[str, Any]:
+    body = json.dumps(payload).encode("utf-8")
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "path": path,
+        "headers": [(k.lower().encode("latin-1"), v.encode("latin-1")) for (k, v) in offline_app.signed_headers(body).items()]
+    }
+    sent: List[Dict[str, Any]] = []
+
+    async def receive() -> Dict[str, Any]:
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message: Dict[str, Any]) -> None:
+        sent.append(message)
+
+    asyncio.run(offline_app.app.asgi_app(scope, receive, send))
+    return {"status": sent[0]["status"], "json": json.loads(sent[1]["body"])}
+
+
+def test_asgi_ping(offline_app: OfflineApplication) -> None:
+    response = asgi_post(offline_app, {"id": "1", "application_id": "1", "type": 1, "token": "t"})
+    assert response == {"status": 200, "json": {"type": 1}}
+    assert asgi_post(offline_app, {"id": "2", "application_id": "1", "type": 1, "token": "t"}, path="/other")["status"] == 404
+
+
+def test_asgi_commands(offline_app: OfflineApplication) -> None:
+    register_commands(offline_app.app)
+    assert asgi_post(offline_app, command_payload("1", "sync_cmd"))["json"] == {"type": 4, "data": {"content": "sync"}}
+    assert asgi_post(offline_app, command_payload("2", "async_cmd"))["json"] == {"type": 4, "data": {"content": "async"}}
+    assert asgi_post(offline_app, command_payload("3", "unknown"))["status"] == 404
+
+
+def test_flask_async_command(offline_app: OfflineApplication) -> None:
+    register_commands(offline_app.app)
+    response = offline_app.post(command_payload("1", "async_cmd"))
+    assert response.status_code == 200
+    assert response.json == {"type": 4, "data": {"content": "async"}}
+
+
+def test_asgi_startup_failure(offline_app: OfflineApplication, monkeypatch: pytest.MonkeyPatch) -> None:
+    def sync_commands() -> None:
+        raise RuntimeError("Discord is down")
+
+    app = offline_app.app
+    app._defer_command_sync = True
+    monkeypatch.setattr(app, "sync_commands", sync_commands)
+    sent: List[Dict[str, Any]] = []
+
+    async def receive() -> Dict[str, Any]:
+        return {"type": "lifespan.startup"}
+
+    async def send(message: Dict[str, Any]) -> None:
+        sent.append(message)
+
+    asyncio.run(app.asgi_app({"type": "lifespan"}, receive, send))
+    assert sent == [{"type": "lifespan.startup.failed", "message": "Discord is down"}]
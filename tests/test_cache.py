@@ -0,0 +1,127 @@
+from concurrent.futures import ThreadPoolExecutor
+import threading
+from types import SimpleNamespace
+from typing import Any, Dict, Tuple
+
+import discord_app
+
+from discord_app import cache, channel
+from conftest import OfflineApplication
+
+
+def test_entity_cache() -> None:
+    entities = cache.EntityCache(max_size=2, ttl={SimpleNamespace: 10.0})
+    (first, second, third) = (SimpleNamespace(id=i) for i in range(3))
+    entities.put(first, now=0.0)
+    entities.put(second, now=0.0)
+    assert entities.get(SimpleNamespace, 0, now=5.0) is first
+    assert entities.get(channel.Channel, 0, now=5.0) is None
+    # second is the least recently used one.
+    entities.put(third, now=5.0)
+    assert entities.get(SimpleNamespace, 1, now=5.0) is None
+    assert entities.get(SimpleNamespace, 0, now=10.0) is None
+    assert entities.get(SimpleNamespace, 2, now=10.0) is third
+    entities.invalidate(SimpleNamespace, 2)
+    assert len(entities) == 0
+    assert entities.stats == {"size": 0, "hits": 2, "misses": 3, "evictions": 1}
+
+
+def test_decode_outside_lock() -> None:
+    entities = cache.EntityCache(max_size=10)
+    decoding = threading.Event()
+    release = threading.Event()
+
+    def decode(payload: Dict[str, Any]) -> SimpleNamespace:
+        decoding.set()
+        release.wait(5)
+        return SimpleNamespace(**payload)
+
+    entities.put_payload(SimpleNamespace, 1, {"id": 1, "name": "payload"}, decode)
+    with ThreadPoolExecutor(1) as pool:
+        decoded = pool.submit(entities.get, SimpleNamespace, 1)
+        assert decoding.wait(5)
+        # The cache is usable while the payload is decoded.
+        entities.put(SimpleNamespace(id=1, name="replaced"))
+        assert entities.get(SimpleNamespace, 1).name == "replaced"  # type: ignore[union-attr]
+        release.set()
+        assert decoded.result().name == "payload"  # type: ignore[union-attr]
+    assert entities.get(SimpleNamespace, 1).name == "replaced"  # type: ignore[union-attr]
+
+
+def test_application_entity_cache(offline_app: OfflineApplication) -> None:
+    app = offline_app.app
+    calls = []
+    webhook_data = {
+        "id": "10", "type": 1, "channel_id": "20", "name": "hook", "avatar": "",
+        "application_id": "1234567890", "guild_id": "30"
+    }
+
+    def call_api(method: str, path: str, *args: Any, **kwargs: Any) -> Tuple[Any, Any]:
+        calls.append((method, path))
+        if path == "/channels/20":
+            return {"id": "20", "type": 0, "name": "general"}, None
+        if method == "PATCH":
+            return {**webhook_data, "name": kwargs["json"]["name"]}, None
+        return webhook_data, None
+
+    app.call_api = call_api  # type: ignore[assignment]
+    hook = app.get_webhook(10)
+    assert hook.get_channel() is hook.get_channel() is app.get_channel("20")
+    assert calls == [("GET", "/webhooks/10"), ("GET", "/channels/20")]
+
+    hook.edit(name="renamed")
+    assert app.get_webhook(10).name == "renamed"
+    hook.delete()
+    assert app.get_webhook(10).name == "hook"
+    assert [method for (method, _) in calls] == ["GET", "GET", "PATCH", "DELETE", "GET"]
+    assert app.entity_cache_stats == {"size": 2, "hits": 3, "misses": 3, "evictions": 0}
+
+
+def test_seed_from_interaction(offline_app: OfflineApplication) -> None:
+    app = offline_app.app
+
+    @app.component("ok")
+    def ok(request: Any) -> Any:
+        return discord_app.InteractionResponse(type=discord_app.InteractionResponseType.UPDATE_MESSAGE)
+
+    def user(user_id: str) -> Dict[str, Any]:
+        return {"id": user_id, "username": f"user{user_id}", "discriminator": "0001", "avatar": None}
+
+    response = offline_app.post({
+        "id": "1", "application_id": "1234567890", "type": 3, "token": "token",
+        "member": {"user": user("40"), "roles": [], "joined_at": "2022-01-01T00:00:00+00:00"},
+        "message": {
+            "id": "50", "type": 0, "channel_id": "20", "author": user("41"), "content": "hi",
+            "timestamp": "2022-01-01T00:00:00+00:00",
+            "tts": False, "mention_everyone": False, "mentions": [], "mention_roles": [], "attachments": [], "embeds": []
+        },
+        "data": {
+            "custom_id": "ok", "component_type": 2,
+            "resolved": {"channels": {"20": {"id": "20", "type": 0, "name": "general"}}, "users": {"42": user("42")}}
+        }
+    })
+    assert response.status_code == 200
+    assert [app.get_user(user_id).username for user_id in (40, 42)] == ["user40", "user42"]
+    message = app.get_message(20, 50)
+    assert message.content == "hi"
+    assert message._app is app
+    assert offline_app.api_calls == []
+    # Resolved channels are partial.
+    assert app._entity_cache.get(channel.Channel, 20) is None  # type: ignore[union-attr]
+
+
+def test_get_guild_fields(offline_app: OfflineApplication) -> None:
+    app = offline_app.app
+    calls = []
+
+    def call_api(method: str, path: str, *args: Any, **kwargs: Any) -> Tuple[Any, Any]:
+        calls.append(path)
+        return {"id": "30", "name": "guild", "owner_id": "40", "approximate_member_count": 5}, None
+
+    app.call_api = call_api  # type: ignore[assignment]
+    partial = app.get_guild(30, fields=["name"])
+    assert (partial.name, partial.owner_id) == ("guild", None)
+    assert app.entity_cache_stats["size"] == 0
+    counted = app.get_guild(30, fields=["approximate_member_count"], with_counts=True)
+    assert counted.approximate_member_count == 5
+    assert calls == ["/guilds/30", "/guilds/30?with_counts=true"]
@@ -26,4 +26,4 @@ def test_channel_post_message() -> None:
 
     msg_chn = msg.get_channel()  # type: ignore[unreachable]
 
-    assert msg_chn.id == channel_id
+    assert str(msg_chn.id) == channel_id
@@ -0,0 +1,115 @@
+import logging
+import pathlib
+from typing import Any
+
+import pytest
+import requests
+
+import discord_app
+from discord_app import command_cache
+from conftest import OfflineApplication, StubResponse, StubServer, make_api_app
+
+
+def test_sync_commands(offline_app: OfflineApplication) -> None:
+    app = offline_app.app
+    app._defer_command_sync = True
+    app._previously_registered_commands = [
+        {"id": "1", "application_id": "1234567890", "version": "1", "type": 1, "name": "same", "description": "same"},
+        {"id": "2", "application_id": "1234567890", "version": "1", "type": 1, "name": "gone", "description": "gone"}
+    ]
+    for name in ("same", "new"):
+        app.application_command(discord_app.ApplicationCommand(name=name, description=name))(lambda request: None)
+    app.application_command(discord_app.ApplicationCommand(
+        name="guild", description="guild", guild_id="42"
+    ))(lambda request: None)
+    assert offline_app.api_calls == []
+
+    assert app.sync_commands()
+    calls = [(method, path) for (method, path, _, _) in offline_app.api_calls]
+    assert calls == [
+        ("PUT", "/applications/1234567890/commands"),
+        ("GET", "/applications/1234567890/guilds/42/commands"),
+        ("PUT", "/applications/1234567890/guilds/42/commands")
+    ]
+    body = offline_app.api_calls[0][3]["json"]
+    assert [command["name"] for command in body] == ["same", "new"]
+
+
+def test_sync_commands_unchanged(offline_app: OfflineApplication) -> None:
+    app = offline_app.app
+    app._defer_command_sync = True
+    app._previously_registered_commands = [
+        {"id": "1", "application_id": "1234567890", "version": "1", "type": 1, "name": "same", "description": "same"},
+        {"id": "2", "application_id": "1234567890", "version": "1", "type": 1, "name": "old", "description": "old"}
+    ]
+    app.application_command(discord_app.ApplicationCommand(name="same", description="same"))(lambda request: None)
+    app.application_command(
+        discord_app.ApplicationCommand(name="old", description="changed"),
+        register_on_change=False
+    )(lambda request: None)
+
+    assert not app.sync_commands()
+    assert offline_app.api_calls == []
+
+
+def test_spec_hash_is_key_order_independent() -> None:
+    spec = {"name": "cmd", "description": "cmd", "options": [{"name": "a", "type": 3}, {"name": "b", "type": 4}]}
+    reordered = {"options": [{"type": 3, "name": "a"}, {"type": 4, "name": "b"}], "description": "cmd", "name": "cmd"}
+    assert command_cache.spec_hash(spec) == command_cache.spec_hash(reordered)
+    spec["options"].reverse()
+    assert command_cache.spec_hash(spec) != command_cache.spec_hash(reordered)
+
+
+def test_command_cache_skips_unchanged(offline_app: OfflineApplication, tmp_path: pathlib.Path) -> None:
+    cache_path = str(tmp_path / "commands.json")
+    app = offline_app.app
+    app._command_cache = command_cache.RegistrationCache(cache_path, app.id)
+    app.application_command(discord_app.ApplicationCommand(name="cmd", description="cmd"))(lambda request: None)
+    assert [call[0] for call in offline_app.api_calls] == ["GET", "POST"]
+
+    # Next start: nothing fetched or registered.
+    offline_app.api_calls.clear()
+    app._previously_registered_commands = None
+    app._command_cache = command_cache.RegistrationCache(cache_path, app.id)
+    app.application_command(discord_app.ApplicationCommand(name="cmd", description="cmd"))(lambda request: None)
+    assert offline_app.api_calls == []
+
+    app.application_command(discord_app.ApplicationCommand(name="cmd", description="changed"))(lambda request: None)
+    assert [call[0] for call in offline_app.api_calls] == ["GET", "POST"]
+
+    # Cache of another application is ignored.
+    assert command_cache.RegistrationCache(cache_path, "1").scope(command_cache.GLOBAL_SCOPE) == {}
+
+
+def test_sync_commands_cache(offline_app: OfflineApplication, tmp_path: pathlib.Path) -> None:
+    app = offline_app.app
+    app._defer_command_sync = True
+    app._command_cache = command_cache.RegistrationCache(str(tmp_path / "commands.json"), app.id)
+    app.application_command(discord_app.ApplicationCommand(name="cmd", description="cmd"))(lambda request: None)
+
+    assert app.sync_commands()
+    assert [call[0] for call in offline_app.api_calls] == ["GET", "PUT"]
+    offline_app.api_calls.clear()
+    assert not app.sync_commands()
+    assert offline_app.api_calls == []
+
+
+def test_sync_commands_failure(stub_server: StubServer) -> None:
+    def handler(method: str, path: str, body: Any) -> StubResponse:
+        if method == "PUT" and "guilds" not in path:
+            return 400, {}, {"message": "Invalid Form Body", "code": 50035}
+        return 200, {}, body or []
+
+    stub_server.handler = handler
+    app = make_api_app(stub_server.url, _defer_command_sync=True, _logger=logging.getLogger(__name__))
+    app.verify_key = "00" * 32
+    app._previously_registered_commands = []
+    app.application_command(discord_app.ApplicationCommand(name="bad", description="bad"))(lambda request: None)
+    app.application_command(discord_app.ApplicationCommand(
+        name="guild", description="guild", guild_id="42"
+    ))(lambda request: None)
+    with pytest.raises(requests.HTTPError):
+        app.sync_commands()
+    # Other scopes are registered anyway.
+    assert ("PUT", "/applications/1234567890/guilds/42/commands") in [(method, path) for (method, path, _) in stub_server.requests]
+    app.close()
@@ -0,0 +1,108 @@
+import pytest
+
+from discord_app import channel, decoder, discord_types, guild
+
+
+def channel_payload() -> dict:  # type: ignore[type-arg]
+    return {
+        "id": "200000000000000000",
+        "type": 0,
+        "name": "general",
+        "permission_overwrites": [{"id": "1", "type": 0, "allow": "0", "deny": "0"}],
+        "recipients": [{"id": "2", "username": "user", "discriminator": "0001", "avatar": None}]
+    }
+
+
+def test_decode_nested() -> None:
+    result = decoder.decode(channel.Channel, channel_payload())
+    assert isinstance(result, channel.Channel)
+    assert result.type is discord_types.ChannelType.GUILD_TEXT
+    assert isinstance(result.permission_overwrites[0], channel.Overwrite)  # type: ignore[index]
+    assert result.recipients[0].username == "user"  # type: ignore[index]
+    assert result.topic is None
+    assert result == channel.Channel(**channel_payload())
+
+
+def test_decode_ignores_unknown_keys() -> None:
+    payload = channel_payload()
+    payload["added_to_the_api_later"] = True
+    result = decoder.decode(channel.Channel, payload)
+    assert not hasattr(result, "added_to_the_api_later")
+    assert result == channel.Channel(**channel_payload())
+
+
+def test_decode_unknown_enum_value() -> None:
+    payload = channel_payload()
+    payload["type"] = 999
+    assert decoder.decode(channel.Channel, payload).type == 999
+
+
+def test_decode_missing_required() -> None:
+    with pytest.raises(TypeError, match="name"):
+        decoder.decode(guild.Role, {"id": "1", "color": 0, "hoist": False, "position": 0,
+                                    "permissions": "0", "managed": False, "mentionable": False})
+
+
+def test_decode_unknown_key_and_missing_required() -> None:
+    with pytest.raises(TypeError, match="url"):
+        decoder.decode(channel.Attachment, {"id": "1", "filename": "a.png", "size": 1, "proxy_url": "", "bogus": 1})
+    with pytest.raises(TypeError, match="id"):
+        decoder.decode(channel.Channel, {"type": 0, "bogus": 1})
+    attachment = decoder.decode(channel.Attachment, {
+        "id": "1", "filename": "a.png", "size": 1, "url": "", "proxy_url": "", "bogus": 1
+    })
+    assert "bogus" not in vars(attachment)
+
+
+def test_decode_polymorphic() -> None:
+    row = decoder.decode(channel.MessageComponent, {
+        "type": 1,
+        "components": [{"type": 2, "style": 1, "custom_id": "ok", "label": "OK"}]
+    })
+    assert isinstance(row, channel.MessageComponentActionRow)
+    assert isinstance(row.components[0], channel.MessageComponentButton)
+    assert row.components[0].style is discord_types.MessageComponentButtonStyle.PRIMARY
+
+
+def test_decode_unknown_component_type() -> None:
+    row = decoder.decode(channel.MessageComponent, {
+        "type": 1,
+        "components": [{"type": 5, "custom_id": "users"}, {"type": 2, "style": 1, "custom_id": "ok"}]
+    })
+    assert isinstance(row.components[0], channel.MessageComponentUnknown)
+    assert row.components[0].type == 5
+    assert isinstance(row.components[1], channel.MessageComponentButton)
+    with pytest.raises(TypeError, match="type"):
+        decoder.decode(channel.MessageComponent, {"custom_id": "ok"})
+
+
+def test_decode_list_with_kwargs() -> None:
+    roles = decoder.decode_list(guild.Role, [
+        {"id": str(i), "name": f"role{i}", "color": 0, "hoist": False, "position": i,
+         "permissions": "0", "managed": False}
+        for i in range(3)
+    ], mentionable=True)
+    assert [role.name for role in roles] == ["role0", "role1", "role2"]
+    assert all(role.mentionable for role in roles)
+
+
+def test_enum_table() -> None:
+    table = decoder.EnumTable(discord_types.UserFlag, cache_size=2)
+    assert table(1 << 6) is discord_types.UserFlag.HYPESQUAD_ONLINE_HOUSE_1
+    combined = table((1 << 6) | (1 << 17))
+    assert combined == discord_types.UserFlag.HYPESQUAD_ONLINE_HOUSE_1 | discord_types.UserFlag.VERIFIED_DEVELOPER
+    assert table((1 << 6) | (1 << 17)) is combined
+
+    table = decoder.EnumTable(discord_types.ChannelType, cache_size=2)
+    assert table(0) is discord_types.ChannelType.GUILD_TEXT
+    assert [table(value) for value in (997, 998, 999)] == [997, 998, 999]
+    assert len(table.members) == len(discord_types.ChannelType.__members__) + 2
+
+
+def test_decode_fields() -> None:
+    result = decoder.decode_fields(channel.Channel, channel_payload(), ["name", "recipients"], _app="app")
+    assert (result.id, result.name, result._app) == (discord_types.Snowflake(200000000000000000), "general", "app")
+    assert result.recipients[0].username == "user"  # type: ignore[index]
+    assert result.type is None and result.permission_overwrites is None
+    with pytest.raises(ValueError, match="nickname"):
+        decoder.decode_fields(channel.Channel, channel_payload(), ["nickname"])
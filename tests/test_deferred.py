@@ -0,0 +1,61 @@
+import threading
+
+import discord_app
+from conftest import OfflineApplication
+
+
+def command_payload(interaction_id: str, name: str) -> dict:  # type: ignore[type-arg]
+    return {
+        "id": interaction_id,
+        "application_id": "1234567890",
+        "type": 2,
+        "token": "token",
+        "data": {"id": "1", "name": name, "type": 1}
+    }
+
+
+def test_deferred_command(offline_app: OfflineApplication) -> None:
+    app = offline_app.app
+    release = threading.Event()
+
+    @app.application_command(discord_app.ApplicationCommand(name="slow", description="slow"), deferred=True)
+    def slow(request: discord_app.InteractionRequest) -> discord_app.InteractionResponse:
+        release.wait(5)
+        return discord_app.InteractionResponse(
+            type=discord_app.InteractionResponseType.CHANNEL_MESSAGE_WITH_SOURCE,
+            data=discord_app.InteractionResponseMessage(content="finally")
+        )
+
+    @app.application_command(discord_app.ApplicationCommand(name="broken", description="broken"), deferred=True)
+    def broken(request: discord_app.InteractionRequest) -> discord_app.InteractionResponse:
+        raise ValueError("broken")
+
+    response = offline_app.post(command_payload("1", "slow"))
+    assert response.json == {"type": 5}
+    assert app.deferred_stats["queued"] + app.deferred_stats["running"] == 1
+
+    release.set()
+    offline_app.post(command_payload("2", "broken"))
+    app._deferred.shutdown(wait=True)  # type: ignore[union-attr]
+
+    edits = [call for call in offline_app.api_calls if call[0] == "PATCH"]
+    assert [call[1] for call in edits] == ["/webhooks/1234567890/token/messages/@original"] * 2
+    assert edits[0][3]["json"] == discord_app.InteractionResponseMessage(content="finally")
+    assert edits[0][3]["use_bot_token"] is False
+    stats = app.deferred_stats
+    assert (stats["completed"], stats["failed"], stats["queued"], stats["running"]) == (1, 1, 0, 0)
+    assert stats["latency_max"] > 0
+
+
+def test_deferred_queue_full(offline_app: OfflineApplication) -> None:
+    app = offline_app.app
+    app._deferred_queue_size = 0
+
+    @app.application_command(discord_app.ApplicationCommand(name="slow", description="slow"), deferred=True)
+    def slow(request: discord_app.InteractionRequest) -> None:
+        pass
+
+    response = offline_app.post(command_payload("1", "slow"))
+    assert response.json["type"] == 4
+    assert response.json["data"]["flags"] == discord_app.discord_types.MessageFlags.EPHEMERAL
+    assert app.deferred_stats["rejected"] == 1
@@ -0,0 +1,68 @@
+import copy
+from dataclasses import dataclass
+import datetime
+import pickle
+from typing import Optional
+
+from discord_app import channel, discord_types, emoji, guild, serializer, user
+
+
+def user_payload() -> dict:  # type: ignore[type-arg]
+    return {"id": "1", "username": "user", "discriminator": "0001", "avatar": None, "public_flags": 64}
+
+
+def test_slotted_classes() -> None:
+    for cls in (user.User, guild.Role, guild.GuildMember, emoji.Emoji, channel.Message):
+        assert "__dict__" not in dir(cls), cls
+    member = guild.GuildMember(joined_at="2022-01-01", roles=[], user=user_payload())  # type: ignore[arg-type]
+    assert member.deaf is False
+    assert member.nick is None
+    assert isinstance(member.user, user.User)
+    assert member.user.public_flags is discord_types.UserFlag(64)
+    assert member == copy.copy(member) == pickle.loads(pickle.dumps(member))
+
+
+def test_update_from() -> None:
+    old = user.User(**user_payload())
+    new = user.User(**{**user_payload(), "username": "renamed"})
+    old._update_from(new)
+    assert old.username == "renamed"
+    assert old == new
+
+
+def test_slots_super() -> None:
+    @discord_types.slots
+    @dataclass
+    class Named(discord_types.DiscordDataClass):
+        name: str
+        owner: Optional[user.User] = None
+
+        def __post_init__(self) -> None:
+            super().__post_init__()
+            self.name = self.name.upper()
+
+    named = Named("named", owner=user_payload())  # type: ignore[arg-type]
+    assert named.name == "NAMED"
+    assert isinstance(named.owner, user.User)
+    assert not hasattr(named, "__dict__")
+
+
+def test_snowflake() -> None:
+    # Example from https://discord.com/developers/docs/reference#snowflakes
+    snowflake = discord_types.Snowflake("175928847299117063")
+    assert snowflake == 175928847299117063
+    assert snowflake.timestamp == 1462015105796
+    assert snowflake.created_at == datetime.datetime(2016, 4, 30, 11, 18, 25, 796000, tzinfo=datetime.timezone.utc)
+    assert (snowflake.worker_id, snowflake.process_id, snowflake.increment) == (1, 0, 7)
+    assert discord_types.Snowflake.from_datetime(snowflake.created_at) == snowflake >> 22 << 22
+    assert f"/users/{snowflake}" == "/users/175928847299117063"
+
+
+def test_snowflake_attributes() -> None:
+    member = guild.GuildMember(joined_at="2022-01-01", roles=["2", "3"], user=user_payload())  # type: ignore[arg-type]
+    assert member.user is not None
+    assert type(member.user.id) is discord_types.Snowflake
+    assert member.roles == [2, 3]
+    assert {member.user.id: member}[1] is member
+    assert serializer.to_dict(member)["roles"] == ["2", "3"]
+    assert serializer.to_dict(member.user)["id"] == "1"
@@ -0,0 +1,184 @@
+from typing import Any, Dict
+
+import discord_app
+from discord_app import lazy
+from conftest import OfflineApplication
+
+
+def interaction_payload(interaction_id: str, interaction_type: int, data: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "id": interaction_id,
+        "application_id": "1234567890",
+        "type": interaction_type,
+        "token": "token",
+        "data": data
+    }
+
+
+def reply(content: str) -> discord_app.InteractionResponse:
+    return discord_app.InteractionResponse(
+        type=discord_app.InteractionResponseType.UPDATE_MESSAGE,
+        data=discord_app.InteractionResponseMessage(content=content)
+    )
+
+
+def test_component_dispatch(offline_app: OfflineApplication) -> None:
+    app = offline_app.app
+
+    @app.component("vote:", prefix=True)
+    def vote(request: discord_app.InteractionRequest) -> discord_app.InteractionResponse:
+        return reply(f"vote {request.data.custom_id}")  # type: ignore[union-attr]
+
+    @app.component("vote:poll:", prefix=True)
+    def poll(request: discord_app.InteractionRequest) -> discord_app.InteractionResponse:
+        return reply(f"poll {request.data.values}")  # type: ignore[union-attr]
+
+    @app.component("vote:close")
+    def close(request: discord_app.InteractionRequest) -> discord_app.InteractionResponse:
+        return reply("closed")
+
+    def content(interaction_id: str, custom_id: str, **data: Any) -> Any:
+        response = offline_app.post(interaction_payload(interaction_id, 3, {"custom_id": custom_id, **data}))
+        return response.json["data"]["content"] if response.status_code == 200 else response.status_code
+
+    assert content("1", "vote:yes", component_type=2) == "vote vote:yes"
+    assert content("2", "vote:poll:1", component_type=3, values=["a", "b"]) == "poll ['a', 'b']"
+    assert content("3", "vote:close", component_type=2) == "closed"
+    assert content("4", "other", component_type=2) == 404
+
+
+def test_modal_and_autocomplete_dispatch(offline_app: OfflineApplication) -> None:
+    app = offline_app.app
+
+    @app.modal("feedback")
+    def feedback(request: discord_app.InteractionRequest) -> discord_app.InteractionResponse:
+        text_input = request.data.components[0].components[0]  # type: ignore[union-attr, index]
+        return reply(f"thanks for {text_input.value}")
+
+    @app.autocomplete("fruit")
+    def fruit(request: discord_app.InteractionRequest) -> discord_app.InteractionResponse:
+        return discord_app.InteractionResponse(
+            type=discord_app.InteractionResponseType.APPLICATION_AUTOCOMPLETE_RESULT,
+            data=discord_app.InteractionResponseAutocomplete(choices=[
+                discord_app.ApplicationCommandOptionChoice(name="apple", value="apple")
+            ])
+        )
+
+    response = offline_app.post(interaction_payload("1", 5, {
+        "custom_id": "feedback",
+        "components": [{"type": 1, "components": [{"type": 4, "custom_id": "text", "value": "good"}]}]
+    }))
+    assert response.json["data"]["content"] == "thanks for good"
+
+    response = offline_app.post(interaction_payload("2", 4, {
+        "id": "1",
+        "name": "fruit",
+        "type": 1,
+        "options": [{"name": "name", "type": 3, "value": "ap", "focused": True}]
+    }))
+    assert response.json == {"type": 8, "data": {"choices": [{"name": "apple", "value": "apple"}]}}
+
+    # The command itself has no handler.
+    response = offline_app.post(interaction_payload("3", 2, {"id": "1", "name": "fruit", "type": 1}))
+    assert response.status_code == 404
+
+
+def test_subcommand_dispatch(offline_app: OfflineApplication) -> None:
+    app = offline_app.app
+    option_type = discord_app.ApplicationCommandOptionType
+
+    @app.application_command(discord_app.ApplicationCommand(name="config", description="config", options=[
+        discord_app.ApplicationCommandOption(name="show", description="show", type=option_type.SUB_COMMAND),
+        discord_app.ApplicationCommandOption(name="limit", description="limit", type=option_type.SUB_COMMAND, options=[
+            discord_app.ApplicationCommandOption(name="value", description="value", type=option_type.NUMBER)
+        ]),
+        discord_app.ApplicationCommandOption(name="role", description="role", type=option_type.SUB_COMMAND_GROUP, options=[
+            discord_app.ApplicationCommandOption(name="add", description="add", type=option_type.SUB_COMMAND, options=[
+                discord_app.ApplicationCommandOption(name="role", description="role", type=option_type.ROLE),
+                discord_app.ApplicationCommandOption(name="days", description="days", type=option_type.INTEGER)
+            ])
+        ])
+    ]))
+    def config(request: discord_app.InteractionRequest) -> discord_app.InteractionResponse:
+        return reply(f"config {request.arguments}")
+
+    @app.subcommand("config", "limit")
+    def limit(request: discord_app.InteractionRequest) -> discord_app.InteractionResponse:
+        return reply(f"limit {request.arguments!r}")
+
+    @app.subcommand("config", "role", "add")
+    def add_role(request: discord_app.InteractionRequest) -> discord_app.InteractionResponse:
+        role = request.arguments["role"]
+        return reply(f"add {type(role).__name__} {role.name} for {request.arguments['days']!r}")
+
+    def content(interaction_id: str, **data: Any) -> Any:
+        response = offline_app.post(interaction_payload(interaction_id, 2, {"id": "1", "name": "config", "type": 1, **data}))
+        return response.json["data"]["content"]
+
+    assert content("1", options=[{"name": "show", "type": 1}]) == "config {}"
+    # Integers are accepted for NUMBER options.
+    assert content("2", options=[{"name": "limit", "type": 1, "options": [
+        {"name": "value", "type": 10, "value": 3}
+    ]}]) == "limit {'value': 3.0}"
+    assert content("3", options=[{"name": "role", "type": 2, "options": [
+        {"name": "add", "type": 1, "options": [
+            {"name": "role", "type": 8, "value": "20"},
+            {"name": "days", "type": 4, "value": 7}
+        ]}
+    ]}], resolved={"roles": {"20": {
+        "id": "20", "name": "mods", "color": 0, "hoist": False, "position": 1,
+        "permissions": "0", "managed": False, "mentionable": True
+    }}}) == "add Role mods for 7"
+
+
+def test_malformed_options(offline_app: OfflineApplication) -> None:
+    app = offline_app.app
+
+    @app.application_command(discord_app.ApplicationCommand(name="ban", description="ban", options=[
+        discord_app.ApplicationCommandOption(name="days", description="days", type=discord_app.ApplicationCommandOptionType.INTEGER)
+    ]))
+    def ban(request: discord_app.InteractionRequest) -> discord_app.InteractionResponse:
+        # Resolved objects and arguments are only decoded when read.
+        assert lazy.peek(request.data, "resolved")[1] is False
+        return reply("ban")
+
+    def post(interaction_id: str, options: Any) -> Any:
+        return offline_app.post(interaction_payload(interaction_id, 2, {
+            "id": "1", "name": "ban", "type": 1, "options": options,
+            "resolved": {"users": {"30": {"id": "30", "username": "user", "discriminator": "0001", "avatar": None}}}
+        }))
+
+    assert post("1", [{"name": "days", "type": 4, "value": "a week"}]).status_code == 200
+    assert post("2", [{"name": "days", "value": 7}]).status_code == 400
+
+
+def test_arguments_without_dispatch() -> None:
+    request = discord_app.InteractionRequest(id="1", application_id="2", type=2, token="token", data={  # type: ignore[arg-type]
+        "id": "1", "name": "kick", "type": 1,
+        "options": [{"name": "user", "type": 6, "value": "30"}, {"name": "reason", "type": 3, "value": "spam"}]
+    })
+    assert request.arguments == {"user": 30, "reason": "spam"}
+    assert type(request.arguments["user"]) is discord_app.Snowflake
+
+
+def test_autocomplete_index(offline_app: OfflineApplication) -> None:
+    index = discord_app.AutocompleteIndex(
+        ["Apple", "apricot", "Pineapple", "banana", discord_app.ApplicationCommandOptionChoice(name="Grape", value=3)],
+        fuzzy=True,
+        limit=3
+    )
+    assert [choice.name for choice in index.search("AP")] == ["Apple", "apricot", "Grape"]
+    assert [choice.name for choice in index.search("app")] == ["Apple", "Pineapple"]
+    assert [choice.value for choice in index.search("grape")] == [3]
+    assert [choice.name for choice in index.search("an")] == ["banana"]
+    assert [choice.name for choice in index.search("")] == ["Apple", "apricot", "banana"]
+    assert discord_app.AutocompleteIndex(["Pineapple"]).search("apple") == []
+
+    offline_app.app.autocomplete("fruit")(index.handle)
+    response = offline_app.post(interaction_payload("1", 4, {
+        "id": "1",
+        "name": "fruit",
+        "type": 1,
+        "options": [{"name": "name", "type": 3, "value": "pine", "focused": True}]
+    }))
+    assert response.json == {"type": 8, "data": {"choices": [{"name": "Pineapple", "value": "Pineapple"}]}}
@@ -0,0 +1,75 @@
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import time
+from typing import Any, Dict, Tuple
+
+from discord_app import channel, discord_types, http_client
+from conftest import StubServer, make_api_app
+
+
+def test_connection_reuse(stub_server: StubServer) -> None:
+    stub_server.handler = lambda method, path, body: (200, {}, {"path": path})
+    app = make_api_app(stub_server.url)
+    for i in range(5):
+        data, _ = app.call_api("GET", f"/channels/{i}")
+        assert data == {"path": f"/channels/{i}"}
+
+    assert app.connection_stats == {
+        "requests": 5,
+        "connections_opened": 1,
+        "connections_reused": 4
+    }
+    app.close()
+
+
+def test_no_keep_alive(stub_server: StubServer) -> None:
+    stub_server.handler = lambda method, path, body: (204, {}, None)
+    app = make_api_app(stub_server.url, _http_options=http_client.ConnectionPoolOptions(keep_alive=False))
+    for _ in range(3):
+        data, response = app.call_api("DELETE", "/channels/1/messages/1")
+        assert data is None
+        assert response.status_code == 204
+
+    assert app.connection_stats["connections_opened"] == 3
+    app.close()
+
+
+def test_coalesced_gets(stub_server: StubServer) -> None:
+    release = threading.Event()
+
+    def handler(method: str, path: str, body: Any) -> Tuple[int, Dict[str, str], Any]:
+        release.wait(5)
+        return 200, {}, {"path": path}
+
+    stub_server.handler = handler
+    app = make_api_app(stub_server.url)
+    with ThreadPoolExecutor(8) as pool:
+        futures = [pool.submit(app.call_api, "GET", "/channels/1") for _ in range(8)]
+        deadline = time.monotonic() + 5
+        while app.coalescing_stats["coalesced"] < 7 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        release.set()
+        assert [future.result()[0] for future in futures] == [{"path": "/channels/1"}] * 8
+    assert len(stub_server.requests) == 1
+    assert app.coalescing_stats == {"executed": 1, "coalesced": 7, "in_flight": 0}
+
+    app.call_api("GET", "/channels/1")
+    app.call_api("GET", "/channels/1", headers={"X-Audit-Log-Reason": "test"})
+    assert len(stub_server.requests) == 3
+    assert app.coalescing_stats["executed"] == 2
+
+
+def test_request_body(stub_server: StubServer) -> None:
+    stub_server.handler = lambda method, path, body: (200, {}, {})
+    app = make_api_app(stub_server.url)
+    app.call_api("POST", "/channels/1/messages", json={
+        "content": "測試",
+        "sticker_ids": [discord_types.Snowflake(80351110224678912)],
+        "embeds": [channel.Embed(title="title", type=discord_types.EmbedType.RICH)]
+    })
+    app.call_api("PATCH", "/channels/1", data=channel.Channel(id=discord_types.Snowflake(1), type=discord_types.ChannelType.GUILD_TEXT))
+    assert [body for (_, _, body) in stub_server.requests] == [
+        {"content": "測試", "sticker_ids": ["80351110224678912"], "embeds": [{"title": "title", "type": "rich"}]},
+        {"id": "1"}
+    ]
+    app.close()
@@ -0,0 +1,55 @@
+import json
+from types import SimpleNamespace
+from typing import Any, Iterator
+
+import pytest
+
+from discord_app import application, discord_types, json_codec
+
+
+@pytest.fixture(params=json_codec.BACKENDS)
+def codec_backend(request: pytest.FixtureRequest) -> Iterator[str]:
+    previous = json_codec.backend
+    try:
+        json_codec.set_backend(request.param)
+    except ImportError:
+        pytest.skip(f"{request.param} is not installed")
+    yield request.param
+    json_codec.set_backend(previous)
+
+
+def test_same_output(codec_backend: str) -> None:
+    obj = {
+        "type": discord_types.InteractionResponseType.CHANNEL_MESSAGE_WITH_SOURCE,
+        "data": {
+            "content": "測試 https://example.com/",
+            "flags": discord_types.MessageFlags.EPHEMERAL,
+            "embeds": [{"type": discord_types.EmbedType.RICH, "color": 1.5}]
+        }
+    }
+    expected = '{"type":4,"data":{"content":"測試 https://example.com/","flags":64,"embeds":[{"type":"rich","color":1.5}]}}'
+    assert json_codec.dumps(obj) == expected
+    assert json_codec.loads(expected.encode("utf-8")) == json_codec.loads(expected)
+
+
+def test_malformed(codec_backend: str) -> None:
+    with pytest.raises(ValueError):
+        json_codec.loads(b'{"id": ')
+
+
+def test_application_info_decoded_with_codec(monkeypatch: pytest.MonkeyPatch) -> None:
+    info = {"id": "1", "name": "app", "description": "", "bot_public": False, "bot_require_code_grant": False, "verify_key": "00"}
+    decoded = []
+
+    def loads(data: bytes) -> Any:
+        decoded.append(data)
+        return json.loads(data)
+
+    monkeypatch.setattr(json_codec, "loads", loads)
+    monkeypatch.setattr(application.requests, "request", lambda *args, **kwargs: SimpleNamespace(
+        content=json.dumps(info).encode("utf-8"),
+        raise_for_status=lambda: None
+    ))
+    app = application.Application.from_basic_data(id=1, bot_token="token", endpoint=None)  # type: ignore[arg-type]
+    assert app.name == "app"
+    assert len(decoded) == 1
@@ -0,0 +1,80 @@
+from typing import Any, Dict
+
+import discord_app
+from discord_app import channel, guild, lazy
+
+
+def message_command_payload() -> Dict[str, Any]:
+    user = {"id": "2", "username": "user", "discriminator": "0001", "avatar": None}
+    message = {
+        "id": "3",
+        "channel_id": "4",
+        "timestamp": "2022-04-01T00:00:00.000000+00:00",
+        "tts": False,
+        "mention_everyone": False,
+        "mentions": [user],
+        "mention_roles": [],
+        "attachments": [],
+        "embeds": [{"title": "embed", "type": "rich"}],
+        "content": "hello",
+        "type": 0,
+        "author": user
+    }
+    return {
+        "id": "1",
+        "application_id": "1234567890",
+        "type": 2,
+        "token": "token",
+        "channel_id": "4",
+        "user": user,
+        "data": {
+            "id": "5",
+            "name": "Quote",
+            "type": 3,
+            "target_id": "3",
+            "resolved": {"messages": {"3": message}}
+        }
+    }
+
+
+def test_lazy_decoding() -> None:
+    request = discord_app.InteractionRequest(**message_command_payload())
+    assert not lazy.is_decoded(request, "data")
+    assert not lazy.is_decoded(request, "user")
+
+    assert request.data is not None
+    assert request.data.name == "Quote"
+    assert lazy.is_decoded(request, "data")
+    assert not lazy.is_decoded(request.data, "resolved")
+
+    assert request.data.resolved is not None
+    messages = request.data.resolved.messages
+    assert messages is not None
+    assert isinstance(messages[3], channel.Message)
+    assert messages[3] is request.data.resolved.messages[3]  # type: ignore[index]
+
+
+def test_eager_decoding() -> None:
+    request = discord_app.InteractionRequest(_lazy=False, **message_command_payload())
+    assert lazy.is_decoded(request, "data")
+    assert lazy.is_decoded(request.data, "resolved")
+    assert lazy.is_decoded(request.data.resolved, "messages")  # type: ignore[union-attr]
+    assert request == discord_app.InteractionRequest(**message_command_payload())
+
+
+def test_snowflake_fields() -> None:
+    payload = message_command_payload()["data"]["resolved"]["messages"]["3"]
+    message = discord_app.decoder.decode(channel.Message, payload)
+    # Slotted and __dict__ attributes keep the payload strings until they are read
+    assert type(channel.Message.__dict__["channel_id"].slot.__get__(message)) is str
+    assert message.channel_id == 4 and type(message.channel_id) is discord_app.discord_types.Snowflake
+    assert type(channel.Message.__dict__["channel_id"].slot.__get__(message)) is discord_app.discord_types.Snowflake
+    text_channel = discord_app.decoder.decode(channel.Channel, {"id": "4", "type": 0})
+    assert vars(text_channel)["id"] == "4"
+    assert text_channel.id == 4 and type(vars(text_channel)["id"]) is discord_app.discord_types.Snowflake
+    member = discord_app.decoder.decode(guild.GuildMember, {"joined_at": "2022-01-01", "roles": ["6", "7"]})
+    assert member.roles == [6, 7]
+    assert [type(x) for x in member.roles] == [discord_app.discord_types.Snowflake] * 2
+    # Values which aren't snowflakes are kept as they are
+    message.channel_id = "not a snowflake"  # type: ignore[assignment]
+    assert message.channel_id == "not a snowflake"
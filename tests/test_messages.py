@@ -0,0 +1,92 @@
+import datetime
+from typing import Any, Dict, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+import requests
+
+from discord_app import application, channel, decoder, discord_types
+from conftest import StubServer, make_api_app
+
+
+def text_channel(app: application.Application) -> channel.Channel:
+    app.verify_key = "00" * 32
+    return channel.Channel(id=discord_types.Snowflake(20), type=discord_types.ChannelType.GUILD_TEXT, _app=app)
+
+
+def message(message_id: int) -> Dict[str, Any]:
+    return {
+        "id": str(message_id), "channel_id": "20", "type": 0, "content": f"message {message_id}",
+        "timestamp": "2022-01-01T00:00:00+00:00", "tts": False, "mention_everyone": False,
+        "mentions": [], "mention_roles": [], "attachments": [], "embeds": []
+    }
+
+
+def test_history(stub_server: StubServer) -> None:
+    def handler(method: str, path: str, body: Any) -> Tuple[int, Dict[str, str], Any]:
+        query = parse_qs(urlsplit(path).query)
+        limit = int(query["limit"][0])
+        before = int(query.get("before", ["251"])[0])
+        # Messages 1 to 250, newest first
+        return 200, {}, [message(i) for i in range(before - 1, max(before - 1 - limit, 0), -1)]
+
+    stub_server.handler = handler
+    app = make_api_app(stub_server.url)
+    general = text_channel(app)
+    history = general.history()
+    assert stub_server.requests == []
+    assert [m.id for m in history] == list(range(250, 0, -1))
+    assert [path for (_, path, _) in stub_server.requests] == [
+        "/channels/20/messages?limit=100",
+        "/channels/20/messages?limit=100&before=151",
+        "/channels/20/messages?limit=100&before=51"
+    ]
+    assert [m.content for m in general.history(limit=3, before=discord_types.Snowflake(10))] == [
+        "message 9", "message 8", "message 7"
+    ]
+    app.close()
+
+
+def test_bulk_delete(stub_server: StubServer) -> None:
+    stub_server.handler = lambda method, path, body: (204, {}, None)
+    app = make_api_app(stub_server.url)
+    general = text_channel(app)
+    now = datetime.datetime.now(datetime.timezone.utc)
+    recent = [discord_types.Snowflake.from_datetime(now) + i for i in range(201)]
+    old = discord_types.Snowflake.from_datetime(now - datetime.timedelta(days=15))
+    assert general.bulk_delete(recent + [old, recent[0]]) == 202
+    assert [(method, path, len(body["messages"]) if body else None) for (method, path, body) in stub_server.requests] == [
+        ("POST", "/channels/20/messages/bulk-delete", 100),
+        ("POST", "/channels/20/messages/bulk-delete", 100),
+        ("DELETE", f"/channels/20/messages/{old}", None),
+        ("DELETE", f"/channels/20/messages/{recent[200]}", None)
+    ]
+    app.close()
+
+
+def test_bulk_delete_failure(stub_server: StubServer) -> None:
+    stub_server.handler = lambda method, path, body: (204, {}, None) if method == "POST" else (500, {}, {})
+    app = make_api_app(stub_server.url)
+    general = text_channel(app)
+    now = datetime.datetime.now(datetime.timezone.utc)
+    messages = [
+        decoder.decode(channel.Message, message(discord_types.Snowflake.from_datetime(now) + i), _app=app) for i in range(3)
+    ]
+    old = discord_types.Snowflake.from_datetime(now - datetime.timedelta(days=15))
+    for deleted in messages:
+        app._cache_entity(deleted)
+    with pytest.raises(requests.HTTPError):
+        general.bulk_delete(messages + [old])
+    assert not any(deleted._valid for deleted in messages)
+    assert app.entity_cache_stats["size"] == 0
+    app.close()
+
+
+def test_post_messages(stub_server: StubServer) -> None:
+    stub_server.handler = lambda method, path, body: (200, {}, {**message(1), "content": body["content"]})
+    app = make_api_app(stub_server.url)
+    general = text_channel(app)
+    messages = general.post_messages(["a" * 1000, "b" * 999, "c", "d" * 4500])
+    assert [len(m.content) for m in messages] == [2000, 1, 2000, 2000, 500]
+    assert messages[0].content == "a" * 1000 + "\n" + "b" * 999
+    app.close()
@@ -0,0 +1,66 @@
+import nacl.signing  # type: ignore
+
+import discord_app
+from discord_app import metrics
+from conftest import OfflineApplication
+from test_asgi import asgi_post, command_payload, register_commands
+
+
+STAGES = ["read", "verify", "parse", "decode", "dispatch", "handler", "encode"]
+
+
+def test_interaction_stages(offline_app: OfflineApplication) -> None:
+    sink = metrics.InMemorySink()
+    offline_app.app._metrics = sink
+    register_commands(offline_app.app)
+
+    assert offline_app.post(command_payload("1", "sync_cmd")).status_code == 200
+    assert [labels["stage"] for (labels, _) in sink.observations[metrics.STAGE_SECONDS]] == STAGES
+    assert asgi_post(offline_app, command_payload("2", "async_cmd"))["status"] == 200
+    assert [labels["stage"] for (labels, _) in sink.observations[metrics.STAGE_SECONDS]] == STAGES * 2
+    assert len(sink.values(metrics.INTERACTION_SECONDS)) == 2
+    assert sum(sink.values(metrics.STAGE_SECONDS)) <= sum(sink.values(metrics.INTERACTION_SECONDS))
+
+    # Stages are timed until the interaction is rejected.
+    offline_app.post(command_payload("1", "sync_cmd"))
+    assert [labels["stage"] for (labels, _) in sink.observations[metrics.STAGE_SECONDS][14:]] == ["read", "encode"]
+
+
+def test_prometheus_sink() -> None:
+    sink = metrics.PrometheusSink(buckets=[0.1, 1.0])
+    sink.observe(metrics.API_SECONDS, 0.05, method="GET", status="200")
+    sink.observe(metrics.API_SECONDS, 0.5, method="GET", status="200")
+    sink.observe(metrics.API_SECONDS, 2.0, status="429", method="GET")
+    assert sink.render().splitlines() == [
+        "# HELP discord_app_api_seconds Time spent on Discord API requests.",
+        "# TYPE discord_app_api_seconds histogram",
+        'discord_app_api_seconds_bucket{method="GET",status="200",le="0.1"} 1',
+        'discord_app_api_seconds_bucket{method="GET",status="200",le="1.0"} 2',
+        'discord_app_api_seconds_bucket{method="GET",status="200",le="+Inf"} 2',
+        'discord_app_api_seconds_sum{method="GET",status="200"} 0.55',
+        'discord_app_api_seconds_count{method="GET",status="200"} 2',
+        'discord_app_api_seconds_bucket{method="GET",status="429",le="0.1"} 0',
+        'discord_app_api_seconds_bucket{method="GET",status="429",le="1.0"} 0',
+        'discord_app_api_seconds_bucket{method="GET",status="429",le="+Inf"} 1',
+        'discord_app_api_seconds_sum{method="GET",status="429"} 2.0',
+        'discord_app_api_seconds_count{method="GET",status="429"} 1',
+    ]
+
+
+def test_metrics_endpoint() -> None:
+    app = discord_app.Application(
+        id="1234567890",
+        name="metrics_app",
+        description="",
+        bot_public=False,
+        bot_require_code_grant=False,
+        verify_key=nacl.signing.SigningKey.generate().verify_key.encode().hex(),
+        _bot_token="bot_token",
+        _metrics_endpoint="/metrics"
+    )
+    assert isinstance(app._metrics, metrics.PrometheusSink)
+    app._metrics.observe(metrics.INTERACTION_SECONDS, 0.001)
+    response = app._flask.test_client().get("/metrics")
+    assert response.status_code == 200
+    assert response.content_type == metrics.PROMETHEUS_CONTENT_TYPE
+    assert 'discord_app_interaction_seconds_bucket{le="0.001"} 1' in response.get_data(as_text=True)
@@ -0,0 +1,96 @@
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import time
+from typing import Any, Dict, List
+
+import pytest
+
+from discord_app import ratelimit
+from conftest import StubResponse, StubServer, make_api_app
+
+
+def test_route_key() -> None:
+    assert ratelimit.route_key("patch", "/channels/111/messages/222") == ("PATCH /channels/{channel_id}/messages/{id}", "111")
+    assert ratelimit.route_key("GET", "/guilds/333?with_counts=true") == ("GET /guilds/{guild_id}", "333")
+    assert ratelimit.route_key("POST", "/webhooks/444/token/messages/@original") == \
+        ("POST /webhooks/{webhook_id}/{token}/messages/@original", "444/token")
+    assert ratelimit.route_key("GET", "/applications/555/commands") == ("GET /applications/{id}/commands", "")
+
+
+class BucketEmulator():
+    """
+        Emulates Discord's per bucket limit: limit requests every window seconds.
+    """
+
+    def __init__(self, limit: int, window: float) -> None:
+        self.limit = limit
+        self.window = window
+        self.lock = threading.Lock()
+        self.windows: Dict[str, List[float]] = {}
+        self.too_many = 0
+
+    def __call__(self, method: str, path: str, body: Any) -> StubResponse:
+        major = path.split("/")[2]
+        with self.lock:
+            now = time.monotonic()
+            start, count = self.windows.get(major, [now, 0])
+            if now - start >= self.window:
+                start, count = now, 0
+            headers = {
+                "X-RateLimit-Limit": str(self.limit),
+                "X-RateLimit-Bucket": "bucket_hash",
+                "X-RateLimit-Reset-After": f"{start + self.window - now:.3f}"
+            }
+            if count >= self.limit:
+                self.too_many += 1
+                headers["X-RateLimit-Remaining"] = "0"
+                headers["Retry-After"] = headers["X-RateLimit-Reset-After"]
+                return 429, headers, {"message": "You are being rate limited.", "global": False}
+            self.windows[major] = [start, count + 1]
+            headers["X-RateLimit-Remaining"] = str(self.limit - count - 1)
+            return 200, headers, {"ok": True}
+
+
+def test_bucket_pacing(stub_server: StubServer) -> None:
+    emulator = BucketEmulator(limit=3, window=0.3)
+    stub_server.handler = emulator
+    app = make_api_app(stub_server.url)
+
+    start = time.monotonic()
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        results = list(executor.map(
+            lambda i: app.call_api("POST", f"/channels/{1000 + i % 2}/messages", json={"content": str(i)})[0],
+            range(12)
+        ))
+    elapsed = time.monotonic() - start
+
+    assert results == [{"ok": True}] * 12
+    assert emulator.too_many == 0
+    # 6 requests per channel, 3 per window: at least one full window was waited for.
+    assert elapsed >= 0.3
+    app.close()
+
+
+def test_global_rate_limit_retry(stub_server: StubServer) -> None:
+    calls = []
+
+    def handler(method: str, path: str, body: Any) -> StubResponse:
+        calls.append(time.monotonic())
+        if len(calls) == 1:
+            return 429, {"X-RateLimit-Global": "true", "Retry-After": "0.2"}, {"global": True}
+        return 200, {}, {"ok": True}
+
+    stub_server.handler = handler
+    app = make_api_app(stub_server.url)
+    data, _ = app.call_api("GET", "/users/@me")
+
+    assert data == {"ok": True}
+    assert len(calls) == 2
+    assert calls[1] - calls[0] >= 0.2
+    app.close()
+
+
+def test_send_without_response() -> None:
+    limiter = ratelimit.RateLimiter()
+    with pytest.raises(RuntimeError, match="GET /channels/1"):
+        limiter.send("GET", "/channels/1", lambda: None)  # type: ignore[arg-type, return-value]
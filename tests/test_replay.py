@@ -0,0 +1,48 @@
+import time
+
+from discord_app import replay
+from conftest import OfflineApplication
+
+
+PING = {"id": "1", "application_id": "1", "type": 1, "token": "t"}
+
+
+def test_timestamp_window() -> None:
+    assert replay.is_timestamp_fresh("1000", 5, now=1004)
+    assert replay.is_timestamp_fresh(b"1000", 5, now=996)
+    assert not replay.is_timestamp_fresh("1000", 5, now=1006)
+    assert not replay.is_timestamp_fresh("not a number", 5, now=1000)
+    assert not replay.is_timestamp_fresh(None, 5, now=1000)
+
+
+def test_seen_set() -> None:
+    seen = replay.SeenSet(max_size=3, ttl=10)
+    assert seen.add("a", now=0)
+    assert not seen.add("a", now=5)
+    assert seen.add("a", now=11)
+
+    for i, key in enumerate(["b", "c", "d", "e"]):
+        assert seen.add(key, now=12 + i)
+    assert len(seen) == 3
+    # "a" is evicted by the size limit
+    assert seen.add("a", now=16)
+
+
+def test_stale_request(offline_app: OfflineApplication) -> None:
+    response = offline_app.post(PING, timestamp=str(int(time.time()) - 3600))
+    assert response.status_code == 401
+
+
+def test_replayed_request(offline_app: OfflineApplication) -> None:
+    timestamp = str(int(time.time()))
+    assert offline_app.post(PING, timestamp=timestamp).status_code == 200
+    assert offline_app.post(PING, timestamp=timestamp).status_code == 409
+    # Same interaction with a different signature
+    assert offline_app.post(PING, timestamp=str(int(timestamp) - 1)).status_code == 409
+    assert offline_app.post(dict(PING, id="2")).status_code == 200
+
+
+def test_malformed_request_not_recorded(offline_app: OfflineApplication) -> None:
+    malformed = {key: value for (key, value) in PING.items() if key != "token"}
+    assert offline_app.post(malformed).status_code == 400
+    assert offline_app.post(PING).status_code == 200
@@ -0,0 +1,57 @@
+import dataclasses
+import json
+
+import discord_app
+from discord_app import channel, discord_types, serializer
+
+
+def embeds_response() -> discord_app.InteractionResponse:
+    return discord_app.InteractionResponse(
+        type=discord_types.InteractionResponseType.CHANNEL_MESSAGE_WITH_SOURCE,
+        data=discord_app.InteractionResponseMessage(
+            content="測試",
+            tts=False,
+            embeds=[
+                channel.Embed(
+                    title=f"Embed {i}",
+                    type=discord_types.EmbedType.RICH,
+                    color=0,
+                    footer=channel.EmbedFooter(text="footer"),
+                    video=channel.EmbedVideo(),
+                    fields=[channel.EmbedField(name="name", value="value", inline=bool(i % 2))]
+                )
+                for i in range(3)
+            ],
+            components=[channel.MessageComponentActionRow(type=discord_types.MessageComponentType.ACTION_ROW, components=[
+                channel.MessageComponentButton(
+                    type=discord_types.MessageComponentType.BUTTON,
+                    style=discord_types.MessageComponentButtonStyle.PRIMARY,
+                    label="Click",
+                    custom_id="click"
+                )
+            ])],
+            flags=discord_types.MessageFlags.EPHEMERAL
+        )
+    )
+
+
+def test_same_as_asdict() -> None:
+    response = embeds_response()
+    expected = dataclasses.asdict(response, dict_factory=discord_app.application._asdict_ignore_none)
+    assert serializer.to_dict(response) == expected
+    assert json.loads(serializer.dumps(response)) == json.loads(json.dumps(expected))
+    # Empty dataclasses, falsy values and underscore fields are left out.
+    assert "video" not in expected["data"]["embeds"][0]
+    assert "color" not in expected["data"]["embeds"][0]
+
+
+def test_dict_content_is_kept() -> None:
+    command = discord_app.ApplicationCommand(
+        name="cmd",
+        description="cmd",
+        name_localizations={"zh-TW": "", "ja": "コマンド"}
+    )
+    assert serializer.to_dict(command) == dataclasses.asdict(
+        command,
+        dict_factory=discord_app.application._asdict_ignore_none
+    )
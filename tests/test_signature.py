@@ -0,0 +1,47 @@
+import nacl.signing  # type: ignore
+
+from discord_app import signature
+from conftest import OfflineApplication
+
+
+def test_signature_verifier() -> None:
+    signing_key = nacl.signing.SigningKey.generate()
+    verifier = signature.SignatureVerifier(signing_key.verify_key.encode().hex())
+    body = b'{"type": 1}'
+    sig = signing_key.sign(b"1650000000" + body).signature.hex()
+
+    assert verifier.verify("1650000000", body, sig)
+    assert not verifier.verify("1650000001", body, sig)
+    assert not verifier.verify("1650000000", body + b" ", sig)
+    assert not verifier.verify("1650000000", body, "not a hex string")
+    assert not verifier.verify("1650000000", body, sig[:-2])
+    assert not verifier.verify(None, body, sig)
+    assert not verifier.verify("1650000000", body, None)
+
+
+def test_get_verifier_reuse() -> None:
+    key_a = nacl.signing.SigningKey.generate().verify_key.encode().hex()
+    key_b = nacl.signing.SigningKey.generate().verify_key.encode().hex()
+    verifier = signature.get_verifier(None, key_a)
+
+    assert signature.get_verifier(verifier, key_a) is verifier
+    assert signature.get_verifier(verifier, key_b).public_key == key_b
+
+
+def test_application_verifier_cache(offline_app: OfflineApplication) -> None:
+    response = offline_app.post({"id": "1", "application_id": "1", "type": 1, "token": "t"})
+    assert response.status_code == 200
+    assert response.json == {"type": 1}
+    verifier = offline_app.app._verifier
+
+    response = offline_app.post({"id": "2", "application_id": "1", "type": 1, "token": "t"})
+    assert response.status_code == 200
+    assert offline_app.app._verifier is verifier
+
+    response = offline_app.post({"id": "3", "application_id": "1", "type": 1, "token": "t"}, signature="00" * 64)
+    assert response.status_code == 401
+
+    offline_app.app.verify_key = nacl.signing.SigningKey.generate().verify_key.encode().hex()
+    response = offline_app.post({"id": "4", "application_id": "1", "type": 1, "token": "t"})
+    assert response.status_code == 401
+    assert offline_app.app._verifier is not verifier
@@ -22,7 +22,7 @@ def test_webhook() -> None:
     test = ch.create_webhook("Webhook test")
 
     assert test.name == "Webhook test"
-    assert test.get_channel().id == channel_id
+    assert str(test.get_channel().id) == channel_id
 
     test.delete()
 